@@ -0,0 +1,41 @@
+"""add organizations created_at id index
+
+Revision ID: b8f3f74a3fcb
+Revises: 9bfe208fcd9c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f3f74a3fcb"
+down_revision: str | Sequence[str] | None = "9bfe208fcd9c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_organizations_created_at_id",
+            "organizations",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_organizations_created_at_id",
+            table_name="organizations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,44 @@
+"""add organizations name trgm index
+
+Revision ID: ed42c63a4131
+Revises: b8f3f74a3fcb
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ed42c63a4131"
+down_revision: str | Sequence[str] | None = "b8f3f74a3fcb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_organizations_name_canonical_trgm",
+            "organizations",
+            ["name_canonical"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name_canonical": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_organizations_name_canonical_trgm",
+            table_name="organizations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,135 @@
+"""Benchmark the per-request overhead of the HTTP logging middleware.
+
+Drives ``GET /ping`` and a small ``StreamingResponse`` through three apps
+built the same way: without logging middleware (the baseline), with the
+previous ``@app.middleware("http")`` implementation that runs on Starlette's
+``BaseHTTPMiddleware``, and with the plain ASGI ``HTTPLoggingMiddleware``.
+Both middlewares do the same work: bind the request context, echo
+``X-Request-ID``, record latency and log ``http_request_finished`` (logging is
+set to WARNING so nothing is written). The overhead column is the difference
+from the baseline.
+
+Usage::
+
+    python benchmarks/bench_http_logging.py
+    python benchmarks/bench_http_logging.py --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from uuid import uuid4
+
+import structlog
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from pet.api.middleware.http_logging import (
+    get_duration_ms,
+    get_route_template,
+    logger,
+    register_http_logging,
+)
+from pet.config.logging import configure_logging
+from pet.infra.metrics import observe_http_request
+
+
+def _register_base_http_logging(app: FastAPI) -> None:
+    """The ``BaseHTTPMiddleware`` implementation the ASGI middleware replaced."""
+
+    @app.middleware("http")
+    async def logging_middleware(
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        structlog.contextvars.clear_contextvars()
+        request_id = request.headers.get("X-Request-ID") or uuid4().hex
+        request.state.request_id = request_id
+        started_at = time.perf_counter()
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id,
+            http_method=request.method,
+            http_path=request.url.path,
+        )
+        try:
+            response = await call_next(request)
+            duration_ms = get_duration_ms(started_at)
+            response.headers["X-Request-ID"] = request_id
+            observe_http_request(
+                request.method,
+                get_route_template(request.scope),
+                response.status_code,
+                duration_ms / 1000,
+            )
+            logger.info(
+                "http_request_finished",
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+            )
+            return response
+        finally:
+            structlog.contextvars.clear_contextvars()
+
+
+def _build_app(register: Callable[[FastAPI], None] | None) -> FastAPI:
+    app = FastAPI()
+    if register is not None:
+        register(app)
+
+    @app.get("/ping")
+    async def ping() -> Response:
+        return Response(b"pong")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(10):
+                yield b"x" * 64
+
+        return StreamingResponse(chunks())
+
+    return app
+
+
+async def _us_per_request(app: FastAPI, path: str, requests: int) -> float:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get(path)
+        started_at = time.perf_counter()
+        for _ in range(requests):
+            await client.get(path)
+        return (time.perf_counter() - started_at) / requests * 1e6
+
+
+async def _bench(requests: int) -> None:
+    apps = {
+        "none": _build_app(None),
+        "BaseHTTPMiddleware": _build_app(_register_base_http_logging),
+        "ASGI": _build_app(register_http_logging),
+    }
+
+    print(f"{requests} requests per case, microseconds per request")
+    print(f"{'path':<10}{'middleware':<22}{'us/req':>10}{'overhead':>10}")
+    for path in ("/ping", "/stream"):
+        baseline_us: float | None = None
+        for name, app in apps.items():
+            us = await _us_per_request(app, path, requests)
+            baseline_us = us if baseline_us is None else baseline_us
+            print(f"{path:<10}{name:<22}{us:>10.1f}{us - baseline_us:>10.1f}")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    configure_logging(level="WARNING", log_format="json")
+    asyncio.run(_bench(args.requests))
+
+
+if __name__ == "__main__":
+    main()
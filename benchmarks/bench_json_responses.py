@@ -0,0 +1,166 @@
+"""Benchmark JSON rendering on the create-organization success and error paths.
+
+The first section renders the same payloads with the stdlib-json
+``JSONResponse`` (plus ``jsonable_encoder`` for validation errors, as the
+problem handler used to) and with the orjson-backed ``ORJSONResponse`` and
+``problem()``. The second drives ``POST /orgs/`` end to end through the ASGI
+app, with the database replaced by an in-memory executor, for the 201, 409
+and 422 responses.
+
+Usage::
+
+    python benchmarks/bench_json_responses.py
+    python benchmarks/bench_json_responses.py --number 50000 --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import timeit
+from collections.abc import Callable, Sequence
+from typing import Any
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+from pydantic import ValidationError as PydanticValidationError
+from starlette.responses import JSONResponse
+
+from pet.api.exceptions_handler import PROBLEM_MEDIA_TYPE, problem, problem_payload
+from pet.api.organizations import CreateOrgDtoIn
+from pet.app.errors import AppErrorCode, OrganizationNameTakenError
+from pet.app.usecases.organizations import PublicId
+from pet.config.settings import DatabaseSettings, Settings
+from pet.di.db import get_executor
+from pet.main import create_app
+
+TAKEN_NAME = "Taken Inc"
+
+
+class InMemoryExecutor:
+    async def run(self, handler: Callable[..., Any], cmd: Any, **kwargs: Any) -> PublicId:
+        if cmd.name == TAKEN_NAME:
+            raise OrganizationNameTakenError()
+        return PublicId(uuid4())
+
+    async def run_grouped(self, handler: Callable[..., Any], cmd: Any, **kwargs: Any) -> PublicId:
+        return await self.run(handler, cmd, **kwargs)
+
+
+def _validation_errors() -> list[Any]:
+    try:
+        CreateOrgDtoIn.model_validate({"name": "ab"})
+    except PydanticValidationError as e:
+        return [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+    raise AssertionError("expected a validation error")
+
+
+def _conflict_payload() -> dict[str, Any]:
+    return {
+        "title": "Conflict",
+        "status": 409,
+        "detail": "Organization name is already taken",
+        "instance": "/orgs/",
+        "code": AppErrorCode.ORGANIZATION_NAME_TAKEN,
+        "request_id": uuid4().hex,
+    }
+
+
+def _render_cases() -> dict[str, tuple[Callable[[], object], Callable[[], object]]]:
+    success = {"public_id": str(uuid4())}
+    conflict = _conflict_payload()
+    errors = _validation_errors()
+    invalid = {
+        "title": "Validation Error",
+        "status": 422,
+        "detail": "Name is too short",
+        "instance": "/orgs/",
+        "code": AppErrorCode.VALIDATION,
+        "request_id": uuid4().hex,
+    }
+
+    return {
+        "201 PublicId": (
+            lambda: JSONResponse(success, status_code=201),
+            lambda: ORJSONResponse(success, status_code=201),
+        ),
+        "409 problem": (
+            lambda: JSONResponse(
+                problem_payload(**conflict), status_code=409, media_type=PROBLEM_MEDIA_TYPE
+            ),
+            lambda: problem(**conflict),
+        ),
+        "422 problem": (
+            lambda: JSONResponse(
+                problem_payload(
+                    **invalid,
+                    errors=jsonable_encoder(errors, custom_encoder={Exception: str}),
+                ),
+                status_code=422,
+                media_type=PROBLEM_MEDIA_TYPE,
+            ),
+            lambda: problem(**invalid, errors=errors),
+        ),
+    }
+
+
+def bench_rendering(number: int) -> None:
+    print(f"render only, {number} iterations, microseconds per response")
+    print(f"{'case':<14}{'stdlib json':>14}{'orjson':>10}{'speedup':>10}")
+    for name, (before, after) in _render_cases().items():
+        before_us = min(timeit.repeat(before, number=number, repeat=3)) / number * 1e6
+        after_us = min(timeit.repeat(after, number=number, repeat=3)) / number * 1e6
+        print(f"{name:<14}{before_us:>14.2f}{after_us:>10.2f}{before_us / after_us:>9.2f}x")
+
+
+async def bench_requests(requests: int) -> None:
+    settings = Settings(
+        log_level="WARNING",
+        db=DatabaseSettings(
+            driver="postgresql+asyncpg",
+            host="localhost",
+            name="bench",
+            user="bench",
+            port=5432,
+            password=SecretStr("bench"),
+        ),
+    )
+    app = create_app(settings)
+    app.dependency_overrides[get_executor] = InMemoryExecutor
+
+    cases = {
+        "201 PublicId": {"name": "Acme"},
+        "409 problem": {"name": TAKEN_NAME},
+        "422 problem": {"name": "ab"},
+    }
+
+    print(f"\nPOST /orgs/ through ASGI, {requests} requests per case")
+    print(f"{'case':<14}{'req/s':>10}{'us/req':>10}")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for name, body in cases.items():
+            warmup = await client.post("/orgs/", json=body)
+            # A broken stub would otherwise time 500 responses without saying so.
+            assert warmup.status_code == int(name[:3]), (name, warmup.status_code)
+            started_at = time.perf_counter()
+            for _ in range(requests):
+                await client.post("/orgs/", json=body)
+            elapsed = time.perf_counter() - started_at
+            print(f"{name:<14}{requests / elapsed:>10.0f}{elapsed / requests * 1e6:>10.1f}")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args(argv)
+
+    bench_rendering(args.number)
+    asyncio.run(bench_requests(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the cost of log calls under the stdlib and fast logging profiles.
+
+Each iteration mirrors a request through ``create_organization_cmd``: one
+``info`` call that is written and three ``debug`` calls that are filtered out
+at INFO, like the ones in ``SQLAlchemyUnitOfWork``, with a request context
+bound. Output goes to ``/dev/null`` so only formatting and dispatch are timed.
+
+Usage::
+
+    python benchmarks/bench_logging.py
+    python benchmarks/bench_logging.py --number 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from typing import get_args
+
+import structlog
+
+from pet.config.logging import LogProfile, configure_logging, get_logger
+
+
+def _calls(profile: LogProfile) -> dict[str, Callable[[], None]]:
+    configure_logging(level="INFO", log_format="json", profile=profile)
+    logger = get_logger(f"bench.{profile}")
+
+    def debug_only() -> None:
+        logger.debug("uow_entered", use_case_handler="create_organization_cmd")
+
+    def request() -> None:
+        logger.debug("uow_entered", use_case_handler="create_organization_cmd")
+        logger.debug("organization_created", name="Acme")
+        logger.debug("uow_committed", use_case_handler="create_organization_cmd")
+        logger.info(
+            "transaction_committed",
+            use_case_handler="create_organization_cmd",
+            duration_ms=1.23,
+            pool_wait_ms=0.0,
+            attempt=1,
+        )
+
+    return {"debug filtered": debug_only, "1 info + 3 debug": request}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, float]] = {}
+    stdout = sys.stdout
+    structlog.contextvars.bind_contextvars(request_id="0" * 32, http_method="POST")
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            for profile in get_args(LogProfile.__value__):
+                for case, call in _calls(profile).items():
+                    best = min(timeit.repeat(call, number=args.number, repeat=3))
+                    results.setdefault(case, {})[profile] = best / args.number * 1e6
+        finally:
+            sys.stdout = stdout
+            configure_logging()
+
+    print(f"{args.number} iterations at INFO, microseconds per iteration")
+    print(f"{'case':<18}{'stdlib':>10}{'fast':>10}{'speedup':>10}")
+    for case, by_profile in results.items():
+        stdlib_us, fast_us = by_profile["stdlib"], by_profile["fast"]
+        print(f"{case:<18}{stdlib_us:>10.2f}{fast_us:>10.2f}{stdlib_us / fast_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
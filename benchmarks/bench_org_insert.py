@@ -0,0 +1,134 @@
+"""Benchmark single-row organization inserts through the ORM and Core repositories.
+
+Each insert runs ``create_organization_cmd`` in its own unit of work, exactly
+like ``POST /orgs/``: the ORM repository stages the row with ``session.add``
+and inserts it on the commit flush, the Core repository runs one
+``INSERT ... RETURNING`` immediately. Inserts are issued by ``--concurrency``
+workers sharing one connection pool.
+
+Needs a migrated database, configured through the usual ``DB__*`` settings.
+Every organization it creates has a name starting with ``bench-`` and is
+deleted afterwards.
+
+Usage::
+
+    python benchmarks/bench_org_insert.py
+    python benchmarks/bench_org_insert.py --inserts 5000 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from collections.abc import Callable, Sequence
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pet.app.transaction_executor import TransactionExecutor
+from pet.app.usecases.organizations import CreateOrganizationCmdIn, create_organization_cmd
+from pet.config.settings import OrganizationsRepoKind, get_settings
+from pet.di.db import ORGANIZATIONS_REPO_FACTORIES, build_uow_factory
+from pet.infra.sqla.db.connection import create_engine, create_session_maker
+from pet.infra.sqla.db.models import Organization
+
+NAME_PREFIX = "bench-"
+
+
+async def _cleanup(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(Organization).where(Organization.name.startswith(NAME_PREFIX)))
+
+
+async def _run_inserts(
+    engine: AsyncEngine,
+    repository: OrganizationsRepoKind,
+    *,
+    inserts: int,
+    concurrency: int,
+    next_name: Callable[[], str],
+) -> list[float]:
+    executor = TransactionExecutor(
+        build_uow_factory(
+            create_session_maker(bind=engine),
+            orgs_repo_factory=ORGANIZATIONS_REPO_FACTORIES[repository],
+        )
+    )
+    latencies_ms: list[float] = []
+    remaining = iter(range(inserts))
+
+    async def worker() -> None:
+        for _ in remaining:
+            cmd = CreateOrganizationCmdIn(name=next_name())
+            started_at = time.perf_counter()
+            await executor.run(create_organization_cmd, cmd)
+            latencies_ms.append((time.perf_counter() - started_at) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies_ms
+
+
+def _report(repository: str, latencies_ms: list[float], duration_s: float) -> None:
+    ordered = sorted(latencies_ms)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{repository:>4}: {len(ordered) / duration_s:8.0f} inserts/s  "
+        f"p50 {statistics.median(ordered):6.2f} ms  p99 {p99:6.2f} ms"
+    )
+
+
+async def _bench(args: argparse.Namespace) -> None:
+    print(f"{args.inserts} single-row inserts per repository, {args.concurrency} writers")
+    settings = get_settings()
+    engine = create_engine(
+        url=settings.db_url,
+        pool_size=args.concurrency,
+        max_overflow=0,
+        pool_pre_ping=False,
+    )
+    counter = itertools.count()
+
+    def next_name() -> str:
+        return f"{NAME_PREFIX}{next(counter)}"
+
+    try:
+        await _cleanup(engine)
+        # Warm up the pool and the statement caches of both paths.
+        for repository in ORGANIZATIONS_REPO_FACTORIES:
+            await _run_inserts(
+                engine,
+                repository,
+                inserts=args.concurrency * 10,
+                concurrency=args.concurrency,
+                next_name=next_name,
+            )
+
+        for repository in ORGANIZATIONS_REPO_FACTORIES:
+            started_at = time.perf_counter()
+            latencies_ms = await _run_inserts(
+                engine,
+                repository,
+                inserts=args.inserts,
+                concurrency=args.concurrency,
+                next_name=next_name,
+            )
+            _report(repository, latencies_ms, time.perf_counter() - started_at)
+    finally:
+        await _cleanup(engine)
+        await engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inserts", type=int, default=2_000, help="Inserts per repository.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent writers.")
+    args = parser.parse_args(argv)
+
+    asyncio.run(_bench(args))
+
+
+if __name__ == "__main__":
+    main()
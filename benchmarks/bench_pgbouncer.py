@@ -0,0 +1,123 @@
+"""Benchmark short transactions directly against Postgres and through PgBouncer.
+
+Every transaction runs one parametrized ``SELECT`` over ``organizations``, the
+way a read use case does, issued by ``--concurrency`` workers. Three engines
+are compared:
+
+* ``direct``: the default engine against Postgres, with asyncpg's statement
+  caches and a local queue pool;
+* ``pgbouncer``: ``ENGINE__MODE=pgbouncer_transaction`` with a local queue
+  pool, against PgBouncer in ``pool_mode=transaction``;
+* ``pgbouncer-null``: the same with ``ENGINE__NULL_POOL=True``, so every
+  transaction opens a client connection to PgBouncer.
+
+The difference between the first two is mostly the lost statement cache (each
+statement is prepared again); the third adds the cost of connecting.
+
+Postgres is configured through the usual ``DB__*`` settings, PgBouncer must
+point at the same database and accept the same credentials.
+
+Usage::
+
+    python benchmarks/bench_pgbouncer.py --pgbouncer-port 6432
+    python benchmarks/bench_pgbouncer.py --pgbouncer-host pgbouncer --transactions 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Sequence
+
+from sqlalchemy import URL, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pet.config.settings import get_settings
+from pet.infra.sqla.db.connection import create_engine
+from pet.infra.sqla.db.models import Organization
+
+
+async def _run_transactions(
+    engine: AsyncEngine,
+    *,
+    transactions: int,
+    concurrency: int,
+) -> list[float]:
+    latencies_ms: list[float] = []
+    remaining = iter(range(transactions))
+    stmt = select(Organization.id).where(Organization.id == bindparam("id"))
+
+    async def worker() -> None:
+        for i in remaining:
+            started_at = time.perf_counter()
+            async with engine.begin() as conn:
+                await conn.execute(stmt, {"id": i})
+            latencies_ms.append((time.perf_counter() - started_at) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies_ms
+
+
+def _report(name: str, latencies_ms: list[float], duration_s: float) -> None:
+    ordered = sorted(latencies_ms)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{name:>14}: {len(ordered) / duration_s:8.0f} tx/s  "
+        f"p50 {statistics.median(ordered):6.2f} ms  p99 {p99:6.2f} ms"
+    )
+
+
+def _engines(args: argparse.Namespace) -> dict[str, AsyncEngine]:
+    settings = get_settings()
+    pgbouncer_url: URL = settings.db_url.set(host=args.pgbouncer_host, port=args.pgbouncer_port)
+    pool = {"pool_size": args.concurrency, "max_overflow": 0, "pool_pre_ping": False}
+    return {
+        "direct": create_engine(url=settings.db_url, **pool),
+        "pgbouncer": create_engine(url=pgbouncer_url, pgbouncer_transaction_mode=True, **pool),
+        "pgbouncer-null": create_engine(
+            url=pgbouncer_url,
+            pgbouncer_transaction_mode=True,
+            null_pool=True,
+            **pool,
+        ),
+    }
+
+
+async def _bench(args: argparse.Namespace) -> None:
+    print(f"{args.transactions} transactions per engine, {args.concurrency} workers")
+    engines = _engines(args)
+    try:
+        for name, engine in engines.items():
+            # Warm up the pool and, for the direct engine, the statement cache.
+            await _run_transactions(
+                engine,
+                transactions=args.concurrency * 10,
+                concurrency=args.concurrency,
+            )
+            started_at = time.perf_counter()
+            latencies_ms = await _run_transactions(
+                engine,
+                transactions=args.transactions,
+                concurrency=args.concurrency,
+            )
+            _report(name, latencies_ms, time.perf_counter() - started_at)
+    finally:
+        for engine in engines.values():
+            await engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=5_000, help="Transactions per engine.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent workers.")
+    parser.add_argument("--pgbouncer-host", default="localhost")
+    parser.add_argument("--pgbouncer-port", type=int, default=6432)
+    args = parser.parse_args(argv)
+
+    asyncio.run(_bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+import time
+
+# The first module of the package to run; startup timing counts imports from here.
+IMPORT_STARTED_AT = time.perf_counter()
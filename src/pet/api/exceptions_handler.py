@@ -1,11 +1,16 @@
+import json
+from collections.abc import Mapping
 from typing import Any, assert_never, cast
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.status import (
+    HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
     HTTP_422_UNPROCESSABLE_CONTENT,
     HTTP_500_INTERNAL_SERVER_ERROR,
@@ -20,8 +25,14 @@ PROBLEM_MEDIA_TYPE = "application/problem+json"
 
 def get_http_status_for_error(code: AppErrorCode) -> int:
     match code:
-        case AppErrorCode.CONFLICT | AppErrorCode.ORGANIZATION_NAME_TAKEN:
+        case (
+            AppErrorCode.CONFLICT
+            | AppErrorCode.ORGANIZATION_NAME_TAKEN
+            | AppErrorCode.IDEMPOTENCY_KEY_IN_USE
+        ):
             return HTTP_409_CONFLICT
+        case AppErrorCode.ORGANIZATION_NOT_FOUND:
+            return HTTP_404_NOT_FOUND
         case AppErrorCode.VALIDATION:
             return HTTP_422_UNPROCESSABLE_CONTENT
         case AppErrorCode.SERVICE_UNAVAILABLE:
@@ -39,17 +50,43 @@ def _request_id(r: Request) -> str | None:
     return getattr(r.state, "request_id", None) or r.headers.get("x-request-id")
 
 
-def _jsonable_validation_errors(validation_error: RequestValidationError) -> list[dict[str, Any]]:
-    return cast(
-        list[dict[str, Any]],
-        jsonable_encoder(
-            validation_error.errors(),
-            custom_encoder={Exception: str},
-        ),
-    )
+def _json_default(value: Any) -> Any:
+    # orjson handles dicts, lists, tuples, str/int/float, datetime, UUID, enums and
+    # dataclasses natively. This covers what request validation errors may
+    # additionally carry, most notably the exception in ``ctx["error"]``.
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, set | frozenset):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    return str(value)
 
 
-def problem(
+def _render_with_json(content: Mapping[str, Any]) -> bytes:
+    encoded = jsonable_encoder(content, custom_encoder={Exception: str, bytes: _json_default})
+    return json.dumps(
+        encoded, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode()
+
+
+class ProblemResponse(Response):
+    """``application/problem+json`` response serialized straight to bytes by orjson.
+
+    Payloads orjson cannot serialize, such as a rejected ``input`` holding an
+    integer wider than 64 bits, fall back to ``jsonable_encoder`` and stdlib json.
+    """
+
+    media_type = PROBLEM_MEDIA_TYPE
+
+    def render(self, content: Mapping[str, Any]) -> bytes:
+        try:
+            return orjson.dumps(content, default=_json_default)
+        except orjson.JSONEncodeError:
+            return _render_with_json(content)
+
+
+def problem_payload(
     *,
     title: str,
     status: int,
@@ -59,8 +96,7 @@ def problem(
     code: str | None = None,
     errors: Any | None = None,
     request_id: str | None = None,
-    headers: dict[str, str] | None = None,
-) -> JSONResponse:
+) -> dict[str, Any]:
     payload: dict[str, Any] = {"type": type_, "title": title, "status": status}
     if detail is not None:
         payload["detail"] = detail
@@ -73,18 +109,39 @@ def problem(
     if request_id is not None:
         payload["request_id"] = request_id
 
-    return JSONResponse(
-        payload,
-        status_code=status,
-        media_type=PROBLEM_MEDIA_TYPE,
-        headers=headers,
+    return payload
+
+
+def problem(
+    *,
+    title: str,
+    status: int,
+    type_: str = "about:blank",
+    detail: str | None = None,
+    instance: str | None = None,
+    code: str | None = None,
+    errors: Any | None = None,
+    request_id: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    payload = problem_payload(
+        title=title,
+        status=status,
+        type_=type_,
+        detail=detail,
+        instance=instance,
+        code=code,
+        errors=errors,
+        request_id=request_id,
     )
 
+    return ProblemResponse(payload, status_code=status, headers=headers)
+
 
 def register_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(AppError)
-    async def app_error_handler(r: Request, exc: Exception) -> JSONResponse:
+    async def app_error_handler(r: Request, exc: Exception) -> Response:
         app_error = cast(AppError, exc)
 
         status_code = get_http_status_for_error(app_error.code)
@@ -95,6 +152,8 @@ def register_exception_handlers(app: FastAPI) -> None:
             status_code=status_code,
         )
 
+        retry_after_s = (app_error.extra or {}).get("retry_after_s")
+
         return problem(
             title=app_error.title,
             status=status_code,
@@ -102,10 +161,11 @@ def register_exception_handlers(app: FastAPI) -> None:
             instance=(r.url.path),
             code=app_error.code,
             request_id=_request_id(r),
+            headers=None if retry_after_s is None else {"Retry-After": str(retry_after_s)},
         )
 
     @app.exception_handler(StarletteHTTPException)
-    async def http_error_handler(r: Request, exc: Exception) -> JSONResponse:
+    async def http_error_handler(r: Request, exc: Exception) -> Response:
         http_error = cast(StarletteHTTPException, exc)
         if r.url.path not in ["/readyz", "/healthz"]:
             log = (
@@ -129,9 +189,9 @@ def register_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(RequestValidationError)
-    async def validation_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def validation_error_handler(request: Request, exc: Exception) -> Response:
         validation_error = cast(RequestValidationError, exc)
-        errors = _jsonable_validation_errors(validation_error)
+        errors = validation_error.errors()
         detail = "Request validation failed"
 
         if len(errors) == 1:
@@ -157,7 +217,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(Exception)
-    async def unhandled_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def unhandled_error_handler(request: Request, exc: Exception) -> Response:
         logger.exception(
             "unhandled_exception",
         )
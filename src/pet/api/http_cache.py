@@ -0,0 +1,27 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import Final
+
+_EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND: Final = timedelta(microseconds=1)
+
+
+def make_etag(updated_at: datetime) -> str:
+    return f'"{(updated_at - _EPOCH) // _MICROSECOND:x}"'
+
+
+def format_http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(UTC), usegmt=True)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison as required for ``If-None-Match`` (RFC 9110, 13.1.2)."""
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
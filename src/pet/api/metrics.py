@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from pet.infra.metrics import METRICS_CONTENT_TYPE, render_latest
+
+metrics = APIRouter()
+
+
+# Sync on purpose: in multiprocess mode rendering reads every worker's files,
+# so it runs in the threadpool instead of blocking the event loop.
+@metrics.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    return Response(render_latest(), media_type=METRICS_CONTENT_TYPE)
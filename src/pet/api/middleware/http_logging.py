@@ -1,59 +1,105 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Mapping
+from typing import Any
 from uuid import uuid4
 
 import structlog
-from fastapi import FastAPI, Request
-from starlette.responses import Response
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from pet.config.logging import get_logger
+from pet.infra.metrics import UNMATCHED_ROUTE, observe_http_request
 
 logger = get_logger(__name__)
-SKIP_LOG_PATHS = frozenset({"/healthz", "/readyz"})
+SKIP_LOG_PATHS = frozenset({"/healthz", "/readyz", "/metrics"})
+REQUEST_ID_HEADER = "X-Request-ID"
 
 
 def get_duration_ms(started_at: float) -> float:
     return round((time.perf_counter() - started_at) * 1000, 2)
 
 
-def register_http_logging(app: FastAPI) -> None:
-    @app.middleware("http")
-    async def logging_middleware(
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+def get_route_template(scope: Mapping[str, Any]) -> str:
+    """Path template of the matched route, e.g. ``/orgs/{public_id}``, to bound label cardinality."""
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+class HTTPLoggingMiddleware:
+    """Binds the request context, echoes ``X-Request-ID`` and logs every finished request.
+
+    A plain ASGI middleware rather than ``BaseHTTPMiddleware``: the endpoint runs
+    in the caller's task, so the contextvars bound here reach it directly, and
+    response bodies stream straight through. ``http_request_finished`` is logged
+    once the whole response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         structlog.contextvars.clear_contextvars()
 
-        request_id = request.headers.get("X-Request-ID") or uuid4().hex
-        request.state.request_id = request_id
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method: str = scope["method"]
+        path: str = scope["path"]
+        skip_log = path in SKIP_LOG_PATHS
+        status_code = 500
 
         started_at = time.perf_counter()
 
         structlog.contextvars.bind_contextvars(
             request_id=request_id,
-            http_method=request.method,
-            http_path=request.url.path,
+            http_method=method,
+            http_path=path,
         )
 
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         except Exception:
+            if not skip_log:
+                observe_http_request(
+                    method,
+                    get_route_template(scope),
+                    500,
+                    time.perf_counter() - started_at,
+                )
             raise
         else:
-            duration_ms = get_duration_ms(started_at)
-            response.headers["X-Request-ID"] = request_id
+            if skip_log:
+                return
 
-            if request.url.path in SKIP_LOG_PATHS:
-                return response
+            duration_ms = get_duration_ms(started_at)
+            observe_http_request(
+                method,
+                get_route_template(scope),
+                status_code,
+                duration_ms / 1000,
+            )
 
             logger.info(
                 "http_request_finished",
-                status_code=response.status_code,
+                status_code=status_code,
                 duration_ms=duration_ms,
             )
-
-            return response
         finally:
             structlog.contextvars.clear_contextvars()
+
+
+def register_http_logging(app: FastAPI) -> None:
+    app.add_middleware(HTTPLoggingMiddleware)
@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Final
+
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE: Final = "application/x-ndjson"
+NDJSON_CHUNK_SIZE: Final = 64 * 1024
+
+
+async def ndjson_chunks(
+    models: AsyncIterable[BaseModel],
+    chunk_size: int = NDJSON_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Serialize models as NDJSON lines, coalesced into chunks of about ``chunk_size`` bytes.
+
+    Sending one chunk per row would cost a write (and an ASGI message) per row.
+    """
+    buffer = bytearray()
+    async for model in models:
+        buffer += model.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def prepend(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    if first:
+        yield first
+    async for chunk in rest:
+        yield chunk
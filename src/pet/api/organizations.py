@@ -1,17 +1,120 @@
-from typing import Annotated
+from datetime import datetime, timedelta
+from typing import Annotated, Final
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
-from pydantic import BaseModel, Field, StrictStr, field_validator
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import AfterValidator, BaseModel, Field, StrictStr, field_validator
 
-from pet.app.usecases.organizations import CreateOrganizationCmdIn, create_organization_cmd
+from pet.api.exceptions_handler import get_http_status_for_error, problem_payload
+from pet.api.http_cache import etag_matches, format_http_date, make_etag
+from pet.api.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks, prepend
+from pet.app.error_mappers import translate_domain_validation_error
+from pet.app.errors import AppError, OrganizationNotFoundError
+from pet.app.usecases.organizations import (
+    CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+    BulkItemResult,
+    CheckOrganizationNameQueryIn,
+    CreateOrganizationCmdIn,
+    CreateOrganizationsBulkCmdIn,
+    ExportOrganizationsQueryIn,
+    GetOrganizationQueryIn,
+    ListOrganizationsQueryIn,
+    OrganizationView,
+    SearchOrganizationsQueryIn,
+    check_organization_name_query,
+    create_organization_cmd,
+    create_organization_request_hash,
+    create_organizations_bulk_cmd,
+    export_organizations_query,
+    get_organization_query,
+    list_organizations_query,
+    search_organizations_query,
+)
+from pet.config.settings import Settings
+from pet.di.cache import (
+    IdempotencyCache,
+    NameAvailabilityCache,
+    OrganizationResponseCache,
+    get_idempotency_cache,
+    get_name_availability_cache,
+    get_organization_response_cache,
+)
 from pet.di.db import get_executor
+from pet.di.settings import get_app_settings
+from pet.domain.exc import IdempotencyKeyReusedError
+from pet.domain.models import IDEMPOTENCY_KEY_MAX_LEN, IdempotencyRecord
 from pet.domain.uow import TransactionExecutorProtocol
-from pet.domain.value_objects import ORG_NAME_DESCRIPTION, validate_org_name
+from pet.domain.value_objects import (
+    ORG_NAME_DESCRIPTION,
+    ORG_NAME_MAX_LEN,
+    ORG_NAME_MIN_LEN,
+    canonicalize_org_name,
+    normalize_org_name,
+    validate_org_name,
+)
+from pet.domain.value_objects import PublicId as PublicIdVO
+from pet.infra.cache import CachedResponse
+
+ORG_BULK_MAX_ITEMS: Final = 1000
+ORG_LIST_DEFAULT_LIMIT: Final = 50
+ORG_LIST_MAX_LIMIT: Final = 200
+ORG_LIST_CURSOR_MAX_LEN: Final = 128
+ORG_SEARCH_DEFAULT_LIMIT: Final = 10
+ORG_EXPORT_BATCH_SIZE: Final = 1000
+ORG_SEARCH_MAX_LIMIT: Final = 50
 
 organizations = APIRouter(prefix="/orgs")
 
 Executor = Annotated[TransactionExecutorProtocol, Depends(get_executor)]
+AppSettings = Annotated[Settings, Depends(get_app_settings)]
+IdempotencyCacheDep = Annotated[IdempotencyCache, Depends(get_idempotency_cache)]
+NameAvailabilityCacheDep = Annotated[NameAvailabilityCache, Depends(get_name_availability_cache)]
+OrganizationResponseCacheDep = Annotated[
+    OrganizationResponseCache, Depends(get_organization_response_cache)
+]
+OrgNameQuery = Annotated[
+    StrictStr,
+    Query(description=ORG_NAME_DESCRIPTION),
+    AfterValidator(validate_org_name),
+]
+ListLimitQuery = Annotated[
+    int,
+    Query(ge=1, le=ORG_LIST_MAX_LIMIT, description="Maximum number of organizations to return."),
+]
+ListCursorQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=ORG_LIST_CURSOR_MAX_LEN,
+        description="Opaque `next_cursor` from the previous page.",
+    ),
+]
+SearchTermQuery = Annotated[
+    StrictStr,
+    Query(
+        min_length=ORG_NAME_MIN_LEN,
+        max_length=ORG_NAME_MAX_LEN,
+        description=(
+            "Name prefix or fuzzy fragment. It is canonicalized like organization names "
+            f"and must keep at least {ORG_NAME_MIN_LEN} characters after trimming."
+        ),
+    ),
+]
+SearchLimitQuery = Annotated[
+    int,
+    Query(ge=1, le=ORG_SEARCH_MAX_LIMIT, description="Maximum number of matches to return."),
+]
+IfNoneMatchHeader = Annotated[str | None, Header(alias="If-None-Match")]
+IdempotencyKeyHeader = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=IDEMPOTENCY_KEY_MAX_LEN,
+        description="Retries with the same key replay the first successful response.",
+    ),
+]
 
 
 class CreateOrgDtoIn(BaseModel):
@@ -26,10 +129,95 @@ class CreateOrgDtoIn(BaseModel):
         return validate_org_name(value)
 
 
+class CreateOrgsBulkDtoIn(BaseModel):
+    names: list[StrictStr] = Field(
+        min_length=1,
+        max_length=ORG_BULK_MAX_ITEMS,
+        description=(
+            f"Up to {ORG_BULK_MAX_ITEMS} organization names. Every name is validated "
+            "independently, see `CreateOrgDtoIn.name` for the contract."
+        ),
+    )
+
+
 class PublicId(BaseModel):
     public_id: UUID
 
 
+class OrganizationOut(BaseModel):
+    public_id: UUID
+    name: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class OrganizationsPageOut(BaseModel):
+    items: list[OrganizationOut]
+    next_cursor: str | None = None
+
+
+class OrganizationMatchOut(BaseModel):
+    public_id: UUID
+    name: str
+
+
+class OrganizationSearchOut(BaseModel):
+    items: list[OrganizationMatchOut]
+
+
+class NameAvailabilityOut(BaseModel):
+    name: str
+    available: bool
+
+
+class ItemProblem(BaseModel):
+    type: str
+    title: str
+    status: int
+    detail: str | None = None
+    code: str | None = None
+
+
+class BulkItemOut(BaseModel):
+    index: int
+    public_id: UUID | None = None
+    problem: ItemProblem | None = None
+
+
+class BulkCreateOut(BaseModel):
+    created: int
+    failed: int
+    items: list[BulkItemOut]
+
+
+def _organization_out(org: OrganizationView) -> OrganizationOut:
+    return OrganizationOut(
+        public_id=org.public_id,
+        name=org.name,
+        created_at=org.created_at,
+        updated_at=org.updated_at,
+    )
+
+
+def _item_problem(error: AppError) -> ItemProblem:
+    return ItemProblem.model_validate(
+        problem_payload(
+            title=error.title,
+            status=get_http_status_for_error(error.code),
+            detail=error.detail,
+            code=error.code,
+        )
+    )
+
+
+def _bulk_item_out(result: BulkItemResult) -> BulkItemOut:
+    if result.error is not None:
+        return BulkItemOut(index=result.index, problem=_item_problem(result.error))
+    if result.public_id is not None:
+        return BulkItemOut(index=result.index, public_id=result.public_id.val)
+    raise ValueError(f"Bulk item {result.index} has neither a public_id nor an error")
+
+
 @organizations.post(
     "/",
     status_code=status.HTTP_201_CREATED,
@@ -38,7 +226,182 @@ class PublicId(BaseModel):
 async def create_organization(
     org: CreateOrgDtoIn,
     executor: Executor,
+    settings: AppSettings,
+    idempotency_cache: IdempotencyCacheDep,
+    availability_cache: NameAvailabilityCacheDep,
+    idempotency_key: IdempotencyKeyHeader = None,
 ) -> PublicId:
-    cmd = CreateOrganizationCmdIn(name=org.name)
-    public_id = await executor.run(create_organization_cmd, cmd)
+    cmd = CreateOrganizationCmdIn(name=org.name, idempotency_key=idempotency_key)
+    if idempotency_key is None:
+        public_id = await executor.run_grouped(create_organization_cmd, cmd)
+        availability_cache.invalidate(canonicalize_org_name(org.name))
+        return PublicId(public_id=public_id.val)
+
+    cache_key = (CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE, idempotency_key)
+    request_hash = create_organization_request_hash(cmd)
+
+    cached = idempotency_cache.get(cache_key)
+    if cached is not None:
+        if cached.request_hash != request_hash:
+            raise translate_domain_validation_error(IdempotencyKeyReusedError())
+        return PublicId(public_id=cached.public_id.value)
+
+    public_id = await executor.run_grouped(
+        create_organization_cmd,
+        cmd,
+        idempotency_ttl=timedelta(seconds=settings.idempotency.ttl_seconds),
+    )
+    availability_cache.invalidate(canonicalize_org_name(org.name))
+    idempotency_cache.set(
+        cache_key,
+        IdempotencyRecord(
+            scope=CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+            key=idempotency_key,
+            request_hash=request_hash,
+            public_id=PublicIdVO.create(public_id.val),
+        ),
+    )
     return PublicId(public_id=public_id.val)
+
+
+@organizations.get(
+    "/",
+    response_model=OrganizationsPageOut,
+)
+async def list_organizations(
+    executor: Executor,
+    limit: ListLimitQuery = ORG_LIST_DEFAULT_LIMIT,
+    cursor: ListCursorQuery = None,
+) -> OrganizationsPageOut:
+    query = ListOrganizationsQueryIn(limit=limit, cursor=cursor)
+    page = await executor.run(list_organizations_query, query)
+
+    return OrganizationsPageOut(
+        items=[_organization_out(org) for org in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+@organizations.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkCreateOut,
+)
+async def create_organizations_bulk(
+    orgs: CreateOrgsBulkDtoIn,
+    executor: Executor,
+    availability_cache: NameAvailabilityCacheDep,
+) -> BulkCreateOut:
+    cmd = CreateOrganizationsBulkCmdIn(names=orgs.names)
+    results = await executor.run(create_organizations_bulk_cmd, cmd)
+    for result in results:
+        if result.public_id is not None:
+            name = normalize_org_name(orgs.names[result.index])
+            availability_cache.invalidate(canonicalize_org_name(name))
+    items = [_bulk_item_out(result) for result in results]
+    failed = sum(1 for item in items if item.problem is not None)
+
+    return BulkCreateOut(created=len(items) - failed, failed=failed, items=items)
+
+
+@organizations.get(
+    "/availability",
+    response_model=NameAvailabilityOut,
+)
+async def check_organization_name(
+    name: OrgNameQuery,
+    executor: Executor,
+    availability_cache: NameAvailabilityCacheDep,
+) -> NameAvailabilityOut:
+    name_canonical = canonicalize_org_name(name)
+
+    available = availability_cache.get(name_canonical)
+    if available is None:
+        # A create committing while the query runs invalidates the name before
+        # this answer, possibly read earlier, would be cached; it is dropped then.
+        generation = availability_cache.generation
+        query = CheckOrganizationNameQueryIn(name=name)
+        result = await executor.run(check_organization_name_query, query)
+        available = result.available
+        availability_cache.set(name_canonical, available, generation=generation)
+
+    return NameAvailabilityOut(name=name, available=available)
+
+
+@organizations.get(
+    "/search",
+    response_model=OrganizationSearchOut,
+)
+async def search_organizations(
+    q: SearchTermQuery,
+    executor: Executor,
+    limit: SearchLimitQuery = ORG_SEARCH_DEFAULT_LIMIT,
+) -> OrganizationSearchOut:
+    query = SearchOrganizationsQueryIn(q=q, limit=limit)
+    matches = await executor.run(search_organizations_query, query)
+
+    return OrganizationSearchOut(
+        items=[
+            OrganizationMatchOut(public_id=match.public_id, name=match.name) for match in matches
+        ]
+    )
+
+
+@organizations.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": "Every organization as one `OrganizationOut` JSON object per line.",
+        }
+    },
+)
+async def export_organizations(executor: Executor) -> StreamingResponse:
+    query = ExportOrganizationsQueryIn(batch_size=ORG_EXPORT_BATCH_SIZE)
+    orgs = executor.stream(export_organizations_query, query)
+    chunks = ndjson_chunks(_organization_out(org) async for org in orgs)
+
+    # Pull the first chunk eagerly so that failing to start the export is
+    # still rendered as a problem response instead of a truncated 200.
+    first = await anext(chunks, b"")
+
+    return StreamingResponse(prepend(first, chunks), media_type=NDJSON_MEDIA_TYPE)
+
+
+@organizations.get(
+    "/{public_id}",
+    response_model=OrganizationOut,
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The `If-None-Match` ETag still matches."},
+        status.HTTP_404_NOT_FOUND: {"description": "No organization has this public id."},
+    },
+)
+async def get_organization(
+    public_id: UUID,
+    executor: Executor,
+    response_cache: OrganizationResponseCacheDep,
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
+    cached = response_cache.get(public_id)
+    if cached is None:
+        query = GetOrganizationQueryIn(public_id=public_id)
+        org = await executor.run(get_organization_query, query)
+        if org is None:
+            raise OrganizationNotFoundError()
+
+        cached = CachedResponse(
+            body=_organization_out(org).model_dump_json().encode(),
+            etag=make_etag(org.updated_at),
+            last_modified=format_http_date(org.updated_at),
+        )
+        response_cache.set(public_id, cached)
+
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cached.validator_headers)
+
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=cached.validator_headers,
+    )
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from pet.app.errors import ServiceOverloadedError
+from pet.config.logging import get_logger
+from pet.infra.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_WAIT,
+    count_admission_rejected,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class AdmissionStats:
+    in_flight: int
+    queue_depth: int
+    admitted_total: int
+    rejected_total: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class AdmissionController:
+    """Caps concurrent units of work so they never queue inside the connection pool.
+
+    At most ``max_concurrency`` holders are admitted at a time. Further callers
+    wait in a queue of at most ``max_queue`` for up to ``max_wait_s``; when the
+    queue is full or the wait runs out they are rejected right away with
+    ``ServiceOverloadedError`` instead of waiting for a pool checkout timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        max_queue: int,
+        max_wait_s: float,
+        retry_after_s: int = 1,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._max_wait_s = max_wait_s
+        self._retry_after_s = retry_after_s
+
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._admitted_total = 0
+        self._rejected_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            in_flight=self._in_flight,
+            queue_depth=self._queue_depth,
+            admitted_total=self._admitted_total,
+            rejected_total=self._rejected_total,
+            wait_seconds_total=self._wait_seconds_total,
+            wait_seconds_max=self._wait_seconds_max,
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        wait_s = await self._acquire()
+        self._admitted_total += 1
+        self._wait_seconds_total += wait_s
+        self._wait_seconds_max = max(self._wait_seconds_max, wait_s)
+        ADMISSION_WAIT.observe(wait_s)
+
+        self._in_flight += 1
+        ADMISSION_IN_FLIGHT.inc()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            ADMISSION_IN_FLIGHT.dec()
+            self._semaphore.release()
+
+    async def _acquire(self) -> float:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return 0.0
+
+        if self._queue_depth >= self._max_queue:
+            raise self._rejected("queue_full", wait_s=0.0)
+
+        started_at = time.perf_counter()
+        self._queue_depth += 1
+        ADMISSION_QUEUE_DEPTH.inc()
+        try:
+            async with asyncio.timeout(self._max_wait_s):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            raise self._rejected("wait_timeout", wait_s=time.perf_counter() - started_at) from None
+        finally:
+            self._queue_depth -= 1
+            ADMISSION_QUEUE_DEPTH.dec()
+
+        return time.perf_counter() - started_at
+
+    def _rejected(self, reason: str, *, wait_s: float) -> ServiceOverloadedError:
+        self._rejected_total += 1
+        count_admission_rejected(reason)
+        logger.warning(
+            "admission_rejected",
+            reason=reason,
+            in_flight=self._in_flight,
+            queue_depth=self._queue_depth,
+            wait_ms=round(wait_s * 1000, 2),
+        )
+        return ServiceOverloadedError(retry_after_s=self._retry_after_s)
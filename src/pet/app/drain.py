@@ -0,0 +1,79 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from pet.app.errors import ServiceShuttingDownError
+
+
+@dataclass(slots=True, frozen=True)
+class DrainResult:
+    drained: int
+    aborted: int
+    duration_s: float
+
+
+class DrainController:
+    """Tracks units of work in flight so shutdown can wait for them before disposing the engine.
+
+    ``begin`` marks the service as draining, which fails readiness, while new
+    units of work are still accepted: the server calls it on SIGTERM, before it
+    stops listening, so load balancers stop routing here first. Once ``drain``
+    has started, new units of work are rejected with ``ServiceShuttingDownError``;
+    the ones already running get up to the deadline to finish. Whatever is still
+    running then is reported as aborted.
+    """
+
+    def __init__(self, *, retry_after_s: int = 1) -> None:
+        self._retry_after_s = retry_after_s
+        self._in_flight = 0
+        self._draining = False
+        self._rejecting = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def begin(self) -> None:
+        """Fail readiness from now on, but keep accepting units of work."""
+        self._draining = True
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        if self._rejecting:
+            raise ServiceShuttingDownError(retry_after_s=self._retry_after_s)
+
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    async def drain(self, deadline_s: float) -> DrainResult:
+        """Reject new units of work and wait up to ``deadline_s`` for the running ones."""
+        self._draining = True
+        self._rejecting = True
+        started_at = time.perf_counter()
+        in_flight = self._in_flight
+
+        try:
+            async with asyncio.timeout(deadline_s):
+                await self._idle.wait()
+        except TimeoutError:
+            pass
+
+        return DrainResult(
+            drained=in_flight - self._in_flight,
+            aborted=self._in_flight,
+            duration_s=time.perf_counter() - started_at,
+        )
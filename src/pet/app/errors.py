@@ -7,8 +7,10 @@ VALIDATION_ERROR_TITLE = "Validation Error"
 
 class AppErrorCode(enum.StrEnum):
     CONFLICT = "conflict"
+    IDEMPOTENCY_KEY_IN_USE = "idempotency_key_in_use"
     INTERNAL_ERROR = "internal_error"
     ORGANIZATION_NAME_TAKEN = "organization_name_taken"
+    ORGANIZATION_NOT_FOUND = "organization_not_found"
     SERVICE_UNAVAILABLE = "service_unavailable"
     VALIDATION = "validation_error"
 
@@ -32,6 +34,17 @@ class OrganizationNameTakenError(AppError):
         )
 
 
+class OrganizationNotFoundError(AppError):
+    def __init__(
+        self,
+        detail: str = "Organization not found",
+        extra: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            title="Not Found", code=AppErrorCode.ORGANIZATION_NOT_FOUND, detail=detail, extra=extra
+        )
+
+
 class AppValidationError(AppError):
     def __init__(
         self,
@@ -97,6 +110,38 @@ class ServiceUnavailable(AppError):
         )
 
 
+class ServiceOverloadedError(ServiceUnavailable):
+    def __init__(
+        self,
+        detail: str = "Too many requests in flight, retry later",
+        *,
+        retry_after_s: int = 1,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            title="Service Unavailable",
+            code=AppErrorCode.SERVICE_UNAVAILABLE,
+            detail=detail,
+            extra={"retryable": True, "retry_after_s": retry_after_s, **(extra or {})},
+        )
+
+
+class ServiceShuttingDownError(ServiceUnavailable):
+    def __init__(
+        self,
+        detail: str = "Service is shutting down, retry later",
+        *,
+        retry_after_s: int = 1,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            title="Service Unavailable",
+            code=AppErrorCode.SERVICE_UNAVAILABLE,
+            detail=detail,
+            extra={"retryable": True, "retry_after_s": retry_after_s, **(extra or {})},
+        )
+
+
 class UnprocessableEntity(AppError):
     def __init__(
         self,
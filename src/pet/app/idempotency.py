@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+import contextvars
+
+from pet.app.usecases.idempotency import (
+    PurgeExpiredIdempotencyKeysCmdIn,
+    purge_expired_idempotency_keys_cmd,
+)
+from pet.config.logging import get_logger
+from pet.domain.uow import TransactionExecutorProtocol
+
+logger = get_logger(__name__)
+
+
+class IdempotencyKeyPurger:
+    """Deletes expired idempotency keys every ``interval_s`` in a background task.
+
+    Each transaction deletes at most ``batch_size`` rows, and batches follow one
+    another until one comes back short. Rows locked by other workers are
+    skipped, so every worker can run its own purger.
+    """
+
+    def __init__(
+        self,
+        executor: TransactionExecutorProtocol,
+        *,
+        interval_s: float,
+        batch_size: int,
+    ) -> None:
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        self._executor = executor
+        self._interval_s = interval_s
+        self._cmd = PurgeExpiredIdempotencyKeysCmdIn(batch_size=batch_size)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def purge(self) -> int:
+        purged = 0
+        while True:
+            deleted = await self._executor.run(purge_expired_idempotency_keys_cmd, self._cmd)
+            purged += deleted
+            if deleted < self._cmd.batch_size:
+                break
+
+        if purged:
+            logger.info("idempotency_keys_purged", purged=purged)
+        return purged
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_s)
+            try:
+                await self.purge()
+            except Exception:
+                logger.exception("idempotency_keys_purge_failed")
@@ -1,19 +1,33 @@
+import asyncio
+import contextvars
+import random
 import time
-from collections.abc import Awaitable, Callable
-from typing import Concatenate
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Concatenate
 
 import structlog
 
+from pet.app.admission import AdmissionController
+from pet.app.drain import DrainController
 from pet.app.error_mappers import translate_domain_validation_error
+from pet.app.errors import AppError
 from pet.config.logging import get_logger
 from pet.domain.exc import ValidationError
 from pet.domain.uow import UnitOfWork
-from pet.infra.sqla.db.exc import PersistenceError, translate_db_error
+from pet.infra.metrics import observe_use_case
+from pet.infra.sqla.db.exc import (
+    TRANSACTION_ROLLBACK_SQLSTATES,
+    PersistenceError,
+    translate_db_error,
+)
+from pet.infra.sqla.db.pool import PoolWait, track_pool_wait
 
 logger = get_logger(__name__)
 
 
-def _handler_name[T, **P](handler: Callable[Concatenate[UnitOfWork, P], Awaitable[T]]) -> str:
+def _handler_name(handler: Callable[..., object]) -> str:
     return getattr(handler, "__name__", handler.__class__.__name__)
 
 
@@ -21,9 +35,271 @@ def _duration_ms(started_at: float) -> float:
     return round((time.perf_counter() - started_at) * 1000, 2)
 
 
+def _use_case_duration_ms(handler_name: str, outcome: str, started_at: float) -> float:
+    duration_s = time.perf_counter() - started_at
+    observe_use_case(handler_name, outcome, duration_s)
+    return round(duration_s * 1000, 2)
+
+
+def _db_error(
+    e: PersistenceError, *, handler_name: str, started_at: float, attempt: int = 1
+) -> AppError:
+    logger.warning(
+        "transaction_db_error",
+        use_case_handler=handler_name,
+        duration_ms=_use_case_duration_ms(handler_name, "db_error", started_at),
+        attempt=attempt,
+        persistence_error_kind=getattr(e, "kind", None),
+        sqlstate=getattr(e, "sqlstate", None),
+        constraint_name=getattr(e, "constraint_name", None),
+        retryable=getattr(e, "retryable", None),
+    )
+    return translate_db_error(e)
+
+
+def _validation_error(e: ValidationError, *, handler_name: str, started_at: float) -> AppError:
+    logger.warning(
+        "transaction_validation_failed",
+        use_case_handler=handler_name,
+        duration_ms=_use_case_duration_ms(handler_name, "validation_error", started_at),
+        validation_cause=e.cause,
+    )
+    return translate_domain_validation_error(e)
+
+
+def _caused_by(error: AppError, cause: BaseException) -> AppError:
+    error.__cause__ = cause
+    return error
+
+
+def _admit(admission: AdmissionController | None) -> AbstractAsyncContextManager[None]:
+    return nullcontext() if admission is None else admission.admit()
+
+
+def _track(drain: DrainController | None) -> AbstractAsyncContextManager[None]:
+    return nullcontext() if drain is None else drain.track()
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-running a transaction that failed.
+
+    Only errors marked ``retryable`` are retried, each time in a fresh unit of
+    work. A failed COMMIT is retried only for serialization failures and
+    deadlocks: for anything else, e.g. a dropped connection, the transaction
+    may have committed and running it again could apply it twice.
+
+    Delays use full jitter over an exponential backoff, and no attempt is
+    started once ``deadline_s`` since the first one would be exceeded. The
+    default policy makes a single attempt.
+    """
+
+    max_attempts: int = 1
+    base_delay_s: float = 0.01
+    max_delay_s: float = 0.2
+    deadline_s: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+
+    def delay_s(
+        self,
+        error: PersistenceError,
+        *,
+        attempt: int,
+        elapsed_s: float,
+        during_commit: bool = False,
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if attempt >= self.max_attempts or not getattr(error, "retryable", False):
+            return None
+        if during_commit and getattr(error, "sqlstate", None) not in TRANSACTION_ROLLBACK_SQLSTATES:
+            return None
+
+        delay_s = random.uniform(0, min(self.max_delay_s, self.base_delay_s * 2 ** (attempt - 1)))
+        if elapsed_s + delay_s >= self.deadline_s:
+            return None
+        return delay_s
+
+
+class _RetryTransaction(Exception):
+    def __init__(self, error: PersistenceError, delay_s: float) -> None:
+        super().__init__(error)
+        self.error = error
+        self.delay_s = delay_s
+
+
+@dataclass(slots=True)
+class _GroupedCall:
+    handler: Callable[..., Awaitable[Any]]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    future: asyncio.Future[Any]
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+class GroupCommitter:
+    """Group-commit micro-batching for short write transactions.
+
+    Calls submitted within ``window_s`` of each other, up to ``max_batch_size``
+    of them, run one after another in a single transaction and share its
+    COMMIT (and fsync). Every call runs inside its own SAVEPOINT, so a failing
+    call is rolled back alone and its caller gets its own translated error.
+    If the shared COMMIT itself fails, every call that had succeeded gets that
+    error.
+
+    Batches are not retried under ``RetryPolicy``: re-running one would re-run
+    every call in it, including those that had already failed in their
+    savepoint, so a retryable error reaches the caller as is.
+
+    Each call runs in the context of the request that submitted it, so log
+    lines keep their request id.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        *,
+        window_s: float = 0.002,
+        max_batch_size: int = 100,
+        admission: AdmissionController | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+
+        self._uow_factory = uow_factory
+        self._window_s = window_s
+        self._max_batch_size = max_batch_size
+        self._admission = admission
+
+        self._pending: list[_GroupedCall] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def submit[T, **P](
+        self,
+        handler: Callable[Concatenate[UnitOfWork, P], Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        call = _GroupedCall(handler, args, kwargs, loop.create_future())
+        self._pending.append(call)
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(
+                self._window_s, self._flush, context=contextvars.Context()
+            )
+
+        return await call.future
+
+    async def close(self) -> None:
+        """Flush pending calls and wait for every batch in flight."""
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._run_batch(batch), context=contextvars.Context())
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[_GroupedCall]) -> None:
+        started_at = time.perf_counter()
+        outcomes: list[tuple[_GroupedCall, Any, BaseException | None]] = []
+
+        try:
+            async with _admit(self._admission), self._uow_factory() as uow:
+                for call in batch:
+                    try:
+                        result = await asyncio.create_task(
+                            self._run_call(uow, call), context=call.context
+                        )
+                    except Exception as e:
+                        outcomes.append((call, None, e))
+                    else:
+                        outcomes.append((call, result, None))
+
+                try:
+                    await uow.commit()
+                except PersistenceError as e:
+                    _db_error(e, handler_name="group_commit", started_at=started_at)
+                    outcomes = [
+                        (call, None, error or _caused_by(translate_db_error(e), e))
+                        for call, _, error in outcomes
+                    ]
+        except AppError as e:
+            outcomes = [(call, None, e) for call in batch]
+        except Exception as e:
+            logger.exception("transaction_group_failed", batch_size=len(batch))
+            outcomes = [(call, None, e) for call in batch]
+
+        failed_count = 0
+        for call, result, error in outcomes:
+            if error is not None:
+                failed_count += 1
+            if call.future.done():
+                continue
+            if error is None:
+                call.future.set_result(result)
+            else:
+                call.future.set_exception(error)
+
+        logger.info(
+            "transaction_group_committed",
+            batch_size=len(batch),
+            failed_count=failed_count,
+            duration_ms=_duration_ms(started_at),
+        )
+
+    @staticmethod
+    async def _run_call(uow: UnitOfWork, call: _GroupedCall) -> Any:
+        started_at = time.perf_counter()
+        handler_name = _handler_name(call.handler)
+        structlog.contextvars.bind_contextvars(use_case_handler=handler_name)
+
+        try:
+            async with uow.savepoint():
+                return await call.handler(uow, *call.args, **call.kwargs)
+        except PersistenceError as e:
+            raise _db_error(e, handler_name=handler_name, started_at=started_at) from e
+        except ValidationError as e:
+            raise _validation_error(e, handler_name=handler_name, started_at=started_at) from e
+        except Exception:
+            logger.exception(
+                "transaction_failed",
+                use_case_handler=handler_name,
+                duration_ms=_use_case_duration_ms(handler_name, "failed", started_at),
+                group_commit=True,
+            )
+            raise
+
+
 class TransactionExecutor:
-    def __init__(self, uow_factory: Callable[[], UnitOfWork]) -> None:
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        group_committer: GroupCommitter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        admission: AdmissionController | None = None,
+        drain: DrainController | None = None,
+    ) -> None:
         self._uow_factory = uow_factory
+        self._group_committer = group_committer
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._admission = admission
+        self._drain = drain
 
     async def run[T, **P](
         self,
@@ -37,42 +313,143 @@ class TransactionExecutor:
 
         structlog.contextvars.bind_contextvars(use_case_handler=handler_name)
 
-        async with self._uow_factory() as uow:
+        attempt = 1
+        async with _track(self._drain):
+            with track_pool_wait() as pool_wait:
+                while True:
+                    try:
+                        return await self._run_attempt(
+                            handler,
+                            args,
+                            kwargs,
+                            handler_name=handler_name,
+                            started_at=started_at,
+                            attempt=attempt,
+                            pool_wait=pool_wait,
+                        )
+                    except _RetryTransaction as retry:
+                        logger.warning(
+                            "transaction_retrying",
+                            use_case_handler=handler_name,
+                            attempt=attempt,
+                            max_attempts=self._retry_policy.max_attempts,
+                            delay_ms=round(retry.delay_s * 1000, 2),
+                            persistence_error_kind=retry.error.kind,
+                            sqlstate=retry.error.sqlstate,
+                        )
+                        await asyncio.sleep(retry.delay_s)
+                        attempt += 1
+
+    async def _run_attempt[T](
+        self,
+        handler: Callable[..., Awaitable[T]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        handler_name: str,
+        started_at: float,
+        attempt: int,
+        pool_wait: PoolWait,
+    ) -> T:
+        async with _admit(self._admission), self._uow_factory() as uow:
+            committing = False
             try:
                 result = await handler(uow, *args, **kwargs)
 
+                committing = True
                 await uow.commit()
 
                 logger.info(
                     "transaction_committed",
                     use_case_handler=handler_name,
-                    duration_ms=_duration_ms(started_at),
+                    duration_ms=_use_case_duration_ms(handler_name, "committed", started_at),
+                    pool_wait_ms=pool_wait.ms,
+                    attempt=attempt,
                 )
 
                 return result
             except PersistenceError as e:
-                logger.warning(
-                    "transaction_db_error",
-                    use_case_handler=handler_name,
-                    duration_ms=_duration_ms(started_at),
-                    persistence_error_kind=getattr(e, "kind", None),
-                    sqlstate=getattr(e, "sqlstate", None),
-                    constraint_name=getattr(e, "constraint_name", None),
-                    retryable=getattr(e, "retryable", None),
+                delay_s = self._retry_policy.delay_s(
+                    e,
+                    attempt=attempt,
+                    elapsed_s=time.perf_counter() - started_at,
+                    during_commit=committing,
                 )
-                raise translate_db_error(e) from e
+                if delay_s is not None:
+                    raise _RetryTransaction(e, delay_s) from e
+                raise _db_error(
+                    e, handler_name=handler_name, started_at=started_at, attempt=attempt
+                ) from e
             except ValidationError as e:
-                logger.warning(
-                    "transaction_validation_failed",
+                raise _validation_error(e, handler_name=handler_name, started_at=started_at) from e
+            except Exception:
+                logger.exception(
+                    "transaction_failed",
                     use_case_handler=handler_name,
-                    duration_ms=_duration_ms(started_at),
-                    validation_cause=e.cause,
+                    duration_ms=_use_case_duration_ms(handler_name, "failed", started_at),
+                    attempt=attempt,
                 )
-                raise translate_domain_validation_error(e) from e
+                raise
+
+    async def run_grouped[T, **P](
+        self,
+        handler: Callable[Concatenate[UnitOfWork, P], Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Like ``run``, but shares one transaction with concurrent calls if group commit is on.
+
+        Grouped calls are not retried; see ``GroupCommitter``.
+        """
+        if self._group_committer is None:
+            return await self.run(handler, *args, **kwargs)
+
+        async with _track(self._drain):
+            return await self._group_committer.submit(handler, *args, **kwargs)
+
+    async def stream[T, **P](
+        self,
+        handler: Callable[Concatenate[UnitOfWork, P], AsyncIterator[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[T]:
+        """Yield the items of a streaming query handler from one read-only transaction.
+
+        The unit of work stays open until the caller has consumed or closed the
+        iterator, so the handler can read through a server-side cursor.
+        """
+        started_at = time.perf_counter()
+        handler_name = _handler_name(handler)
+        logger.debug("transaction_started", use_case_handler=handler_name, read_only=True)
+
+        structlog.contextvars.bind_contextvars(use_case_handler=handler_name)
+
+        items_count = 0
+        async with _track(self._drain), _admit(self._admission), self._uow_factory() as uow:
+            try:
+                await uow.set_read_only()
+
+                async for item in handler(uow, *args, **kwargs):
+                    items_count += 1
+                    yield item
+
+                await uow.commit()
+
+                logger.info(
+                    "transaction_streamed",
+                    use_case_handler=handler_name,
+                    duration_ms=_use_case_duration_ms(handler_name, "committed", started_at),
+                    items_count=items_count,
+                )
+            except PersistenceError as e:
+                raise _db_error(e, handler_name=handler_name, started_at=started_at) from e
+            except ValidationError as e:
+                raise _validation_error(e, handler_name=handler_name, started_at=started_at) from e
             except Exception:
                 logger.exception(
                     "transaction_failed",
                     use_case_handler=handler_name,
-                    duration_ms=_duration_ms(started_at),
+                    duration_ms=_use_case_duration_ms(handler_name, "failed", started_at),
+                    items_count=items_count,
                 )
                 raise
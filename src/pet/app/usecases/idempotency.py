@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from pet.domain.uow import UnitOfWork
+
+
+@dataclass(frozen=True)
+class PurgeExpiredIdempotencyKeysCmdIn:
+    batch_size: int
+
+
+async def purge_expired_idempotency_keys_cmd(
+    uow: UnitOfWork,
+    cmd: PurgeExpiredIdempotencyKeysCmdIn,
+) -> int:
+    return await uow.idempotency.purge_expired(cmd.batch_size)
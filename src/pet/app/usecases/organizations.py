@@ -1,21 +1,73 @@
-from collections.abc import Callable
+import base64
+import hashlib
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Final
 from uuid import UUID, uuid4
 
 import structlog
 
+from pet.app.error_mappers import translate_domain_validation_error
+from pet.app.errors import AppError, OrganizationNameTakenError
 from pet.config.logging import get_logger
-from pet.domain.models import Organization
+from pet.domain.exc import IdempotencyKeyReusedError, InvalidCursorError, ValidationError
+from pet.domain.models import IdempotencyRecord, Organization, OrganizationCursor
 from pet.domain.uow import UnitOfWork
+from pet.domain.value_objects import (
+    ORG_NAME_MIN_LEN,
+    canonicalize_org_name,
+    normalize_org_name,
+    validate_org_name,
+)
 from pet.domain.value_objects import Name as NameVO
 from pet.domain.value_objects import PublicId as PublicIdVO
 
 logger = get_logger(__name__)
 
+CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE: Final = "create_organization"
+DEFAULT_IDEMPOTENCY_TTL: Final = timedelta(hours=24)
+
+_EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND: Final = timedelta(microseconds=1)
+
 
 @dataclass(frozen=True)
 class CreateOrganizationCmdIn:
     name: str
+    idempotency_key: str | None = None
+
+
+@dataclass(frozen=True)
+class CreateOrganizationsBulkCmdIn:
+    names: Sequence[str]
+
+
+@dataclass(frozen=True)
+class CheckOrganizationNameQueryIn:
+    name: str
+
+
+@dataclass(frozen=True)
+class GetOrganizationQueryIn:
+    public_id: UUID
+
+
+@dataclass(frozen=True)
+class ListOrganizationsQueryIn:
+    limit: int
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class SearchOrganizationsQueryIn:
+    q: str
+    limit: int
+
+
+@dataclass(frozen=True)
+class ExportOrganizationsQueryIn:
+    batch_size: int
 
 
 @dataclass
@@ -23,10 +75,89 @@ class PublicId:
     val: UUID
 
 
+@dataclass
+class NameAvailability:
+    name: str
+    name_canonical: str
+    available: bool
+
+
+@dataclass
+class OrganizationView:
+    public_id: UUID
+    name: str
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass
+class OrganizationMatch:
+    public_id: UUID
+    name: str
+
+
+@dataclass
+class OrganizationsPageView:
+    items: list[OrganizationView]
+    next_cursor: str | None = None
+
+
+@dataclass
+class BulkItemResult:
+    index: int
+    public_id: PublicId | None = None
+    error: AppError | None = None
+
+
+def encode_organization_cursor(cursor: OrganizationCursor) -> str:
+    raw = f"{(cursor.created_at - _EPOCH) // _MICROSECOND}:{cursor.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_organization_cursor(token: str) -> OrganizationCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        micros, org_id = raw.split(":")
+        return OrganizationCursor(
+            created_at=_EPOCH + timedelta(microseconds=int(micros)),
+            id=int(org_id),
+        )
+    except (ValueError, OverflowError) as e:
+        raise InvalidCursorError() from e
+
+
+def _organization_view(org: Organization) -> OrganizationView:
+    if org.created_at is None or org.updated_at is None:
+        raise ValueError("Persisted organization is missing its timestamps")
+
+    return OrganizationView(
+        public_id=org.public_id.value,
+        name=org.name.value,
+        created_at=org.created_at,
+        updated_at=org.updated_at,
+    )
+
+
+def create_organization_request_hash(cmd: CreateOrganizationCmdIn) -> str:
+    return hashlib.sha256(cmd.name.encode()).hexdigest()
+
+
+def _replay_create_organization(stored: IdempotencyRecord, request_hash: str) -> PublicId:
+    if stored.request_hash != request_hash:
+        raise IdempotencyKeyReusedError()
+
+    logger.debug(
+        "organization_create_replayed",
+        organization_public_id=str(stored.public_id.value),
+    )
+    return PublicId(stored.public_id.value)
+
+
 async def create_organization_cmd(
     uow: UnitOfWork,
     cmd: CreateOrganizationCmdIn,
     uuid_gen: Callable[[], UUID] = uuid4,
+    idempotency_ttl: timedelta = DEFAULT_IDEMPOTENCY_TTL,
 ) -> PublicId:
     structlog.contextvars.bind_contextvars(
         use_case="create_organization",
@@ -34,6 +165,14 @@ async def create_organization_cmd(
     )
     logger.debug("organization_create_started")
 
+    request_hash = create_organization_request_hash(cmd)
+    if cmd.idempotency_key is not None:
+        stored = await uow.idempotency.get(
+            CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE, cmd.idempotency_key
+        )
+        if stored is not None:
+            return _replay_create_organization(stored, request_hash)
+
     public_id = uuid_gen()
 
     structlog.contextvars.bind_contextvars(organization_public_id=str(public_id))
@@ -43,8 +182,149 @@ async def create_organization_cmd(
         name=NameVO.create(cmd.name),
     )
 
-    uow.orgs.create(domain_org)
+    if cmd.idempotency_key is not None:
+        # Claimed before the insert: a concurrent request with the same key waits
+        # here for this one and replays its result instead of hitting the name.
+        stored = await uow.idempotency.save(
+            IdempotencyRecord(
+                scope=CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+                key=cmd.idempotency_key,
+                request_hash=request_hash,
+                public_id=domain_org.public_id,
+            ),
+            ttl=idempotency_ttl,
+        )
+        if stored is not None:
+            return _replay_create_organization(stored, request_hash)
+
+    await uow.orgs.create(domain_org)
 
     logger.debug("organization_create_staged")
 
     return PublicId(public_id)
+
+
+async def create_organizations_bulk_cmd(
+    uow: UnitOfWork,
+    cmd: CreateOrganizationsBulkCmdIn,
+    uuid_gen: Callable[[], UUID] = uuid4,
+) -> list[BulkItemResult]:
+    structlog.contextvars.bind_contextvars(
+        use_case="create_organizations_bulk",
+        organizations_count=len(cmd.names),
+    )
+    logger.debug("organizations_bulk_create_started")
+
+    results: list[BulkItemResult] = []
+    staged: list[tuple[int, Organization]] = []
+
+    for index, name in enumerate(cmd.names):
+        try:
+            domain_org = Organization.create(
+                public_id=PublicIdVO.create(uuid_gen()),
+                name=NameVO.create(name),
+            )
+        except ValidationError as e:
+            results.append(BulkItemResult(index=index, error=translate_domain_validation_error(e)))
+            continue
+
+        staged.append((index, domain_org))
+
+    created = await uow.orgs.create_many([domain_org for _, domain_org in staged])
+
+    for index, domain_org in staged:
+        if domain_org.public_id in created:
+            results.append(
+                BulkItemResult(index=index, public_id=PublicId(domain_org.public_id.value))
+            )
+        else:
+            results.append(BulkItemResult(index=index, error=OrganizationNameTakenError()))
+
+    results.sort(key=lambda result: result.index)
+
+    logger.debug(
+        "organizations_bulk_create_staged",
+        created_count=len(created),
+        failed_count=len(results) - len(created),
+    )
+
+    return results
+
+
+async def check_organization_name_query(
+    uow: UnitOfWork,
+    query: CheckOrganizationNameQueryIn,
+) -> NameAvailability:
+    name = validate_org_name(query.name)
+    name_canonical = canonicalize_org_name(name)
+
+    taken = await uow.orgs.exists_by_canonical_name(name_canonical)
+
+    logger.debug("organization_name_checked", organization_name_taken=taken)
+
+    return NameAvailability(name=name, name_canonical=name_canonical, available=not taken)
+
+
+async def get_organization_query(
+    uow: UnitOfWork,
+    query: GetOrganizationQueryIn,
+) -> OrganizationView | None:
+    org = await uow.orgs.get_by_public_id(PublicIdVO.create(query.public_id))
+
+    logger.debug("organization_fetched", organization_found=org is not None)
+
+    if org is None:
+        return None
+
+    return _organization_view(org)
+
+
+async def list_organizations_query(
+    uow: UnitOfWork,
+    query: ListOrganizationsQueryIn,
+) -> OrganizationsPageView:
+    after = decode_organization_cursor(query.cursor) if query.cursor is not None else None
+
+    page = await uow.orgs.list_page(limit=query.limit, after=after)
+
+    logger.debug(
+        "organizations_listed",
+        organizations_count=len(page.items),
+        has_next_page=page.next_cursor is not None,
+    )
+
+    return OrganizationsPageView(
+        items=[_organization_view(org) for org in page.items],
+        next_cursor=(
+            encode_organization_cursor(page.next_cursor) if page.next_cursor is not None else None
+        ),
+    )
+
+
+async def search_organizations_query(
+    uow: UnitOfWork,
+    query: SearchOrganizationsQueryIn,
+) -> list[OrganizationMatch]:
+    term = canonicalize_org_name(normalize_org_name(query.q))
+    if len(term) < ORG_NAME_MIN_LEN:
+        raise ValidationError("Search query is too short", cause="q")
+
+    orgs = await uow.orgs.search_by_canonical_name(term, limit=query.limit)
+
+    logger.debug(
+        "organizations_searched",
+        search_term_length=len(term),
+        organizations_count=len(orgs),
+    )
+
+    return [OrganizationMatch(public_id=org.public_id.value, name=org.name.value) for org in orgs]
+
+
+async def export_organizations_query(
+    uow: UnitOfWork,
+    query: ExportOrganizationsQueryIn,
+) -> AsyncIterator[OrganizationView]:
+    logger.debug("organizations_export_started", batch_size=query.batch_size)
+
+    async for org in uow.orgs.stream_all(batch_size=query.batch_size):
+        yield _organization_view(org)
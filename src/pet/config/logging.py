@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 import logging.config
-from typing import Final, Literal
+import queue
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final, Literal
 
+import orjson
 import structlog
-from structlog.typing import Processor
+from structlog.typing import EventDict, FilteringBoundLogger, Processor, WrappedLogger
 
 type LogFormat = Literal["json", "console"]
+type LogOverflowPolicy = Literal["drop", "block"]
+type LogProfile = Literal["stdlib", "fast"]
+
+DEFAULT_LOG_QUEUE_SIZE: Final = 10_000
+_FLUSH_TIMEOUT_S: Final = 5.0
+_SAMPLED_METHODS: Final = frozenset({"debug", "info"})
 
 _VALID_LOG_LEVELS: Final[frozenset[str]] = frozenset(
     {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"}
@@ -25,7 +39,349 @@ def _normalize_log_level(level: str) -> str:
     return normalized
 
 
-def configure_logging(*, level: str = "INFO", log_format: LogFormat = "json") -> None:
+class _Stop:
+    pass
+
+
+class QueueLogHandler(logging.Handler):
+    """Hands records to a background thread that formats and writes them through ``handler``.
+
+    The bounded queue holds at most ``max_size`` records. When it is full,
+    ``overflow="drop"`` discards the record and counts it in ``dropped``, and
+    ``overflow="block"`` makes the logging call wait for room. Once closed, records
+    are written synchronously.
+
+    Lines rendered elsewhere, by the fast profile, go through the same queue
+    with ``emit_line`` and are written as-is to the wrapped handler's stream.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        *,
+        max_size: int = DEFAULT_LOG_QUEUE_SIZE,
+        overflow: LogOverflowPolicy = "drop",
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+
+        super().__init__(level=handler.level)
+        self._handler = handler
+        self._overflow = overflow
+        self._queue: queue.Queue[logging.LogRecord | str | bytes | threading.Event | _Stop] = (
+            queue.Queue(max_size)
+        )
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._write, name="log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._closed:
+            self._handler.handle(record)
+            return
+
+        if not isinstance(record.msg, dict):
+            # Freeze foreign records before their args can change under us.
+            record.msg = record.getMessage()
+            record.args = None
+
+        self._put(record)
+
+    def emit_line(self, line: str | bytes) -> None:
+        if self._closed:
+            self._write_line(line)
+            return
+
+        self._put(line)
+
+    def _put(self, item: logging.LogRecord | str | bytes) -> None:
+        if self._overflow == "block":
+            self._queue.put(item)
+            return
+
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def flush(self, timeout_s: float = _FLUSH_TIMEOUT_S) -> None:
+        """Wait until every record queued so far has been written."""
+        if self._closed or not self._thread.is_alive():
+            return
+
+        written = threading.Event()
+        self._queue.put(written)
+        written.wait(timeout_s)
+
+    def close(self) -> None:
+        if not self._closed:
+            if self._thread.is_alive():
+                self._queue.put(_Stop())
+                self._thread.join(_FLUSH_TIMEOUT_S)
+            self._closed = True
+        super().close()
+
+    def _write(self) -> None:
+        while True:
+            item = self._queue.get()
+            if isinstance(item, _Stop):
+                return
+            if isinstance(item, threading.Event):
+                try:
+                    self._handler.flush()
+                except (OSError, ValueError):
+                    # Same as logging.shutdown: the stream may already be closed.
+                    pass
+                finally:
+                    item.set()
+                continue
+            if isinstance(item, str | bytes):
+                self._write_line(item)
+                continue
+            self._handler.handle(item)
+
+    def _write_line(self, line: str | bytes) -> None:
+        stream = getattr(self._handler, "stream", None)
+        if stream is None:
+            return
+
+        self._handler.acquire()
+        try:
+            stream.write(line.decode() if isinstance(line, bytes) else line)
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._handler.release()
+
+
+class _QueuedLineWriter:
+    """File-like target for structlog's ``BytesLogger``/``WriteLogger`` that queues each line."""
+
+    def __init__(self, handler: QueueLogHandler) -> None:
+        self._handler = handler
+
+    def write(self, line: str | bytes) -> None:
+        self._handler.emit_line(line)
+
+    def flush(self) -> None:
+        pass
+
+
+def _capture_exc_info(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+    # Tracebacks are rendered on the writer thread, where sys.exc_info() is empty.
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+@dataclass(slots=True)
+class _RateWindow:
+    started_at: float
+    passed: int = 0
+    suppressed: int = 0
+
+
+class LogSampler:
+    """structlog processor that thins out high-volume events.
+
+    Events named in ``sample_rates`` are kept with that probability, except
+    ones logged at warning or above, with a ``status_code`` of 400 or more, or
+    with a ``duration_ms`` of at least ``slow_ms``; kept samples carry
+    ``sample_rate`` so counts can be scaled back up. Events named in
+    ``rate_limited`` are let through at most ``burst`` times per ``interval_s``
+    for each event name and level; the next one let through after suppression
+    carries the number suppressed in ``suppressed``. When none follows, as after
+    a burst of errors that then stop, ``report_suppressed`` logs the count as a
+    ``log_events_suppressed`` event once the window is over.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rates: Mapping[str, float],
+        slow_ms: float,
+        rate_limited: Iterable[str] = (),
+        burst: int = 10,
+        interval_s: float = 10.0,
+        rand: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sample_rates = dict(sample_rates)
+        self._slow_ms = slow_ms
+        self._rate_limited = frozenset(rate_limited)
+        self._burst = burst
+        self._interval_s = interval_s
+        self._rand = rand
+        self._clock = clock
+        self._windows: dict[tuple[str, str], _RateWindow] = {}
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        event = event_dict.get("event")
+        if not isinstance(event, str):
+            return event_dict
+
+        if event in self._rate_limited:
+            self._rate_limit(event, method_name, event_dict)
+
+        sample_rate = self._sample_rates.get(event)
+        if sample_rate is None or sample_rate >= 1 or self._always_kept(method_name, event_dict):
+            return event_dict
+
+        if self._rand() >= sample_rate:
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = sample_rate
+        return event_dict
+
+    def report_suppressed(self) -> None:
+        """Log ``log_events_suppressed`` for every ended window with events still unreported.
+
+        Meant to be called periodically from an existing background loop.
+        """
+        now = self._clock()
+        for (event, method_name), window in list(self._windows.items()):
+            if not window.suppressed or now - window.started_at < self._interval_s:
+                continue
+
+            suppressed, window.suppressed = window.suppressed, 0
+            get_logger(__name__).warning(
+                "log_events_suppressed",
+                suppressed_event=event,
+                suppressed_level=method_name,
+                suppressed=suppressed,
+                interval_s=self._interval_s,
+            )
+
+    def _always_kept(self, method_name: str, event_dict: EventDict) -> bool:
+        if method_name not in _SAMPLED_METHODS:
+            return True
+        status_code = event_dict.get("status_code")
+        if isinstance(status_code, int) and status_code >= 400:
+            return True
+        duration_ms = event_dict.get("duration_ms")
+        return isinstance(duration_ms, int | float) and duration_ms >= self._slow_ms
+
+    def _rate_limit(self, event: str, method_name: str, event_dict: EventDict) -> None:
+        now = self._clock()
+        window = self._windows.get((event, method_name))
+        if window is None:
+            window = self._windows[(event, method_name)] = _RateWindow(started_at=now)
+        elif now - window.started_at >= self._interval_s:
+            window.started_at, window.passed = now, 0
+
+        if window.passed >= self._burst:
+            window.suppressed += 1
+            raise structlog.DropEvent
+
+        window.passed += 1
+        if window.suppressed:
+            event_dict["suppressed"] = window.suppressed
+            window.suppressed = 0
+
+
+class _NamedBytesLogger(structlog.BytesLogger):
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, file: Any | None = None) -> None:
+        super().__init__(file)
+        self.name = name
+
+
+class _NamedWriteLogger(structlog.WriteLogger):
+    def __init__(self, name: str, file: Any | None = None) -> None:
+        super().__init__(file)
+        self.name = name
+
+
+def _named_logger_factory(
+    log_format: LogFormat,
+    file: _QueuedLineWriter | None = None,
+) -> Callable[..., Any]:
+    # A name lets add_logger_name fill in "logger" like it does for stdlib loggers.
+    logger_class = _NamedBytesLogger if log_format == "json" else _NamedWriteLogger
+
+    def factory(*args: Any) -> structlog.BytesLogger | structlog.WriteLogger:
+        return logger_class(args[0] if args else "", file)
+
+    return factory
+
+
+def _configure_fast_structlog(
+    level: str,
+    log_format: LogFormat,
+    sampler: LogSampler | None,
+    queue_handler: QueueLogHandler | None,
+) -> None:
+    """Filter by level in the bound logger's methods and write rendered lines directly.
+
+    Calls below ``level`` return before an event dict is built, and events skip
+    the stdlib ``logging`` handlers; JSON is rendered to bytes by orjson. With
+    ``queue_handler`` the rendered lines are written by its writer thread.
+    """
+    renderers: tuple[Processor, ...]
+    if log_format == "json":
+        renderers = (
+            structlog.processors.dict_tracebacks,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        )
+    else:
+        renderers = (structlog.dev.ConsoleRenderer(),)
+
+    structlog.configure(
+        processors=[
+            *((sampler,) if sampler is not None else ()),
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.StackInfoRenderer(),
+            *renderers,
+        ],
+        logger_factory=_named_logger_factory(
+            log_format,
+            None if queue_handler is None else _QueuedLineWriter(queue_handler),
+        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        cache_logger_on_first_use=True,
+    )
+
+
+def _queue_log_handler() -> QueueLogHandler | None:
+    return next(
+        (h for h in logging.getLogger().handlers if isinstance(h, QueueLogHandler)),
+        None,
+    )
+
+
+def flush_logging() -> None:
+    """Write out queued records and report the ones dropped on overflow."""
+    handler = _queue_log_handler()
+    if handler is None:
+        return
+
+    handler.flush()
+    if handler.dropped:
+        get_logger(__name__).warning("log_records_dropped", dropped=handler.dropped)
+        handler.flush()
+
+
+def configure_logging(
+    *,
+    level: str = "INFO",
+    log_format: LogFormat = "json",
+    queue_enabled: bool = False,
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    queue_overflow: LogOverflowPolicy = "drop",
+    sampler: LogSampler | None = None,
+    profile: LogProfile = "stdlib",
+) -> None:
     normalized_level = _normalize_log_level(level)
 
     shared_processors: tuple[Processor, ...] = (
@@ -37,6 +393,8 @@ def configure_logging(*, level: str = "INFO", log_format: LogFormat = "json") ->
         structlog.processors.TimeStamper(fmt="iso", utc=True),
         structlog.processors.StackInfoRenderer(),
     )
+    if queue_enabled:
+        shared_processors = (*shared_processors, _capture_exc_info)
 
     formatter_processors: tuple[Processor, ...]
     if log_format == "json":
@@ -77,8 +435,23 @@ def configure_logging(*, level: str = "INFO", log_format: LogFormat = "json") ->
         }
     )
 
+    if queue_enabled:
+        root = logging.getLogger()
+        stream_handler = root.handlers[0]
+        root.removeHandler(stream_handler)
+        root.addHandler(
+            QueueLogHandler(stream_handler, max_size=queue_size, overflow=queue_overflow)
+        )
+
+    if profile == "fast":
+        # Records from other libraries still go through the stdlib handlers above.
+        _configure_fast_structlog(normalized_level, log_format, sampler, _queue_log_handler())
+        return
+
     structlog.configure(
         processors=[
+            # Only structlog events are sampled; records from other loggers pass as-is.
+            *((sampler,) if sampler is not None else ()),
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -88,5 +461,7 @@ def configure_logging(*, level: str = "INFO", log_format: LogFormat = "json") ->
     )
 
 
-def get_logger(name: str, **kwargs: dict[str, str]) -> structlog.stdlib.BoundLogger:
-    return structlog.stdlib.get_logger(name, **kwargs)
+def get_logger(name: str, **kwargs: dict[str, str]) -> FilteringBoundLogger:
+    # The stdlib profile's BoundLogger and the fast profile's filtering logger
+    # both provide this interface.
+    return structlog.get_logger(name, **kwargs)
@@ -1,17 +1,41 @@
 from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy import URL
 
-from pet.config.logging import LogFormat
+from pet.config.logging import DEFAULT_LOG_QUEUE_SIZE, LogFormat, LogOverflowPolicy, LogProfile
+
+type OrganizationsRepoKind = Literal["orm", "core"]
+type EngineMode = Literal["direct", "pgbouncer_transaction"]
 
 ROOT = Path(__file__).resolve().parents[3]
 _APP_NAME = "pet-uk4wa"
 
 
+class LogQueueSettings(BaseModel):
+    # Format and write log records on a background thread instead of the event loop.
+    enabled: bool = False
+    max_size: int = DEFAULT_LOG_QUEUE_SIZE
+    overflow: LogOverflowPolicy = "drop"
+
+
+class LogSamplingSettings(BaseModel):
+    enabled: bool = False
+    # Share of each event kept; warnings and above, 4xx/5xx and slow events are always kept.
+    sample_rates: dict[str, float] = Field(
+        default_factory=lambda: {"http_request_finished": 0.01, "transaction_committed": 0.01}
+    )
+    slow_ms: float = 500.0
+    rate_limited_events: frozenset[str] = frozenset(
+        {"transaction_db_error", "admission_rejected", "slow_query"}
+    )
+    rate_limit_burst: int = 10
+    rate_limit_interval_seconds: float = 10.0
+
+
 class DatabaseSettings(BaseModel):
     driver: str
     host: str
@@ -26,6 +50,20 @@ class EngineSettings(BaseModel):
     pool_size: int = 10
     max_overflow: int = 20
     pool_pre_ping: bool = True
+    # pgbouncer_transaction: safe behind PgBouncer with pool_mode=transaction.
+    mode: EngineMode = "direct"
+    # Open a connection per checkout; cheap when PgBouncer does the pooling.
+    null_pool: bool = False
+
+
+class ServerSettings(BaseModel):
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    # Connections all workers may hold together; defaults to workers * (pool_size + max_overflow).
+    db_connection_budget: int | None = None
+    max_requests: int | None = None
+    max_requests_jitter: int = 0
 
 
 class SessionMakerSettings(BaseModel):
@@ -33,15 +71,105 @@ class SessionMakerSettings(BaseModel):
     autoflush: bool = True
 
 
+class AdmissionSettings(BaseModel):
+    enabled: bool = True
+    # Defaults to the pool capacity, engine.pool_size + engine.max_overflow.
+    max_concurrency: int | None = None
+    max_queue: int = 100
+    max_wait_ms: float = 1000.0
+    retry_after_seconds: int = 1
+
+
+class ShutdownSettings(BaseModel):
+    # How long in-flight requests, then units of work, get to finish on shutdown.
+    drain_deadline_ms: float = 10_000.0
+    # How long to keep serving after /readyz starts failing on SIGTERM, so load
+    # balancers stop routing here before the server stops listening.
+    readiness_delay_ms: float = 0.0
+    retry_after_seconds: int = 1
+
+
+class HealthSettings(BaseModel):
+    interval_ms: float = 1000.0
+    check_timeout_ms: float = 500.0
+    # /readyz fails when the last check is older than this.
+    stale_after_ms: float = 5000.0
+    # Pool saturation is only exported and logged unless this is set: then
+    # /readyz fails once this share of pool_size + max_overflow is checked out
+    # on pool_saturation_checks consecutive checks.
+    max_pool_saturation: float | None = None
+    pool_saturation_checks: int = 3
+    max_loop_lag_ms: float = 500.0
+
+
+class TransactionRetrySettings(BaseModel):
+    max_attempts: int = 3
+    base_delay_ms: float = 10.0
+    max_delay_ms: float = 200.0
+    deadline_ms: float = 1000.0
+
+
+class GroupCommitSettings(BaseModel):
+    enabled: bool = False
+    window_ms: float = 2.0
+    max_batch_size: int = 100
+
+
+class SlowQuerySettings(BaseModel):
+    enabled: bool = True
+    threshold_ms: float = 200.0
+    # Re-runs slow SELECTs under EXPLAIN (ANALYZE, BUFFERS); debugging only.
+    explain: bool = False
+    top_n: int = 20
+
+
+class OrganizationWriteSettings(BaseModel):
+    repository: OrganizationsRepoKind = "orm"
+
+
+class IdempotencySettings(BaseModel):
+    ttl_seconds: int = 86_400
+    cache_max_size: int = 10_000
+    cache_ttl_seconds: float = 300.0
+    purge_interval_seconds: float = 300.0
+    purge_batch_size: int = 1000
+
+
+class NameAvailabilitySettings(BaseModel):
+    # Per worker: creates invalidate the name only in the worker that served
+    # them, so other workers may answer from their cache for up to the TTL.
+    cache_max_size: int = 10_000
+    cache_ttl_seconds: float = 5.0
+
+
+class OrganizationReadSettings(BaseModel):
+    cache_max_size: int = 50_000
+    cache_ttl_seconds: float = 60.0
+
+
 class Settings(BaseSettings):
     app_name: str = _APP_NAME
 
     log_format: LogFormat = Field(default="json")
     log_level: str = Field(default="INFO")
+    log_profile: LogProfile = Field(default="stdlib")
+    log_queue: LogQueueSettings = Field(default_factory=LogQueueSettings)
+    log_sampling: LogSamplingSettings = Field(default_factory=LogSamplingSettings)
 
     db: DatabaseSettings
     engine: EngineSettings = Field(default_factory=EngineSettings)
+    server: ServerSettings = Field(default_factory=ServerSettings)
     session_maker: SessionMakerSettings = Field(default_factory=SessionMakerSettings)
+    admission: AdmissionSettings = Field(default_factory=AdmissionSettings)
+    health: HealthSettings = Field(default_factory=HealthSettings)
+    shutdown: ShutdownSettings = Field(default_factory=ShutdownSettings)
+    transaction_retry: TransactionRetrySettings = Field(default_factory=TransactionRetrySettings)
+    group_commit: GroupCommitSettings = Field(default_factory=GroupCommitSettings)
+    slow_query: SlowQuerySettings = Field(default_factory=SlowQuerySettings)
+    organization_write: OrganizationWriteSettings = Field(default_factory=OrganizationWriteSettings)
+    idempotency: IdempotencySettings = Field(default_factory=IdempotencySettings)
+    name_availability: NameAvailabilitySettings = Field(default_factory=NameAvailabilitySettings)
+    organization_read: OrganizationReadSettings = Field(default_factory=OrganizationReadSettings)
 
     def __init__(self, **values: Any) -> None:
         super().__init__(**values)
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from fastapi import Request
+
+from pet.domain.models import IdempotencyRecord
+from pet.infra.cache import CachedResponse, TTLCache
+
+type IdempotencyCache = TTLCache[tuple[str, str], IdempotencyRecord]
+type NameAvailabilityCache = TTLCache[str, bool]
+type OrganizationResponseCache = TTLCache[UUID, CachedResponse]
+
+
+def get_idempotency_cache(r: Request) -> IdempotencyCache:
+    return r.app.state.idempotency_cache
+
+
+def get_name_availability_cache(r: Request) -> NameAvailabilityCache:
+    return r.app.state.name_availability_cache
+
+
+def get_organization_response_cache(r: Request) -> OrganizationResponseCache:
+    return r.app.state.organization_response_cache
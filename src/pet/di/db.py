@@ -1,27 +1,80 @@
 from collections.abc import Callable
-from typing import Annotated
+from typing import Annotated, Final
 
 from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from pet.app.transaction_executor import TransactionExecutor
+from pet.app.admission import AdmissionController
+from pet.app.drain import DrainController
+from pet.app.transaction_executor import GroupCommitter, RetryPolicy, TransactionExecutor
+from pet.config.settings import OrganizationsRepoKind, Settings
 from pet.domain.uow import UnitOfWork
-from pet.infra.sqla.db.repos import SQLAlchemyOrganizationsRepo
-from pet.infra.sqla.uow import SQLAlchemyUnitOfWork
+from pet.infra.sqla.db.repos import (
+    SQLAlchemyCoreOrganizationsRepo,
+    SQLAlchemyIdempotencyRepo,
+    SQLAlchemyOrganizationsRepo,
+)
+from pet.infra.sqla.uow import OrganizationRepoFactory, SQLAlchemyUnitOfWork
 
+ORGANIZATIONS_REPO_FACTORIES: Final[dict[OrganizationsRepoKind, OrganizationRepoFactory]] = {
+    "orm": SQLAlchemyOrganizationsRepo,
+    "core": SQLAlchemyCoreOrganizationsRepo,
+}
 
-def get_uow_factory(r: Request) -> Callable[[], UnitOfWork]:
-    sf = r.app.state.session_factory
 
+def build_uow_factory(
+    sf: async_sessionmaker[AsyncSession],
+    orgs_repo_factory: OrganizationRepoFactory = SQLAlchemyOrganizationsRepo,
+) -> Callable[[], UnitOfWork]:
     def factory() -> UnitOfWork:
         return SQLAlchemyUnitOfWork(
             session_factory=sf,
-            orgs_repo_factory=SQLAlchemyOrganizationsRepo,
+            orgs_repo_factory=orgs_repo_factory,
+            idempotency_repo_factory=SQLAlchemyIdempotencyRepo,
         )
 
     return factory
 
 
+def build_app_uow_factory(
+    sf: async_sessionmaker[AsyncSession], settings: Settings
+) -> Callable[[], UnitOfWork]:
+    return build_uow_factory(
+        sf, ORGANIZATIONS_REPO_FACTORIES[settings.organization_write.repository]
+    )
+
+
+def get_uow_factory(r: Request) -> Callable[[], UnitOfWork]:
+    return build_app_uow_factory(r.app.state.session_factory, r.app.state.settings)
+
+
+def get_group_committer(r: Request) -> GroupCommitter | None:
+    return getattr(r.app.state, "group_committer", None)
+
+
+def get_retry_policy(r: Request) -> RetryPolicy:
+    return r.app.state.retry_policy
+
+
+def get_admission(r: Request) -> AdmissionController | None:
+    return r.app.state.admission
+
+
+def get_drain(r: Request) -> DrainController | None:
+    return getattr(r.app.state, "drain", None)
+
+
 def get_executor(
     uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
+    group_committer: Annotated[GroupCommitter | None, Depends(get_group_committer)],
+    retry_policy: Annotated[RetryPolicy, Depends(get_retry_policy)],
+    admission: Annotated[AdmissionController | None, Depends(get_admission)],
+    drain: Annotated[DrainController | None, Depends(get_drain)],
 ) -> TransactionExecutor:
-    return TransactionExecutor(uow_factory=uow_factory)
+    return TransactionExecutor(
+        uow_factory=uow_factory,
+        group_committer=group_committer,
+        retry_policy=retry_policy,
+        admission=admission,
+        drain=drain,
+    )
@@ -0,0 +1,7 @@
+from fastapi import Request
+
+from pet.config.settings import Settings
+
+
+def get_app_settings(r: Request) -> Settings:
+    return r.app.state.settings
@@ -7,3 +7,16 @@ class ValidationError(ValueError):
 
 class NameValidationError(ValidationError):
     pass
+
+
+class IdempotencyKeyReusedError(ValidationError):
+    def __init__(
+        self,
+        message: str = "Idempotency-Key was already used with a different request payload",
+    ) -> None:
+        super().__init__(message, cause="idempotency_key")
+
+
+class InvalidCursorError(ValidationError):
+    def __init__(self, message: str = "Cursor is malformed") -> None:
+        super().__init__(message, cause="cursor")
@@ -1,13 +1,20 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Self
 
 from pet.domain.value_objects import Name, PublicId
 
+IDEMPOTENCY_KEY_MAX_LEN: int = 255
+
 
 @dataclass(slots=True, frozen=True)
 class Organization:
     public_id: PublicId
     name: Name = field(compare=False)
+    id: int | None = field(default=None, compare=False)
+    name_canonical: str | None = field(default=None, compare=False)
+    created_at: datetime | None = field(default=None, compare=False)
+    updated_at: datetime | None = field(default=None, compare=False)
 
     @classmethod
     def create(
@@ -19,3 +26,25 @@ class Organization:
             public_id=public_id,
             name=name,
         )
+
+
+@dataclass(slots=True, frozen=True)
+class IdempotencyRecord:
+    scope: str
+    key: str
+    request_hash: str
+    public_id: PublicId
+
+
+@dataclass(slots=True, frozen=True)
+class OrganizationCursor:
+    """Keyset position of an organization in the ``(created_at, id)`` listing order."""
+
+    created_at: datetime
+    id: int
+
+
+@dataclass(slots=True, frozen=True)
+class OrganizationPage:
+    items: tuple[Organization, ...]
+    next_cursor: OrganizationCursor | None = None
@@ -1,7 +1,29 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import timedelta
 from typing import Protocol
 
-from pet.domain.models import Organization
+from pet.domain.models import (
+    IdempotencyRecord,
+    Organization,
+    OrganizationCursor,
+    OrganizationPage,
+)
+from pet.domain.value_objects import PublicId
 
 
 class OrganizationsRepo(Protocol):
-    def create(self, org: Organization) -> None: ...
+    async def create(self, org: Organization) -> Organization: ...
+    async def create_many(self, orgs: Sequence[Organization]) -> set[PublicId]: ...
+    async def exists_by_canonical_name(self, name_canonical: str) -> bool: ...
+    async def get_by_public_id(self, public_id: PublicId) -> Organization | None: ...
+    async def search_by_canonical_name(self, term: str, limit: int) -> list[Organization]: ...
+    def stream_all(self, batch_size: int) -> AsyncIterator[Organization]: ...
+    async def list_page(
+        self, limit: int, after: OrganizationCursor | None = None
+    ) -> OrganizationPage: ...
+
+
+class IdempotencyRepo(Protocol):
+    async def get(self, scope: str, key: str) -> IdempotencyRecord | None: ...
+    async def save(self, record: IdempotencyRecord, ttl: timedelta) -> IdempotencyRecord | None: ...
+    async def purge_expired(self, limit: int) -> int: ...
@@ -1,13 +1,16 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 from typing import Concatenate, Protocol, Self
 
-from pet.domain.repos import OrganizationsRepo
+from pet.domain.repos import IdempotencyRepo, OrganizationsRepo
 
 
 class UnitOfWork(Protocol):
     @property
     def orgs(self) -> OrganizationsRepo: ...
+    @property
+    def idempotency(self) -> IdempotencyRepo: ...
 
     async def __aenter__(self) -> Self: ...
     async def __aexit__(
@@ -21,6 +24,8 @@ class UnitOfWork(Protocol):
     async def rollback(self) -> None: ...
     async def flush(self) -> None: ...
     async def refresh(self, obj: object, attrs: list[str] | None = None) -> None: ...
+    async def set_read_only(self) -> None: ...
+    def savepoint(self) -> AbstractAsyncContextManager[None]: ...
 
 
 class TransactionExecutorProtocol(Protocol):
@@ -32,3 +37,17 @@ class TransactionExecutorProtocol(Protocol):
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> T: ...
+
+    async def run_grouped[T, **P](
+        self,
+        handler: Callable[Concatenate[UnitOfWork, P], Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T: ...
+
+    def stream[T, **P](
+        self,
+        handler: Callable[Concatenate[UnitOfWork, P], AsyncIterator[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[T]: ...
@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A response body serialized once, together with its validators."""
+
+    body: bytes
+    etag: str
+    last_modified: str
+
+    @property
+    def validator_headers(self) -> dict[str, str]:
+        return {"ETag": self.etag, "Last-Modified": self.last_modified}
+
+
+class TTLCache[K, V]:
+    """Bounded LRU cache whose entries also expire after a fixed TTL.
+
+    Not thread-safe: it is meant to be owned by one event loop, where every
+    operation runs to completion without interleaving.
+
+    A value read from the source before a change can arrive after the change
+    invalidated its key. Reading ``generation`` before the source and passing it
+    to ``set`` drops such a value instead of caching it.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every ``invalidate`` and ``clear``."""
+        return self._generation
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, *, generation: int | None = None) -> None:
+        if generation is not None and generation != self._generation:
+            return
+
+        self._entries[key] = (self._clock() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,201 @@
+"""Readiness computed in the background, so probes never touch the database.
+
+``HealthMonitor`` checks database connectivity, pool saturation and event loop
+lag every ``interval_s`` and keeps the result. ``/readyz`` only reads it, so
+any number of probers cost one ``SELECT 1`` per interval in total. A result
+older than ``stale_after_s`` counts as not ready: it means the monitor itself
+is stuck, which is usually the event loop.
+
+Pool saturation is only reported by default: a burst that checks out every
+connection is normal under load, and failing readiness for it would take
+capacity away exactly when it is needed. While the pool is fully checked out
+the database check is skipped rather than queued behind the requests it would
+compete with, and ``db_ok`` is None.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from pet.config.logging import LogSampler, get_logger
+from pet.infra.metrics import DB_POOL_SATURATION, EVENT_LOOP_LAG
+from pet.infra.sqla.db.exc import DB_OPERATION_ERRORS
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class HealthSnapshot:
+    checked_at: float
+    db_ok: bool | None
+    pool_saturation: float | None
+    loop_lag_s: float
+    reasons: tuple[str, ...]
+
+    @property
+    def ready(self) -> bool:
+        return not self.reasons
+
+
+class HealthMonitor:
+    """Refreshes a ``HealthSnapshot`` every ``interval_s`` in a background task.
+
+    Not ready when the database check fails or takes longer than
+    ``check_timeout_s``, or when the loop woke up more than ``max_loop_lag_s``
+    late. Saturation of ``pool_capacity`` is exported and logged; it fails
+    readiness only when ``max_pool_saturation`` is set and reached on
+    ``pool_saturation_checks`` checks in a row.
+
+    Each interval also has ``log_sampler`` report the log events it suppressed.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        interval_s: float = 1.0,
+        check_timeout_s: float = 0.5,
+        stale_after_s: float = 5.0,
+        pool_capacity: int | None = None,
+        max_pool_saturation: float | None = None,
+        pool_saturation_checks: int = 3,
+        max_loop_lag_s: float = 0.5,
+        log_sampler: LogSampler | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        if stale_after_s <= interval_s:
+            raise ValueError("stale_after_s must be longer than interval_s")
+        if pool_saturation_checks < 1:
+            raise ValueError("pool_saturation_checks must be at least 1")
+
+        self._engine = engine
+        self._interval_s = interval_s
+        self._check_timeout_s = check_timeout_s
+        self._stale_after_s = stale_after_s
+        self._pool_capacity = pool_capacity
+        self._max_pool_saturation = max_pool_saturation
+        self._pool_saturation_checks = pool_saturation_checks
+        self._max_loop_lag_s = max_loop_lag_s
+        self._log_sampler = log_sampler
+        self._clock = clock
+
+        self._snapshot: HealthSnapshot | None = None
+        self._saturated_checks = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def snapshot(self) -> HealthSnapshot | None:
+        return self._snapshot
+
+    def is_ready(self) -> bool:
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.ready:
+            return False
+        return self._clock() - snapshot.checked_at <= self._stale_after_s
+
+    async def start(self) -> None:
+        """Take the first snapshot, then keep refreshing it in the background."""
+        await self.refresh()
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def refresh(self, loop_lag_s: float = 0.0) -> HealthSnapshot:
+        reasons: list[str] = []
+
+        pool_saturation = self._pool_saturation()
+        if pool_saturation is not None:
+            DB_POOL_SATURATION.set(pool_saturation)
+            if self._saturation_sustained(pool_saturation):
+                reasons.append("pool_saturated")
+
+        db_ok: bool | None = None
+        if pool_saturation is None or pool_saturation < 1.0:
+            db_ok = await self._check_db()
+            if not db_ok:
+                reasons.append("db_unavailable")
+
+        EVENT_LOOP_LAG.set(loop_lag_s)
+        if loop_lag_s > self._max_loop_lag_s:
+            reasons.append("event_loop_lag")
+
+        snapshot = HealthSnapshot(
+            checked_at=self._clock(),
+            db_ok=db_ok,
+            pool_saturation=pool_saturation,
+            loop_lag_s=loop_lag_s,
+            reasons=tuple(reasons),
+        )
+        previous, self._snapshot = self._snapshot, snapshot
+
+        if previous is not None and previous.reasons != snapshot.reasons:
+            logger.warning(
+                "readiness_changed",
+                ready=snapshot.ready,
+                reasons=snapshot.reasons,
+                pool_saturation=pool_saturation,
+                loop_lag_ms=round(loop_lag_s * 1000, 2),
+            )
+        return snapshot
+
+    def _saturation_sustained(self, pool_saturation: float) -> bool:
+        threshold = 1.0 if self._max_pool_saturation is None else self._max_pool_saturation
+        if pool_saturation < threshold:
+            if self._saturated_checks:
+                logger.info("pool_saturation_cleared", pool_saturation=pool_saturation)
+            self._saturated_checks = 0
+            return False
+
+        self._saturated_checks += 1
+        if self._saturated_checks == 1:
+            logger.warning(
+                "pool_saturated",
+                pool_saturation=pool_saturation,
+                max_pool_saturation=self._max_pool_saturation,
+            )
+        return (
+            self._max_pool_saturation is not None
+            and self._saturated_checks >= self._pool_saturation_checks
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            woke_at = loop.time() + self._interval_s
+            await asyncio.sleep(self._interval_s)
+            try:
+                await self.refresh(loop_lag_s=max(0.0, loop.time() - woke_at))
+            except Exception:
+                logger.exception("health_check_failed")
+            if self._log_sampler is not None:
+                self._log_sampler.report_suppressed()
+
+    def _pool_saturation(self) -> float | None:
+        pool = self._engine.sync_engine.pool
+        if self._pool_capacity is None or not isinstance(pool, QueuePool):
+            return None
+        return round(pool.checkedout() / self._pool_capacity, 3)
+
+    async def _check_db(self) -> bool:
+        try:
+            async with asyncio.timeout(self._check_timeout_s), self._engine.connect() as conn:
+                await conn.execute(sa.text("SELECT 1"))
+        except (*DB_OPERATION_ERRORS, TimeoutError):
+            return False
+        return True
@@ -0,0 +1,181 @@
+"""Prometheus metrics for HTTP requests, use cases, persistence errors, admission and the pool.
+
+Label children are resolved once per label combination and cached, so
+recording on the hot path is a dict lookup plus one uncontended in-process
+increment. All recording happens on the event loop thread.
+
+With ``PROMETHEUS_MULTIPROC_DIR`` set in the environment before the workers
+start, every worker writes its values to memory-mapped files in that directory
+and ``/metrics`` aggregates them, whichever worker serves the scrape.
+Collectors of per-process state, registered with ``register_process_collector``,
+cannot be written to those files; they are rendered from the worker that
+serves the scrape, with a ``pid`` label.
+"""
+
+import os
+from functools import cache
+from typing import Final
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.registry import Collector
+
+METRICS_CONTENT_TYPE: Final = CONTENT_TYPE_LATEST
+MULTIPROC_DIR_ENV: Final = "PROMETHEUS_MULTIPROC_DIR"
+
+UNMATCHED_ROUTE: Final = "unmatched"
+
+_PROCESS_COLLECTORS: Final[list[Collector]] = []
+_KNOWN_METHODS: Final = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"})
+
+HTTP_REQUEST_DURATION: Final = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ("method", "route", "status"),
+)
+USE_CASE_DURATION: Final = Histogram(
+    "use_case_duration_seconds",
+    "Unit of work latency by use case handler and outcome.",
+    ("use_case_handler", "outcome"),
+)
+PERSISTENCE_ERRORS: Final = Counter(
+    "persistence_errors",
+    "Database errors classified by determine_exc, by PersistenceErrorKind.",
+    ("kind",),
+)
+ADMISSION_IN_FLIGHT: Final = Gauge(
+    "admission_in_flight",
+    "Units of work currently admitted.",
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DEPTH: Final = Gauge(
+    "admission_queue_depth",
+    "Callers waiting for admission.",
+    multiprocess_mode="livesum",
+)
+ADMISSION_WAIT: Final = Histogram(
+    "admission_wait_seconds",
+    "Time admitted callers spent waiting for a slot.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+ADMISSION_REJECTED: Final = Counter(
+    "admission_rejected",
+    "Callers rejected by admission control, by reason.",
+    ("reason",),
+)
+
+EVENT_LOOP_LAG: Final = Gauge(
+    "event_loop_lag_seconds",
+    "How late the health monitor last woke up on the event loop.",
+    multiprocess_mode="livemax",
+)
+
+DB_POOL_SATURATION: Final = Gauge(
+    "db_pool_saturation",
+    "Share of pool_size + max_overflow checked out at the last health check.",
+    multiprocess_mode="livemax",
+)
+
+DB_POOL_CHECKED_OUT: Final = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW_IN_USE: Final = Gauge(
+    "db_pool_overflow_in_use",
+    "Checked out connections beyond pool_size, i.e. taken from max_overflow.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT: Final = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent getting a connection from the pool, including opening a new one.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_CONNECTION_AGE: Final = Histogram(
+    "db_pool_connection_age_seconds",
+    "Age of connections when they are checked out.",
+    buckets=(1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0, 86400.0),
+)
+DB_POOL_CONNECTIONS_OPENED: Final = Counter(
+    "db_pool_connections_opened",
+    "New database connections opened by the pool.",
+)
+DB_POOL_INVALIDATIONS: Final = Counter(
+    "db_pool_invalidations",
+    "Pooled connections invalidated, by kind (hard or soft).",
+    ("kind",),
+)
+
+
+@cache
+def _http_request_duration(method: str, route: str, status: int) -> Histogram:
+    return HTTP_REQUEST_DURATION.labels(method, route, str(status))
+
+
+@cache
+def _use_case_duration(use_case_handler: str, outcome: str) -> Histogram:
+    return USE_CASE_DURATION.labels(use_case_handler, outcome)
+
+
+@cache
+def _persistence_errors(kind: str) -> Counter:
+    return PERSISTENCE_ERRORS.labels(kind)
+
+
+@cache
+def _admission_rejected(reason: str) -> Counter:
+    return ADMISSION_REJECTED.labels(reason)
+
+
+def observe_http_request(method: str, route: str, status: int, duration_s: float) -> None:
+    if method not in _KNOWN_METHODS:
+        method = "other"
+    _http_request_duration(method, route, status).observe(duration_s)
+
+
+def observe_use_case(use_case_handler: str, outcome: str, duration_s: float) -> None:
+    _use_case_duration(use_case_handler, outcome).observe(duration_s)
+
+
+def count_persistence_error(kind: str) -> None:
+    _persistence_errors(kind).inc()
+
+
+def count_admission_rejected(reason: str) -> None:
+    _admission_rejected(reason).inc()
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def register_process_collector(collector: Collector) -> None:
+    """Register a collector of this process's own state, also for multiprocess mode."""
+    REGISTRY.register(collector)
+    _PROCESS_COLLECTORS.append(collector)
+
+
+def render_latest() -> bytes:
+    """Render every metric in the Prometheus text format."""
+    if not is_multiprocess():
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    for collector in _PROCESS_COLLECTORS:
+        registry.register(collector)
+    return generate_latest(registry)
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drop the live gauges of an exited worker in multiprocess mode."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
@@ -1,10 +1,50 @@
-from sqlalchemy import URL
+import re
+from typing import Any, Final
+from uuid import uuid4
+
+from sqlalchemy import URL, event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
+
+from pet.infra.sqla.db.pool import InstrumentedAsyncQueuePool, instrument_pool
+
+# Statements whose effect outlives the transaction. Behind PgBouncer in
+# transaction mode it would stick to a server connection other clients get next.
+_SESSION_STATE_STATEMENT: Final = re.compile(
+    r"^\s*(?:SET(?!\s+(?:LOCAL|TRANSACTION|CONSTRAINTS)\b)|RESET|LISTEN|UNLISTEN|PREPARE|DEALLOCATE|LOAD)\b",
+    re.IGNORECASE,
+)
+
+
+class SessionStateError(RuntimeError):
+    """A statement would leave session state on a connection shared through PgBouncer."""
+
+
+def _prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+def _reject_session_state(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if _SESSION_STATE_STATEMENT.match(statement):
+            command = " ".join(statement.split()[:2])
+            raise SessionStateError(
+                f"{command!r} sets session state, which PgBouncer transaction pooling "
+                "would leak to other clients"
+            )
 
 
 def create_engine(
@@ -13,14 +53,46 @@ def create_engine(
     pool_size: int = 10,
     max_overflow: int = 20,
     pool_pre_ping: bool = True,
+    pgbouncer_transaction_mode: bool = False,
+    null_pool: bool = False,
 ) -> AsyncEngine:
-    return create_async_engine(
+    """Create the application engine.
+
+    With ``pgbouncer_transaction_mode`` every transaction may run on a different
+    server connection: asyncpg's statement caches are off, prepared statements
+    get unique names, and statements that set session state are rejected.
+    ``null_pool`` opens a connection per checkout instead of keeping a local pool.
+    """
+    pool_kwargs: dict[str, Any]
+    if null_pool:
+        pool_kwargs = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+        }
+
+    connect_args: dict[str, Any] = {}
+    if pgbouncer_transaction_mode:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _prepared_statement_name,
+        }
+
+    engine = create_async_engine(
         url=url,
         echo=echo,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
         pool_pre_ping=pool_pre_ping,
+        connect_args=connect_args,
+        **pool_kwargs,
     )
+    # A null pool keeps no connections, so every checked-out one counts as overflow.
+    instrument_pool(engine.sync_engine.pool, pool_size=0 if null_pool else pool_size)
+    if pgbouncer_transaction_mode:
+        _reject_session_state(engine)
+    return engine
 
 
 def create_session_maker(
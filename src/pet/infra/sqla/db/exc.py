@@ -1,6 +1,6 @@
 import enum
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from sqlalchemy.exc import (
     DBAPIError,
@@ -22,6 +22,7 @@ from pet.app.errors import (
     ServiceUnavailable,
     UnprocessableEntity,
 )
+from pet.infra.metrics import count_persistence_error
 
 
 class PersistenceErrorKind(enum.StrEnum):
@@ -107,9 +108,23 @@ def pg_column_name_from_integrity(err: Exception) -> str | None:
 
 type DBDriverError = SQLAlchemyError | OSError
 
+DB_OPERATION_ERRORS: Final = (SQLAlchemyError, OSError)
+
+# Class 40 "transaction rollback": the server has already rolled the transaction
+# back, so running it again from the start is safe.
+TRANSACTION_ROLLBACK_SQLSTATES: Final[dict[str, str]] = {
+    "40001": "db_serialization_failure",
+    "40P01": "db_deadlock",
+}
+
 
 def determine_exc(e: DBDriverError) -> PersistenceError:
+    error = _classify(e)
+    count_persistence_error(error.kind)
+    return error
+
 
+def _classify(e: DBDriverError) -> PersistenceError:
     if isinstance(e, IntegrityError):
         kind_map: dict[str, PersistenceErrorKind] = {
             "23505": PersistenceErrorKind.UNIQUE,
@@ -139,6 +154,17 @@ def determine_exc(e: DBDriverError) -> PersistenceError:
             cause=e,
         )
 
+    if isinstance(e, DBAPIError):
+        sqlstate = pg_sqlstate_from_dbapi(e)
+        if sqlstate in TRANSACTION_ROLLBACK_SQLSTATES:
+            return PersistenceError(
+                kind=PersistenceErrorKind.TRANSIENT,
+                title=TRANSACTION_ROLLBACK_SQLSTATES[sqlstate],
+                sqlstate=sqlstate,
+                retryable=True,
+                cause=e,
+            )
+
     if isinstance(e, OperationalError):
         return PersistenceError(
             kind=PersistenceErrorKind.OPERATIONAL,
@@ -200,6 +226,13 @@ def translate_db_error(error: PersistenceError) -> AppError:
                     detail="Organization name is already taken",
                     extra=extra,
                 )
+            if error.constraint_name == "pk_idempotency_keys":
+                return Conflict(
+                    title="Conflict",
+                    code=AppErrorCode.IDEMPOTENCY_KEY_IN_USE,
+                    detail="Idempotency key is already in use by another request",
+                    extra=extra,
+                )
             return Conflict(
                 title="Conflict",
                 code=AppErrorCode.CONFLICT,
@@ -12,9 +12,12 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from pet.domain.models import IDEMPOTENCY_KEY_MAX_LEN
 from pet.domain.value_objects import ORG_NAME_MAX_LEN, ORG_NAME_MIN_LEN
 from pet.infra.sqla.db.base import Base
 
+IDEMPOTENCY_SCOPE_MAX_LEN = 64
+
 ORG_NAME_CANONICAL_SQL = 'normalize(casefold(normalize(name, NFC) COLLATE "pg_unicode_fast"), NFC)'
 
 
@@ -88,6 +91,13 @@ class Organization(Base, IdMixin, TimestampMixin):
 
     __table_args__ = (
         sa.UniqueConstraint("name_canonical", name="uq_organizations_name_canonical"),
+        sa.Index("ix_organizations_created_at_id", "created_at", "id"),
+        sa.Index(
+            "ix_organizations_name_canonical_trgm",
+            "name_canonical",
+            postgresql_using="gin",
+            postgresql_ops={"name_canonical": "gin_trgm_ops"},
+        ),
         sa.CheckConstraint(
             "name = btrim(name)",
             name="name_trimmed",
@@ -205,3 +215,21 @@ class Task(Base, IdMixin, TimestampMixin):
         sa.Index("ix_tasks_assignee_user_id", "assignee_user_id"),
         sa.Index("ix_tasks_status", "status"),
     )
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    scope: Mapped[str] = mapped_column(String(IDEMPOTENCY_SCOPE_MAX_LEN), primary_key=True)
+    key: Mapped[str] = mapped_column(String(IDEMPOTENCY_KEY_MAX_LEN), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    public_id: Mapped[uuid.UUID] = mapped_column(sa.Uuid(as_uuid=True), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (sa.Index("ix_idempotency_keys_expires_at", "expires_at"),)
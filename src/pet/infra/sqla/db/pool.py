@@ -0,0 +1,105 @@
+"""Connection pool instrumentation.
+
+SQLAlchemy has no event for the start of a checkout, so the wait is timed
+around ``_do_get`` in a pool subclass; everything else comes from pool events.
+The wait is also added to the ``PoolWait`` of the current unit of work, which
+the executor reports as ``pool_wait_ms``. Checkouts run in a greenlet that
+shares the caller's context, so the context variable is visible there.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+from pet.infra.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTION_AGE,
+    DB_POOL_CONNECTIONS_OPENED,
+    DB_POOL_INVALIDATIONS,
+    DB_POOL_OVERFLOW_IN_USE,
+)
+
+_CONNECTED_AT: Final = "pet_connected_at"
+
+
+@dataclass(slots=True)
+class PoolWait:
+    seconds: float = 0.0
+
+    @property
+    def ms(self) -> float:
+        return round(self.seconds * 1000, 2)
+
+
+_current_pool_wait: ContextVar[PoolWait | None] = ContextVar("pool_wait", default=None)
+
+
+@contextmanager
+def track_pool_wait() -> Iterator[PoolWait]:
+    """Accumulate the pool checkout wait of every connection taken inside the block."""
+    pool_wait = PoolWait()
+    token = _current_pool_wait.set(pool_wait)
+    try:
+        yield pool_wait
+    finally:
+        _current_pool_wait.reset(token)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait_s = time.perf_counter() - started_at
+            DB_POOL_CHECKOUT_WAIT.observe(wait_s)
+            pool_wait = _current_pool_wait.get()
+            if pool_wait is not None:
+                pool_wait.seconds += wait_s
+
+
+def instrument_pool(pool: Pool, *, pool_size: int) -> None:
+    """Publish checked-out, overflow, connection age and invalidation metrics for ``pool``."""
+    checked_out = 0
+
+    def publish() -> None:
+        DB_POOL_CHECKED_OUT.set(checked_out)
+        DB_POOL_OVERFLOW_IN_USE.set(max(0, checked_out - pool_size))
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        record.info[_CONNECTED_AT] = time.monotonic()
+        DB_POOL_CONNECTIONS_OPENED.inc()
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any) -> None:
+        nonlocal checked_out
+        checked_out += 1
+        publish()
+
+        connected_at = record.info.get(_CONNECTED_AT)
+        if connected_at is not None:
+            DB_POOL_CONNECTION_AGE.observe(time.monotonic() - connected_at)
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        nonlocal checked_out
+        checked_out = max(0, checked_out - 1)
+        publish()
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any) -> None:
+        DB_POOL_INVALIDATIONS.labels("hard").inc()
+
+    @event.listens_for(pool, "soft_invalidate")
+    def on_soft_invalidate(
+        dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any
+    ) -> None:
+        DB_POOL_INVALIDATIONS.labels("soft").inc()
@@ -0,0 +1,256 @@
+"""Per-statement timing, slow query log and top-N fingerprints by total time.
+
+Every statement is timed with ``before_cursor_execute``/``after_cursor_execute``
+and folded into a fingerprint: literals and bind parameters become ``?`` and
+``IN``/``VALUES`` lists collapse, so calls that differ only in values share one
+entry. Statements slower than the threshold are logged as ``slow_query``; the
+log line carries the bound ``request_id`` and ``use_case_handler`` like every
+other one. With ``explain`` on, a slow plain ``SELECT`` is run again under
+``EXPLAIN (ANALYZE, BUFFERS)`` and the plan is logged too. That executes the
+query a second time, so it is meant for debugging only, and it is never done
+for writes or server-side cursors.
+"""
+
+import hashlib
+import os
+import re
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final
+
+from prometheus_client.core import CounterMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pet.config.logging import get_logger
+from pet.infra.metrics import is_multiprocess, register_process_collector
+
+logger = get_logger(__name__)
+
+MAX_FINGERPRINTS: Final = 1000
+METRICS_TOP_N: Final = 20
+_STATEMENT_LOG_MAX_LEN: Final = 2000
+_STARTED_AT: Final = "pet_query_started_at"
+_EXPLAIN_SAVEPOINT: Final = "pet_explain"
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PARAMS = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_NUMBERS = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_CASTS = re.compile(r"\?::\w+(?:\[\])?")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_ROWS = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so that calls differing only in values compare equal."""
+    normalized = _COMMENTS.sub(" ", statement)
+    normalized = _STRINGS.sub("?", normalized)
+    normalized = _PARAMS.sub("?", normalized)
+    normalized = _NUMBERS.sub("?", normalized)
+    normalized = _CASTS.sub("?", normalized)
+    normalized = _LISTS.sub("(?)", normalized)
+    normalized = _VALUES_ROWS.sub(r"\1", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@lru_cache(maxsize=2048)
+def fingerprint_id(fingerprint_: str) -> str:
+    return hashlib.sha1(fingerprint_.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+@dataclass(slots=True)
+class FingerprintStats:
+    fingerprint: str
+    calls: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    @property
+    def id(self) -> str:
+        return fingerprint_id(self.fingerprint)
+
+
+class QueryStats:
+    """In-process aggregate of statement time per fingerprint.
+
+    Holds at most ``max_fingerprints`` entries; when a new fingerprint arrives
+    at capacity, the one with the least total time is dropped.
+    """
+
+    def __init__(self, max_fingerprints: int = MAX_FINGERPRINTS) -> None:
+        if max_fingerprints < 1:
+            raise ValueError("max_fingerprints must be positive")
+
+        self._max_fingerprints = max_fingerprints
+        self._entries: dict[str, FingerprintStats] = {}
+
+    def record(self, fingerprint_: str, duration_s: float) -> None:
+        entry = self._entries.get(fingerprint_)
+        if entry is None:
+            if len(self._entries) >= self._max_fingerprints:
+                coldest = min(self._entries.values(), key=lambda e: e.total_s)
+                del self._entries[coldest.fingerprint]
+            entry = self._entries[fingerprint_] = FingerprintStats(fingerprint_)
+
+        entry.calls += 1
+        entry.total_s += duration_s
+        entry.max_s = max(entry.max_s, duration_s)
+
+    def top(self, n: int) -> list[FingerprintStats]:
+        return sorted(self._entries.values(), key=lambda e: e.total_s, reverse=True)[:n]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+QUERY_STATS: Final = QueryStats()
+
+
+class _TopQueriesCollector(Collector):
+    """Exports the current top fingerprints; labels stay bounded by ``METRICS_TOP_N``.
+
+    With several workers each scrape sees only the worker that served it, so the
+    ``pid`` label keeps their counters apart.
+    """
+
+    def collect(self) -> Iterator[CounterMetricFamily]:
+        labels: tuple[str, ...] = ("fingerprint_id",)
+        process: tuple[str, ...] = ()
+        if is_multiprocess():
+            labels, process = (*labels, "pid"), (str(os.getpid()),)
+
+        seconds = CounterMetricFamily(
+            "db_query_fingerprint_seconds",
+            "Total statement time of the top fingerprints in this process.",
+            labels=labels,
+        )
+        calls = CounterMetricFamily(
+            "db_query_fingerprint_calls",
+            "Statement executions of the top fingerprints in this process.",
+            labels=labels,
+        )
+        for entry in QUERY_STATS.top(METRICS_TOP_N):
+            seconds.add_metric((entry.id, *process), entry.total_s)
+            calls.add_metric((entry.id, *process), entry.calls)
+        yield seconds
+        yield calls
+
+
+register_process_collector(_TopQueriesCollector())
+
+
+def _explainable(statement: str, context: ExecutionContext | None, executemany: bool) -> bool:
+    if executemany or statement.lstrip()[:6].upper() != "SELECT":
+        return False
+    return not (context is not None and context.execution_options.get("stream_results"))
+
+
+def _explain(conn: Connection, statement: str, parameters: Any) -> list[str] | None:
+    # Runs on the raw DBAPI cursor so it is not timed itself; the savepoint keeps
+    # a failing EXPLAIN from aborting the caller's transaction.
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = [row[0] for row in cursor.fetchall()]
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            raise
+        cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        return plan
+    except Exception:
+        logger.warning("slow_query_explain_failed", exc_info=True)
+        return None
+    finally:
+        cursor.close()
+
+
+def instrument_queries(
+    engine: AsyncEngine,
+    *,
+    slow_threshold_s: float,
+    explain: bool = False,
+    stats: QueryStats = QUERY_STATS,
+) -> None:
+    """Time every statement of ``engine`` into ``stats`` and log the slow ones."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started = conn.info.get(_STARTED_AT)
+        if not started:
+            return
+
+        duration_s = time.perf_counter() - started.pop()
+        fingerprint_ = fingerprint(statement)
+        stats.record(fingerprint_, duration_s)
+
+        if duration_s < slow_threshold_s:
+            return
+
+        plan = None
+        if explain and _explainable(statement, context, executemany):
+            plan = _explain(conn, statement, parameters)
+
+        logger.warning(
+            "slow_query",
+            duration_ms=round(duration_s * 1000, 2),
+            fingerprint_id=fingerprint_id(fingerprint_),
+            fingerprint=fingerprint_,
+            statement=statement[:_STATEMENT_LOG_MAX_LEN],
+            executemany=executemany,
+            plan=plan,
+        )
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context: Any) -> None:
+        # A failed statement never reaches after_cursor_execute.
+        connection = exception_context.connection
+        if connection is not None:
+            started = connection.info.get(_STARTED_AT)
+            if started:
+                started.pop()
+
+
+def log_top_queries(n: int, stats: QueryStats = QUERY_STATS) -> None:
+    logger.info(
+        "query_stats_top",
+        fingerprints=[
+            {
+                "fingerprint_id": entry.id,
+                "fingerprint": entry.fingerprint,
+                "calls": entry.calls,
+                "total_ms": round(entry.total_s * 1000, 2),
+                "max_ms": round(entry.max_s * 1000, 2),
+            }
+            for entry in stats.top(n)
+        ],
+    )
@@ -1,16 +1,188 @@
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import replace
+from datetime import timedelta
+from typing import cast
+
+from sqlalchemy import Table, delete, exists, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pet.domain.models import IdempotencyRecord, OrganizationCursor, OrganizationPage
 from pet.domain.models import Organization as Domain
+from pet.domain.value_objects import Name, PublicId
+from pet.infra.sqla.db.exc import (
+    DB_OPERATION_ERRORS,
+    PersistenceError,
+    PersistenceErrorKind,
+    determine_exc,
+)
+from pet.infra.sqla.db.models import IdempotencyKey
 from pet.infra.sqla.db.models import Organization as ORM
 
+ORG_NAME_CANONICAL_CONSTRAINT = "uq_organizations_name_canonical"
+IDEMPOTENCY_KEYS_PK_CONSTRAINT = "pk_idempotency_keys"
+
+_ORGANIZATIONS = cast(Table, ORM.__table__)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class SQLAlchemyOrganizationsRepo:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def create(self, org: Domain) -> None:
+    async def create(self, org: Domain) -> Domain:
+        """Stage the organization in the session; it is inserted on the next flush.
+
+        Server-generated fields are not loaded, the input is returned as is.
+        """
         orm = SQLAlchemyOrganizationsRepo._to_orm(org)
         self._session.add(orm)
+        return org
+
+    async def create_many(self, orgs: Sequence[Domain]) -> set[PublicId]:
+        """Insert all organizations in one statement, skipping taken canonical names.
+
+        Returns the public ids of the rows that were actually inserted.
+        """
+        if not orgs:
+            return set()
+
+        stmt = (
+            insert(ORM)
+            .values([{"public_id": org.public_id.value, "name": org.name.value} for org in orgs])
+            .on_conflict_do_nothing(constraint=ORG_NAME_CANONICAL_CONSTRAINT)
+            .returning(ORM.public_id)
+        )
+
+        try:
+            result = await self._session.execute(stmt)
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        return {PublicId.create(public_id) for public_id in result.scalars()}
+
+    async def exists_by_canonical_name(self, name_canonical: str) -> bool:
+        stmt = select(exists().where(ORM.name_canonical == name_canonical))
+
+        try:
+            return bool(await self._session.scalar(stmt))
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+    async def get_by_public_id(self, public_id: PublicId) -> Domain | None:
+        stmt = select(ORM.name, ORM.created_at, ORM.updated_at).where(
+            ORM.public_id == public_id.value
+        )
+
+        try:
+            row = (await self._session.execute(stmt)).one_or_none()
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        if row is None:
+            return None
+
+        return Domain(
+            public_id=public_id,
+            name=Name.create(row.name),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    async def search_by_canonical_name(self, term: str, limit: int) -> list[Domain]:
+        """Prefix and trigram-similarity matches for an already canonicalized term.
+
+        Both predicates are served by the ``gin_trgm_ops`` index on
+        ``name_canonical``; prefix matches rank first, then by similarity.
+        """
+        is_prefix = ORM.name_canonical.like(f"{_escape_like(term)}%")
+        stmt = (
+            select(ORM.public_id, ORM.name)
+            .where(or_(is_prefix, ORM.name_canonical.op("%")(term)))
+            .order_by(
+                is_prefix.desc(),
+                func.similarity(ORM.name_canonical, term).desc(),
+                ORM.name_canonical,
+            )
+            .limit(limit)
+        )
+
+        try:
+            rows = (await self._session.execute(stmt)).all()
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        return [
+            Domain(public_id=PublicId.create(row.public_id), name=Name.create(row.name))
+            for row in rows
+        ]
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[Domain]:
+        """Yield every organization through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat no matter
+        how large the table is.
+        """
+        stmt = (
+            select(ORM.public_id, ORM.name, ORM.created_at, ORM.updated_at)
+            .order_by(ORM.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        try:
+            result = await self._session.stream(stmt)
+            async for row in result:
+                yield Domain(
+                    public_id=PublicId.create(row.public_id),
+                    name=Name.create(row.name),
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                )
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+    async def list_page(
+        self, limit: int, after: OrganizationCursor | None = None
+    ) -> OrganizationPage:
+        """Return up to ``limit`` organizations, newest first, strictly after ``after``.
+
+        Seeks on the ``(created_at, id)`` index instead of using OFFSET, so
+        the cost of a page does not depend on how deep it is.
+        """
+        stmt = (
+            select(ORM.id, ORM.public_id, ORM.name, ORM.created_at, ORM.updated_at)
+            .order_by(ORM.created_at.desc(), ORM.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(ORM.created_at, ORM.id) < (after.created_at, after.id))
+
+        try:
+            rows = (await self._session.execute(stmt)).all()
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = OrganizationCursor(created_at=last.created_at, id=last.id)
+
+        return OrganizationPage(
+            items=tuple(
+                Domain(
+                    public_id=PublicId.create(row.public_id),
+                    name=Name.create(row.name),
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                )
+                for row in rows
+            ),
+            next_cursor=next_cursor,
+        )
 
     @staticmethod
     def _to_orm(domain: Domain) -> ORM:
@@ -18,3 +190,129 @@ class SQLAlchemyOrganizationsRepo:
             public_id=domain.public_id.value,
             name=domain.name.value,
         )
+
+
+class SQLAlchemyCoreOrganizationsRepo(SQLAlchemyOrganizationsRepo):
+    """Writes organizations with Core statements instead of the ORM unit of work.
+
+    ``create`` runs a single ``INSERT ... RETURNING`` right away, bypassing the
+    identity map and flush, and returns the organization with its
+    server-generated fields. Constraint violations surface from ``create``
+    rather than from the commit.
+    """
+
+    async def create(self, org: Domain) -> Domain:
+        stmt = (
+            insert(_ORGANIZATIONS)
+            .values(public_id=org.public_id.value, name=org.name.value)
+            .returning(
+                _ORGANIZATIONS.c.id,
+                _ORGANIZATIONS.c.name_canonical,
+                _ORGANIZATIONS.c.created_at,
+                _ORGANIZATIONS.c.updated_at,
+            )
+        )
+
+        try:
+            row = (await self._session.execute(stmt)).one()
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        return replace(
+            org,
+            id=row.id,
+            name_canonical=row.name_canonical,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+
+class SQLAlchemyIdempotencyRepo:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, scope: str, key: str) -> IdempotencyRecord | None:
+        stmt = select(IdempotencyKey.request_hash, IdempotencyKey.public_id).where(
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.key == key,
+            IdempotencyKey.expires_at > func.now(),
+        )
+
+        try:
+            row = (await self._session.execute(stmt)).one_or_none()
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        if row is None:
+            return None
+
+        return IdempotencyRecord(
+            scope=scope,
+            key=key,
+            request_hash=row.request_hash,
+            public_id=PublicId.create(row.public_id),
+        )
+
+    async def save(self, record: IdempotencyRecord, ttl: timedelta) -> IdempotencyRecord | None:
+        """Store the record, taking over the key only if its previous record has expired.
+
+        Returns None once stored, or the live record of the request that owns
+        the key. A concurrent request that has not committed yet holds the row,
+        so the insert waits for it and then reads what it stored. If that
+        record is gone again by then, the key is reported like a primary key
+        violation.
+        """
+        stmt = insert(IdempotencyKey).values(
+            scope=record.scope,
+            key=record.key,
+            request_hash=record.request_hash,
+            public_id=record.public_id.value,
+            expires_at=func.now() + ttl,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint=IDEMPOTENCY_KEYS_PK_CONSTRAINT,
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "public_id": stmt.excluded.public_id,
+                "created_at": func.now(),
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=IdempotencyKey.expires_at <= func.now(),
+        ).returning(IdempotencyKey.key)
+
+        try:
+            saved = (await self._session.execute(stmt)).first()
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
+
+        if saved is not None:
+            return None
+
+        stored = await self.get(record.scope, record.key)
+        if stored is None:
+            raise PersistenceError(
+                kind=PersistenceErrorKind.UNIQUE,
+                title="db_integrity",
+                constraint_name=IDEMPOTENCY_KEYS_PK_CONSTRAINT,
+                table_name=IdempotencyKey.__tablename__,
+            )
+        return stored
+
+    async def purge_expired(self, limit: int) -> int:
+        """Delete up to ``limit`` expired records, skipping rows other transactions hold."""
+        expired = (
+            select(IdempotencyKey.scope, IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at <= func.now())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(IdempotencyKey)
+            .where(tuple_(IdempotencyKey.scope, IdempotencyKey.key).in_(expired))
+            .returning(IdempotencyKey.key)
+        )
+
+        try:
+            return len((await self._session.execute(stmt)).all())
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e) from e
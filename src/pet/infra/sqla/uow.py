@@ -1,34 +1,37 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from types import TracebackType
-from typing import Final, Self
+from typing import Self
 from uuid import uuid4
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from pet.config.logging import get_logger
-from pet.domain.repos import OrganizationsRepo
-from pet.infra.sqla.db.exc import UoWNotInitializedError, determine_exc
+from pet.domain.repos import IdempotencyRepo, OrganizationsRepo
+from pet.infra.sqla.db.exc import DB_OPERATION_ERRORS, UoWNotInitializedError, determine_exc
 
 type OrganizationRepoFactory = Callable[[AsyncSession], OrganizationsRepo]
+type IdempotencyRepoFactory = Callable[[AsyncSession], IdempotencyRepo]
 type AsyncSessionFactory = async_sessionmaker[AsyncSession]
 
 logger = get_logger(__name__)
 
-DB_OPERATION_ERRORS: Final = (SQLAlchemyError, OSError)
-
 
 class SQLAlchemyUnitOfWork:
     def __init__(
         self,
         session_factory: AsyncSessionFactory,
         orgs_repo_factory: OrganizationRepoFactory,
+        idempotency_repo_factory: IdempotencyRepoFactory,
     ) -> None:
         self._sf: AsyncSessionFactory = session_factory
         self._orgs_repo_factory: OrganizationRepoFactory = orgs_repo_factory
+        self._idempotency_repo_factory: IdempotencyRepoFactory = idempotency_repo_factory
 
         self._session: AsyncSession | None = None
         self._orgs: OrganizationsRepo | None = None
+        self._idempotency: IdempotencyRepo | None = None
 
         self._rolled_back: bool = False
         self._uow_id: str | None = uuid4().hex
@@ -38,6 +41,7 @@ class SQLAlchemyUnitOfWork:
         try:
             self._session = session
             self._orgs = self._orgs_repo_factory(self._session)
+            self._idempotency = self._idempotency_repo_factory(self._session)
 
             logger.debug(
                 "uow_started",
@@ -51,6 +55,7 @@ class SQLAlchemyUnitOfWork:
 
             self._session = None
             self._orgs = None
+            self._idempotency = None
 
             logger.exception(
                 "uow_start_failed",
@@ -90,6 +95,7 @@ class SQLAlchemyUnitOfWork:
 
             self._session = None
             self._orgs = None
+            self._idempotency = None
             self._uow_id = None
             self._rolled_back = False
 
@@ -164,6 +170,25 @@ class SQLAlchemyUnitOfWork:
         except DB_OPERATION_ERRORS as e:
             raise determine_exc(e=e) from e
 
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """Run the block inside a SAVEPOINT that is rolled back if the block fails.
+
+        The outer transaction stays usable, so other work sharing it is unaffected.
+        """
+        try:
+            async with self.session.begin_nested():
+                yield
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e=e) from e
+
+    async def set_read_only(self) -> None:
+        """Make the current transaction read-only; must run before any other statement."""
+        try:
+            await self.session.execute(text("SET TRANSACTION READ ONLY"))
+        except DB_OPERATION_ERRORS as e:
+            raise determine_exc(e=e) from e
+
     @property
     def session(self) -> AsyncSession:
         if self._session is None:
@@ -175,3 +200,9 @@ class SQLAlchemyUnitOfWork:
         if self._orgs is None:
             raise UoWNotInitializedError("orgs")
         return self._orgs
+
+    @property
+    def idempotency(self) -> IdempotencyRepo:
+        if self._idempotency is None:
+            raise UoWNotInitializedError("idempotency")
+        return self._idempotency
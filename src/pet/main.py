@@ -1,32 +1,126 @@
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import os
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
 
 import sqlalchemy as sa
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.types import Lifespan
 
+from pet import IMPORT_STARTED_AT
 from pet.api.exceptions_handler import register_exception_handlers
 from pet.api.health import health
+from pet.api.metrics import metrics
 from pet.api.middleware.http_logging import register_http_logging
 from pet.api.organizations import organizations
-from pet.config.logging import configure_logging, get_logger
+from pet.app.admission import AdmissionController
+from pet.app.drain import DrainController
+from pet.app.idempotency import IdempotencyKeyPurger
+from pet.app.transaction_executor import GroupCommitter, RetryPolicy, TransactionExecutor
+from pet.config.logging import LogSampler, configure_logging, flush_logging, get_logger
 from pet.config.settings import Settings, get_settings
+from pet.di.db import build_app_uow_factory
+from pet.infra.cache import TTLCache
+from pet.infra.health import HealthMonitor
+from pet.infra.metrics import mark_worker_dead
 from pet.infra.sqla.db.connection import create_engine, create_session_maker
+from pet.infra.sqla.db.query_stats import instrument_queries, log_top_queries
+
+IMPORTS_FINISHED_AT = time.perf_counter()
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class StartupTimer:
+    """Durations of the startup phases, from the first ``pet`` import to serving."""
+
+    phases_ms: dict[str, float] = field(default_factory=dict)
+
+    def record(self, name: str, started_at: float, finished_at: float | None = None) -> None:
+        finished_at = time.perf_counter() if finished_at is None else finished_at
+        self.phases_ms[name] = round((finished_at - started_at) * 1000, 2)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started_at)
+
+    def total_ms(self) -> float:
+        return round(sum(self.phases_ms.values()), 2)
+
+
 async def check_db_connection(engine: AsyncEngine):
     async with engine.connect() as conn:
         await conn.execute(sa.text("SELECT 1"))
 
 
+def build_admission_controller(settings: Settings) -> AdmissionController | None:
+    if not settings.admission.enabled:
+        return None
+
+    return AdmissionController(
+        max_concurrency=(
+            settings.admission.max_concurrency
+            or settings.engine.pool_size + settings.engine.max_overflow
+        ),
+        max_queue=settings.admission.max_queue,
+        max_wait_s=settings.admission.max_wait_ms / 1000,
+        retry_after_s=settings.admission.retry_after_seconds,
+    )
+
+
+def build_health_monitor(
+    settings: Settings,
+    engine: AsyncEngine,
+    log_sampler: LogSampler | None = None,
+) -> HealthMonitor:
+    return HealthMonitor(
+        engine,
+        interval_s=settings.health.interval_ms / 1000,
+        check_timeout_s=settings.health.check_timeout_ms / 1000,
+        stale_after_s=settings.health.stale_after_ms / 1000,
+        pool_capacity=(
+            None
+            if settings.engine.null_pool
+            else settings.engine.pool_size + settings.engine.max_overflow
+        ),
+        max_pool_saturation=settings.health.max_pool_saturation,
+        pool_saturation_checks=settings.health.pool_saturation_checks,
+        max_loop_lag_s=settings.health.max_loop_lag_ms / 1000,
+        log_sampler=log_sampler,
+    )
+
+
+def build_log_sampler(settings: Settings) -> LogSampler | None:
+    if not settings.log_sampling.enabled:
+        return None
+
+    return LogSampler(
+        sample_rates=settings.log_sampling.sample_rates,
+        slow_ms=settings.log_sampling.slow_ms,
+        rate_limited=settings.log_sampling.rate_limited_events,
+        burst=settings.log_sampling.rate_limit_burst,
+        interval_s=settings.log_sampling.rate_limit_interval_seconds,
+    )
+
+
 def build_lifespan() -> Lifespan[FastAPI]:
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         settings: Settings = app.state.settings
         engine: AsyncEngine | None = None
+        group_committer: GroupCommitter | None = None
+        health_monitor: HealthMonitor | None = None
+        idempotency_purger: IdempotencyKeyPurger | None = None
+        timer: StartupTimer = app.state.startup_timer
+        drain: DrainController = app.state.drain
 
         logger.info(
             "startup_started",
@@ -35,27 +129,65 @@ def build_lifespan() -> Lifespan[FastAPI]:
             max_overflow=settings.engine.max_overflow,
         )
         try:
-            engine = create_engine(
-                url=settings.db_url,
-                echo=settings.engine.echo,
-                pool_size=settings.engine.pool_size,
-                max_overflow=settings.engine.max_overflow,
-                pool_pre_ping=settings.engine.pool_pre_ping,
-            )
-            session_factory = create_session_maker(
-                bind=engine,
-                autoflush=settings.session_maker.autoflush,
-                expire_on_commit=settings.session_maker.expire_on_commit,
-            )
-            app.state.engine = engine
-            app.state.session_factory = session_factory
+            with timer.phase("engine"):
+                engine = create_engine(
+                    url=settings.db_url,
+                    echo=settings.engine.echo,
+                    pool_size=settings.engine.pool_size,
+                    max_overflow=settings.engine.max_overflow,
+                    pool_pre_ping=settings.engine.pool_pre_ping,
+                    pgbouncer_transaction_mode=settings.engine.mode == "pgbouncer_transaction",
+                    null_pool=settings.engine.null_pool,
+                )
+                if settings.slow_query.enabled:
+                    instrument_queries(
+                        engine,
+                        slow_threshold_s=settings.slow_query.threshold_ms / 1000,
+                        explain=settings.slow_query.explain,
+                    )
+                session_factory = create_session_maker(
+                    bind=engine,
+                    autoflush=settings.session_maker.autoflush,
+                    expire_on_commit=settings.session_maker.expire_on_commit,
+                )
+                app.state.engine = engine
+                app.state.session_factory = session_factory
 
-            await check_db_connection(engine)
+                if settings.group_commit.enabled:
+                    group_committer = GroupCommitter(
+                        build_app_uow_factory(session_factory, settings),
+                        window_s=settings.group_commit.window_ms / 1000,
+                        max_batch_size=settings.group_commit.max_batch_size,
+                        admission=app.state.admission,
+                    )
+                app.state.group_committer = group_committer
+
+            with timer.phase("check_db_connection"):
+                await check_db_connection(engine)
+
+            with timer.phase("health_monitor"):
+                health_monitor = build_health_monitor(settings, engine, app.state.log_sampler)
+                await health_monitor.start()
+                app.state.health_monitor = health_monitor
+
+            idempotency_purger = IdempotencyKeyPurger(
+                TransactionExecutor(build_app_uow_factory(session_factory, settings)),
+                interval_s=settings.idempotency.purge_interval_seconds,
+                batch_size=settings.idempotency.purge_batch_size,
+            )
+            idempotency_purger.start()
 
-            logger.info("startup_succeeded")
+            logger.info(
+                "startup_succeeded",
+                phases_ms=timer.phases_ms,
+                total_ms=timer.total_ms(),
+                since_import_ms=round((time.perf_counter() - IMPORT_STARTED_AT) * 1000, 2),
+            )
 
         except Exception:
             logger.exception("startup_failed")
+            if health_monitor is not None:
+                await health_monitor.close()
             if engine is not None:
                 await engine.dispose()
             raise
@@ -65,9 +197,26 @@ def build_lifespan() -> Lifespan[FastAPI]:
         finally:
             if engine is not None:
                 try:
-                    logger.info("shutdown_started")
+                    logger.info("shutdown_started", in_flight=drain.in_flight)
+                    drained = await drain.drain(settings.shutdown.drain_deadline_ms / 1000)
+                    logger.info(
+                        "shutdown_drained",
+                        drained=drained.drained,
+                        aborted=drained.aborted,
+                        duration_ms=round(drained.duration_s * 1000, 2),
+                    )
+                    if idempotency_purger is not None:
+                        await idempotency_purger.close()
+                    if health_monitor is not None:
+                        await health_monitor.close()
+                    if group_committer is not None:
+                        await group_committer.close()
                     await engine.dispose()
+                    if settings.slow_query.enabled:
+                        log_top_queries(settings.slow_query.top_n)
+                    mark_worker_dead(os.getpid())
                     logger.info("shutdown_succeeded")
+                    flush_logging()
                 except Exception:
                     logger.exception("shutdown_failed")
                     raise
@@ -76,20 +225,58 @@ def build_lifespan() -> Lifespan[FastAPI]:
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
-    resolved_settings = settings or get_settings()
+    timer = StartupTimer()
+    timer.record("imports", IMPORT_STARTED_AT, IMPORTS_FINISHED_AT)
 
-    configure_logging(
-        level=resolved_settings.log_level,
-        log_format=resolved_settings.log_format,
-    )
+    with timer.phase("get_settings"):
+        resolved_settings = settings or get_settings()
 
-    app = FastAPI(lifespan=build_lifespan())
+    with timer.phase("configure_logging"):
+        log_sampler = build_log_sampler(resolved_settings)
+        configure_logging(
+            level=resolved_settings.log_level,
+            log_format=resolved_settings.log_format,
+            queue_enabled=resolved_settings.log_queue.enabled,
+            queue_size=resolved_settings.log_queue.max_size,
+            queue_overflow=resolved_settings.log_queue.overflow,
+            sampler=log_sampler,
+            profile=resolved_settings.log_profile,
+        )
+    app_started_at = time.perf_counter()
+
+    app = FastAPI(lifespan=build_lifespan(), default_response_class=ORJSONResponse)
     app.state.settings = resolved_settings
+    app.state.startup_timer = timer
+    app.state.log_sampler = log_sampler
+    app.state.retry_policy = RetryPolicy(
+        max_attempts=resolved_settings.transaction_retry.max_attempts,
+        base_delay_s=resolved_settings.transaction_retry.base_delay_ms / 1000,
+        max_delay_s=resolved_settings.transaction_retry.max_delay_ms / 1000,
+        deadline_s=resolved_settings.transaction_retry.deadline_ms / 1000,
+    )
+    app.state.admission = build_admission_controller(resolved_settings)
+    app.state.drain = DrainController(retry_after_s=resolved_settings.shutdown.retry_after_seconds)
+    app.state.idempotency_cache = TTLCache(
+        max_size=resolved_settings.idempotency.cache_max_size,
+        ttl_seconds=resolved_settings.idempotency.cache_ttl_seconds,
+    )
+    app.state.name_availability_cache = TTLCache(
+        max_size=resolved_settings.name_availability.cache_max_size,
+        ttl_seconds=resolved_settings.name_availability.cache_ttl_seconds,
+    )
+
+    app.state.organization_response_cache = TTLCache(
+        max_size=resolved_settings.organization_read.cache_max_size,
+        ttl_seconds=resolved_settings.organization_read.cache_ttl_seconds,
+    )
+    timer.record("app_state", app_started_at)
 
-    app.include_router(health)
-    app.include_router(organizations)
+    with timer.phase("routers"):
+        app.include_router(health)
+        app.include_router(metrics)
+        app.include_router(organizations)
 
-    register_exception_handlers(app)
-    register_http_logging(app)
+        register_exception_handlers(app)
+        register_http_logging(app)
 
     return app
@@ -0,0 +1,244 @@
+"""Run the API under uvicorn with worker processes sharing one database connection budget.
+
+Every worker has its own engine and pool, so N workers open up to N times
+``pool_size + max_overflow`` connections. Given a budget for all of them
+together, each worker's pool is shrunk to its share, never above the
+configured ``ENGINE__POOL_SIZE`` and ``ENGINE__MAX_OVERFLOW``. Workers get the
+sizes through those same variables, and admission control follows the pool.
+
+With ``--max-requests`` a worker exits after that many requests, plus up to
+``--max-requests-jitter`` more so they do not all restart at once, and the
+supervisor starts a fresh one, which bounds memory growth.
+
+On SIGTERM each worker first fails ``/readyz`` and keeps serving for
+``SHUTDOWN__READINESS_DELAY_MS``, then stops listening and gives requests in
+flight up to ``SHUTDOWN__DRAIN_DEADLINE_MS`` before the application shuts down.
+
+Usage::
+
+    python -m pet.serve
+    python -m pet.serve --workers 4 --connection-budget 80 --max-requests 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import shutil
+import socket
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from pet.app.drain import DrainController
+from pet.config.logging import configure_logging, get_logger
+from pet.config.settings import Settings, get_settings
+from pet.infra.metrics import MULTIPROC_DIR_ENV
+
+logger = get_logger(__name__)
+
+APP_FACTORY = "pet.main:create_app"
+
+
+@dataclass(slots=True, frozen=True)
+class WorkerPoolSize:
+    pool_size: int
+    max_overflow: int
+
+    @property
+    def max_connections(self) -> int:
+        return self.pool_size + self.max_overflow
+
+
+def worker_pool_size(
+    *,
+    workers: int,
+    connection_budget: int,
+    pool_size: int,
+    max_overflow: int,
+) -> WorkerPoolSize:
+    """Split ``connection_budget`` evenly, filling ``pool_size`` before ``max_overflow``."""
+    if workers < 1:
+        raise ValueError("workers must be positive")
+
+    per_worker = connection_budget // workers
+    if per_worker < 1:
+        raise ValueError(
+            f"A connection budget of {connection_budget} cannot give each of {workers} workers "
+            "a connection"
+        )
+
+    sized_pool = min(pool_size, per_worker)
+    return WorkerPoolSize(
+        pool_size=sized_pool,
+        max_overflow=max(0, min(max_overflow, per_worker - sized_pool)),
+    )
+
+
+def find_drain(app: Any) -> DrainController | None:
+    """Find the ``DrainController`` of the app uvicorn loaded, under any middleware it added."""
+    while app is not None:
+        drain = getattr(getattr(app, "state", None), "drain", None)
+        if isinstance(drain, DrainController):
+            return drain
+        app = getattr(app, "app", None)
+    return None
+
+
+class DrainingServer(uvicorn.Server):
+    """Starts draining before uvicorn closes its sockets.
+
+    uvicorn's own shutdown stops listening, waits for requests in flight and only
+    then sends the lifespan shutdown, by which point ``/readyz`` has nothing left
+    to report. Here readiness fails first, and requests keep being served for
+    ``readiness_delay_s`` while load balancers notice.
+    """
+
+    def __init__(self, config: uvicorn.Config, *, readiness_delay_s: float = 0.0) -> None:
+        super().__init__(config)
+        self.readiness_delay_s = readiness_delay_s
+
+    async def shutdown(self, sockets: list[socket.socket] | None = None) -> None:
+        drain = find_drain(self.config.loaded_app)
+        if drain is not None:
+            drain.begin()
+            logger.info(
+                "shutdown_readiness_failed",
+                in_flight=drain.in_flight,
+                readiness_delay_ms=self.readiness_delay_s * 1000,
+            )
+            if self.readiness_delay_s > 0 and not self.force_exit:
+                await asyncio.sleep(self.readiness_delay_s)
+
+        await super().shutdown(sockets)
+
+
+def worker_environ(sizes: WorkerPoolSize) -> dict[str, str]:
+    return {
+        "ENGINE__POOL_SIZE": str(sizes.pool_size),
+        "ENGINE__MAX_OVERFLOW": str(sizes.max_overflow),
+    }
+
+
+def serve(
+    settings: Settings,
+    *,
+    workers: int,
+    connection_budget: int | None,
+    max_requests: int | None,
+    max_requests_jitter: int,
+    host: str,
+    port: int,
+) -> int:
+    sizes = worker_pool_size(
+        workers=workers,
+        connection_budget=(
+            connection_budget
+            or workers * (settings.engine.pool_size + settings.engine.max_overflow)
+        ),
+        pool_size=settings.engine.pool_size,
+        max_overflow=settings.engine.max_overflow,
+    )
+    # Spawned workers build their Settings from the environment they inherit.
+    os.environ.update(worker_environ(sizes))
+
+    supervised = workers > 1 or max_requests is not None
+    metrics_dir: str | None = None
+    if supervised and not os.environ.get(MULTIPROC_DIR_ENV):
+        metrics_dir = tempfile.mkdtemp(prefix="pet-metrics-")
+        os.environ[MULTIPROC_DIR_ENV] = metrics_dir
+
+    logger.info(
+        "server_starting",
+        workers=workers,
+        connection_budget=connection_budget,
+        pool_size=sizes.pool_size,
+        max_overflow=sizes.max_overflow,
+        max_connections=workers * sizes.max_connections,
+        max_requests=max_requests,
+        max_requests_jitter=max_requests_jitter,
+    )
+
+    config = uvicorn.Config(
+        APP_FACTORY,
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        access_log=False,
+        limit_max_requests=max_requests,
+        limit_max_requests_jitter=max_requests_jitter,
+        timeout_graceful_shutdown=math.ceil(settings.shutdown.drain_deadline_ms / 1000),
+    )
+    server = DrainingServer(
+        config,
+        readiness_delay_s=settings.shutdown.readiness_delay_ms / 1000,
+    )
+    try:
+        if supervised:
+            # Also with one worker, so a recycled worker is replaced.
+            Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+            return 0
+
+        server.run()
+        return 0 if server.started else 1
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def _parse_args(argv: Sequence[str] | None, settings: Settings) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m pet.serve",
+        description="Run the API with worker processes sharing one connection budget.",
+    )
+    parser.add_argument("--host", default=settings.server.host)
+    parser.add_argument("--port", type=int, default=settings.server.port)
+    parser.add_argument("--workers", type=int, default=settings.server.workers)
+    parser.add_argument(
+        "--connection-budget",
+        type=int,
+        default=settings.server.db_connection_budget,
+        help="Database connections all workers may hold together.",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=settings.server.max_requests,
+        help="Requests after which a worker is replaced.",
+    )
+    parser.add_argument(
+        "--max-requests-jitter",
+        type=int,
+        default=settings.server.max_requests_jitter,
+        help="Random extra requests per worker before it is replaced.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    settings = get_settings()
+    args = _parse_args(argv, settings)
+    configure_logging(level=settings.log_level, log_format=settings.log_format)
+
+    return serve(
+        settings,
+        workers=args.workers,
+        connection_budget=args.connection_budget,
+        max_requests=args.max_requests,
+        max_requests_jitter=args.max_requests_jitter,
+        host=args.host,
+        port=args.port,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""Export every organization as NDJSON for the analytics job.
+
+Rows are read through a server-side cursor in a read-only transaction and
+written as they arrive, so memory use does not depend on the table size.
+Every line has the same shape as the ``GET /orgs/export`` response.
+
+Usage::
+
+    python -m pet.tools.export organizations.ndjson
+    python -m pet.tools.export organizations.ndjson --batch-size 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Final
+
+from pet.api.ndjson import ndjson_chunks
+from pet.api.organizations import OrganizationOut
+from pet.app.transaction_executor import TransactionExecutor
+from pet.app.usecases.organizations import ExportOrganizationsQueryIn, export_organizations_query
+from pet.config.logging import configure_logging, get_logger
+from pet.config.settings import get_settings
+from pet.di.db import build_uow_factory
+from pet.domain.uow import TransactionExecutorProtocol
+from pet.infra.sqla.db.connection import create_engine, create_session_maker
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE: Final = 1000
+
+
+@dataclass(slots=True)
+class ExportStats:
+    rows_written: int = 0
+    bytes_written: int = 0
+    duration_s: float = 0.0
+
+
+async def export(
+    executor: TransactionExecutorProtocol,
+    out: BinaryIO,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ExportStats:
+    stats = ExportStats()
+    started_at = time.perf_counter()
+
+    async def rows() -> AsyncIterator[OrganizationOut]:
+        query = ExportOrganizationsQueryIn(batch_size=batch_size)
+        async for org in executor.stream(export_organizations_query, query):
+            stats.rows_written += 1
+            yield OrganizationOut.model_validate(org, from_attributes=True)
+
+    async for chunk in ndjson_chunks(rows()):
+        out.write(chunk)
+        stats.bytes_written += len(chunk)
+
+    stats.duration_s = time.perf_counter() - started_at
+    return stats
+
+
+async def _run(args: argparse.Namespace) -> ExportStats:
+    settings = get_settings()
+    engine = create_engine(url=settings.db_url, pool_size=1, max_overflow=0)
+    session_factory = create_session_maker(bind=engine)
+    executor = TransactionExecutor(uow_factory=build_uow_factory(session_factory))
+
+    path: Path = args.path
+    try:
+        with path.open("wb") as out:
+            return await export(executor, out, batch_size=args.batch_size)
+    finally:
+        await engine.dispose()
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m pet.tools.export",
+        description="Stream every organization to an NDJSON file.",
+    )
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows fetched per server-side cursor round trip.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    settings = get_settings()
+    configure_logging(level=settings.log_level, log_format=settings.log_format)
+
+    try:
+        stats = asyncio.run(_run(args))
+    except Exception:
+        logger.exception("export_failed", path=str(args.path))
+        return 1
+
+    logger.info(
+        "export_finished",
+        path=str(args.path),
+        rows_written=stats.rows_written,
+        bytes_written=stats.bytes_written,
+        duration_ms=round(stats.duration_s * 1000, 2),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,359 @@
+"""Bulk loader for seeding and legacy migrations.
+
+Streams a CSV or NDJSON file through asyncpg's binary COPY into a temporary
+staging table and merges it into the target table with one
+``INSERT ... SELECT``. Foreign references are given as ``public_id`` values and
+resolved to internal ids by joining in the merge statement.
+
+Usage::
+
+    python -m pet.tools.load organizations orgs.csv
+    python -m pet.tools.load tasks tasks.ndjson --progress-every 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Literal
+from uuid import UUID
+
+import asyncpg
+
+from pet.config.logging import configure_logging, get_logger
+from pet.config.settings import get_settings
+from pet.domain.exc import ValidationError
+from pet.domain.value_objects import validate_org_name
+from pet.infra.sqla.db.models import TaskStatus
+
+type InputFormat = Literal["csv", "ndjson"]
+
+logger = get_logger(__name__)
+
+DEFAULT_PROGRESS_EVERY: Final = 100_000
+_FORMAT_BY_SUFFIX: Final[dict[str, InputFormat]] = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+class RowRejectedError(ValueError):
+    pass
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise RowRejectedError(f"expected a string, got {type(value).__name__}")
+    return value
+
+
+def _uuid(value: Any) -> UUID:
+    try:
+        return UUID(_text(value))
+    except ValueError as e:
+        raise RowRejectedError(f"invalid uuid: {value!r}") from e
+
+
+def _org_name(value: Any) -> str:
+    try:
+        return validate_org_name(_text(value))
+    except ValidationError as e:
+        raise RowRejectedError(e.message) from e
+
+
+def _task_status(value: Any) -> str:
+    try:
+        return TaskStatus(_text(value)).value
+    except ValueError as e:
+        raise RowRejectedError(f"invalid task status: {value!r}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class StagingColumn:
+    name: str
+    sql_type: str
+    parse: Callable[[Any], object]
+    required: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSpec:
+    table: str
+    columns: tuple[StagingColumn, ...]
+    merge_sql: str
+
+    @property
+    def staging_table(self) -> str:
+        return f"_load_{self.table}"
+
+    @property
+    def column_names(self) -> list[str]:
+        return [column.name for column in self.columns]
+
+    def create_staging_sql(self) -> str:
+        columns = ", ".join(f"{column.name} {column.sql_type}" for column in self.columns)
+        return f"CREATE TEMP TABLE {self.staging_table} ({columns}) ON COMMIT DROP"
+
+    def render_merge_sql(self) -> str:
+        return self.merge_sql.format(staging=self.staging_table)
+
+    def parse_row(self, raw: Mapping[str, Any]) -> tuple[object, ...]:
+        values: list[object] = []
+        for column in self.columns:
+            value = raw.get(column.name)
+            if value is None or value == "":
+                if column.required:
+                    raise RowRejectedError(f"missing required column {column.name!r}")
+                values.append(None)
+                continue
+            values.append(column.parse(value))
+        return tuple(values)
+
+
+_PUBLIC_ID = StagingColumn("public_id", "uuid", _uuid, required=False)
+
+LOAD_SPECS: Final[dict[str, LoadSpec]] = {
+    "organizations": LoadSpec(
+        table="organizations",
+        columns=(_PUBLIC_ID, StagingColumn("name", "text", _org_name)),
+        merge_sql="""
+            INSERT INTO organizations (public_id, name)
+            SELECT COALESCE(s.public_id, gen_random_uuid()), s.name
+            FROM {staging} AS s
+            ON CONFLICT DO NOTHING
+        """,
+    ),
+    "users": LoadSpec(
+        table="users",
+        columns=(
+            _PUBLIC_ID,
+            StagingColumn("first_name", "text", _text),
+            StagingColumn("last_name", "text", _text),
+        ),
+        merge_sql="""
+            INSERT INTO users (public_id, first_name, last_name)
+            SELECT COALESCE(s.public_id, gen_random_uuid()), s.first_name, s.last_name
+            FROM {staging} AS s
+            ON CONFLICT DO NOTHING
+        """,
+    ),
+    "projects": LoadSpec(
+        table="projects",
+        columns=(
+            _PUBLIC_ID,
+            StagingColumn("name", "text", _text),
+            StagingColumn("org_public_id", "uuid", _uuid),
+        ),
+        merge_sql="""
+            INSERT INTO projects (public_id, name, org_id)
+            SELECT COALESCE(s.public_id, gen_random_uuid()), s.name, o.id
+            FROM {staging} AS s
+            JOIN organizations AS o ON o.public_id = s.org_public_id
+            ON CONFLICT DO NOTHING
+        """,
+    ),
+    "tasks": LoadSpec(
+        table="tasks",
+        columns=(
+            _PUBLIC_ID,
+            StagingColumn("name", "text", _text),
+            StagingColumn("project_public_id", "uuid", _uuid),
+            StagingColumn("assignee_public_id", "uuid", _uuid, required=False),
+            StagingColumn("status", "text", _task_status, required=False),
+        ),
+        merge_sql="""
+            INSERT INTO tasks (public_id, name, project_id, assignee_user_id, status)
+            SELECT
+                COALESCE(s.public_id, gen_random_uuid()),
+                s.name,
+                p.id,
+                u.id,
+                COALESCE(s.status, 'todo')::task_status
+            FROM {staging} AS s
+            JOIN projects AS p ON p.public_id = s.project_public_id
+            LEFT JOIN users AS u ON u.public_id = s.assignee_public_id
+            WHERE s.assignee_public_id IS NULL OR u.id IS NOT NULL
+            ON CONFLICT DO NOTHING
+        """,
+    ),
+}
+
+
+def read_csv(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def read_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def detect_format(path: Path) -> InputFormat:
+    try:
+        return _FORMAT_BY_SUFFIX[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Cannot detect input format of {path.name!r}, pass --format explicitly"
+        ) from None
+
+
+def read_rows(path: Path, input_format: InputFormat) -> Iterator[dict[str, Any]]:
+    return read_csv(path) if input_format == "csv" else read_ndjson(path)
+
+
+def _rows_per_second(rows: int, duration_s: float) -> float:
+    return round(rows / duration_s, 1) if duration_s > 0 else float(rows)
+
+
+@dataclass(slots=True)
+class LoadStats:
+    table: str
+    rows_read: int = 0
+    rows_rejected: int = 0
+    rows_inserted: int = 0
+    duration_s: float = 0.0
+
+    @property
+    def rows_staged(self) -> int:
+        return self.rows_read - self.rows_rejected
+
+    @property
+    def rows_skipped(self) -> int:
+        return self.rows_staged - self.rows_inserted
+
+    @property
+    def rows_per_second(self) -> float:
+        return _rows_per_second(self.rows_read, self.duration_s)
+
+
+def _staged_records(
+    spec: LoadSpec,
+    rows: Iterable[Mapping[str, Any]],
+    stats: LoadStats,
+    *,
+    started_at: float,
+    progress_every: int,
+) -> Iterator[tuple[object, ...]]:
+    for raw in rows:
+        stats.rows_read += 1
+        try:
+            yield spec.parse_row(raw)
+        except RowRejectedError as e:
+            stats.rows_rejected += 1
+            logger.debug("load_row_rejected", row_number=stats.rows_read, reason=str(e))
+
+        if progress_every and stats.rows_read % progress_every == 0:
+            logger.info(
+                "load_progress",
+                table=spec.table,
+                rows_read=stats.rows_read,
+                rows_per_second=_rows_per_second(stats.rows_read, time.perf_counter() - started_at),
+            )
+
+
+def _affected_rows(status: str) -> int:
+    # asyncpg returns the command tag, e.g. "INSERT 0 42"
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def load(
+    conn: asyncpg.Connection,
+    spec: LoadSpec,
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    progress_every: int = DEFAULT_PROGRESS_EVERY,
+) -> LoadStats:
+    stats = LoadStats(table=spec.table)
+    started_at = time.perf_counter()
+
+    async with conn.transaction():
+        await conn.execute(spec.create_staging_sql())
+        await conn.copy_records_to_table(
+            spec.staging_table,
+            records=_staged_records(
+                spec,
+                rows,
+                stats,
+                started_at=started_at,
+                progress_every=progress_every,
+            ),
+            columns=spec.column_names,
+        )
+        stats.rows_inserted = _affected_rows(await conn.execute(spec.render_merge_sql()))
+
+    stats.duration_s = time.perf_counter() - started_at
+    return stats
+
+
+async def _run(args: argparse.Namespace) -> LoadStats:
+    settings = get_settings()
+    spec = LOAD_SPECS[args.table]
+    path: Path = args.path
+    input_format: InputFormat = args.format or detect_format(path)
+
+    dsn = settings.db_url.set(drivername="postgresql").render_as_string(hide_password=False)
+    conn = await asyncpg.connect(dsn)
+    try:
+        return await load(
+            conn,
+            spec,
+            read_rows(path, input_format),
+            progress_every=args.progress_every,
+        )
+    finally:
+        await conn.close()
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m pet.tools.load",
+        description="Bulk load CSV/NDJSON rows into a table via binary COPY.",
+    )
+    parser.add_argument("table", choices=sorted(LOAD_SPECS))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None)
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=DEFAULT_PROGRESS_EVERY,
+        help="Log progress every N input rows, 0 disables progress logging.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    settings = get_settings()
+    configure_logging(level=settings.log_level, log_format=settings.log_format)
+
+    try:
+        stats = asyncio.run(_run(args))
+    except Exception:
+        logger.exception("load_failed", table=args.table, path=str(args.path))
+        return 1
+
+    logger.info(
+        "load_finished",
+        table=stats.table,
+        rows_read=stats.rows_read,
+        rows_rejected=stats.rows_rejected,
+        rows_inserted=stats.rows_inserted,
+        rows_skipped=stats.rows_skipped,
+        duration_ms=round(stats.duration_s * 1000, 2),
+        rows_per_second=stats.rows_per_second,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -203,3 +203,14 @@ async def test_db_organizations_name_canonical_is_generated(
         await db_session.commit()
 
     await db_session.rollback()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_create_rejects_oversized_integer_name_with_422(
+    client: AsyncClient,
+) -> None:
+    response = await client.post("/orgs/", json={"name": 123456789012345678901234567890})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == AppErrorCode.VALIDATION
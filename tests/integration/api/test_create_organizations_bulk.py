@@ -0,0 +1,53 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pet.api.organizations import ORG_BULK_MAX_ITEMS
+from pet.app.errors import AppErrorCode
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_bulk_create_returns_per_item_results(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    existing = await client.post("/orgs/", json={"name": "Taken"})
+    assert existing.status_code == 201
+
+    response = await client.post(
+        "/orgs/bulk",
+        json={"names": ["Acme", "sm", "ACME", "taken", "Globex"]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 2
+    assert body["failed"] == 3
+
+    items = body["items"]
+    assert [item["index"] for item in items] == [0, 1, 2, 3, 4]
+    assert items[0]["public_id"] is not None
+    assert items[1]["problem"]["code"] == AppErrorCode.VALIDATION
+    assert items[1]["problem"]["status"] == 422
+    assert items[2]["problem"]["code"] == AppErrorCode.ORGANIZATION_NAME_TAKEN
+    assert items[2]["problem"]["status"] == 409
+    assert items[3]["problem"]["code"] == AppErrorCode.ORGANIZATION_NAME_TAKEN
+    assert items[4]["public_id"] is not None
+
+    result = await db_session.execute(text("SELECT name FROM organizations ORDER BY id"))
+    assert result.scalars().all() == ["Taken", "Acme", "Globex"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.parametrize("names", [[], ["org"] * (ORG_BULK_MAX_ITEMS + 1)])
+async def test_api_organizations_bulk_create_rejects_batch_size_out_of_bounds(
+    client: AsyncClient,
+    names: list[str],
+) -> None:
+    response = await client.post("/orgs/bulk", json={"names": names})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == AppErrorCode.VALIDATION
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_export_streams_ndjson(client: AsyncClient) -> None:
+    names = [f"Org {i:04d}" for i in range(1500)]
+    created = await client.post("/orgs/bulk", json={"names": names[:1000]})
+    assert created.json()["created"] == 1000
+    created = await client.post("/orgs/bulk", json={"names": names[1000:]})
+    assert created.json()["created"] == 500
+
+    async with client.stream("GET", "/orgs/export") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) async for line in response.aiter_lines() if line]
+
+    assert [line["name"] for line in lines] == names
+    assert set(lines[0]) == {"public_id", "name", "created_at", "updated_at"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_export_of_empty_table_is_empty(client: AsyncClient) -> None:
+    response = await client.get("/orgs/export")
+
+    assert response.status_code == 200
+    assert response.content == b""
@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from pet.app.errors import AppErrorCode
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_get_returns_org_with_validators(client: AsyncClient) -> None:
+    created = await client.post("/orgs/", json={"name": "Acme"})
+    public_id = created.json()["public_id"]
+
+    response = await client.get(f"/orgs/{public_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["public_id"] == public_id
+    assert body["name"] == "Acme"
+    assert body["updated_at"] is not None
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["last-modified"].endswith("GMT")
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_get_answers_matching_etag_with_304(
+    app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    created = await client.post("/orgs/", json={"name": "Acme"})
+    public_id = created.json()["public_id"]
+    first = await client.get(f"/orgs/{public_id}")
+    etag = first.headers["etag"]
+
+    from_cache = await client.get(f"/orgs/{public_id}", headers={"If-None-Match": etag})
+    app.state.organization_response_cache.clear()
+    from_db = await client.get(f"/orgs/{public_id}", headers={"If-None-Match": f"W/{etag}"})
+
+    for response in (from_cache, from_db):
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_get_returns_404_for_unknown_org(client: AsyncClient) -> None:
+    response = await client.get(f"/orgs/{uuid4()}")
+
+    assert response.status_code == 404
+    assert response.json()["code"] == AppErrorCode.ORGANIZATION_NOT_FOUND
@@ -1,5 +1,7 @@
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import event
 
 
 @pytest.mark.asyncio
@@ -18,3 +20,18 @@ async def test_api_readyz_returns_ok(client: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_readyz_does_not_check_out_connections(app: FastAPI, client: AsyncClient) -> None:
+    await app.state.health_monitor.close()
+    checkouts: list[object] = []
+    event.listen(
+        app.state.engine.sync_engine.pool, "checkout", lambda *args: checkouts.append(args)
+    )
+
+    responses = [await client.get("/readyz") for _ in range(20)]
+
+    assert [r.status_code for r in responses] == [200] * 20
+    assert checkouts == []
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pet.app.errors import AppErrorCode
+from pet.app.idempotency import IdempotencyKeyPurger
+from pet.app.transaction_executor import TransactionExecutor
+from pet.di.db import build_app_uow_factory
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_create_replays_response_for_same_idempotency_key(
+    app: FastAPI,
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    headers = {"Idempotency-Key": "create-acme-1"}
+
+    first = await client.post("/orgs/", json={"name": "Acme"}, headers=headers)
+    app.state.idempotency_cache.clear()
+    from_db = await client.post("/orgs/", json={"name": "Acme"}, headers=headers)
+    from_cache = await client.post("/orgs/", json={"name": "Acme"}, headers=headers)
+
+    assert first.status_code == 201
+    assert from_db.status_code == 201
+    assert from_cache.status_code == 201
+    assert from_db.json() == first.json()
+    assert from_cache.json() == first.json()
+
+    result = await db_session.execute(text("SELECT count(*) FROM organizations"))
+    assert result.scalar_one() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_create_rejects_idempotency_key_reuse_with_other_payload(
+    client: AsyncClient,
+) -> None:
+    headers = {"Idempotency-Key": "create-acme-2"}
+
+    first = await client.post("/orgs/", json={"name": "Acme"}, headers=headers)
+    second = await client.post("/orgs/", json={"name": "Globex"}, headers=headers)
+
+    assert first.status_code == 201
+    assert second.status_code == 422
+    assert second.json()["code"] == AppErrorCode.VALIDATION
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_create_does_not_store_failed_attempts(
+    client: AsyncClient,
+) -> None:
+    taken = await client.post("/orgs/", json={"name": "Acme"})
+    failed = await client.post(
+        "/orgs/",
+        json={"name": "acme"},
+        headers={"Idempotency-Key": "create-acme-3"},
+    )
+    retried = await client.post(
+        "/orgs/",
+        json={"name": "acme"},
+        headers={"Idempotency-Key": "create-acme-3"},
+    )
+
+    assert taken.status_code == 201
+    assert failed.status_code == 409
+    assert retried.status_code == 409
+    assert retried.json()["code"] == AppErrorCode.ORGANIZATION_NAME_TAKEN
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_create_replays_concurrent_requests_with_same_key(
+    app: FastAPI,
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    headers = {"Idempotency-Key": "create-acme-concurrent"}
+
+    responses = await asyncio.gather(
+        *(client.post("/orgs/", json={"name": "Acme"}, headers=headers) for _ in range(8))
+    )
+
+    assert [r.status_code for r in responses] == [201] * 8
+    assert len({r.json()["public_id"] for r in responses}) == 1
+
+    result = await db_session.execute(text("SELECT count(*) FROM organizations"))
+    assert result.scalar_one() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_idempotency_key_purger_deletes_only_expired_keys(
+    app: FastAPI,
+    db_session: AsyncSession,
+) -> None:
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO idempotency_keys (scope, key, request_hash, public_id, expires_at)
+            SELECT 'test', 'expired-' || i, 'x', gen_random_uuid(), now() - interval '1 second'
+            FROM generate_series(1, 5) AS i
+            UNION ALL
+            SELECT 'test', 'live', 'x', gen_random_uuid(), now() + interval '1 hour'
+            """
+        )
+    )
+    await db_session.commit()
+
+    purger = IdempotencyKeyPurger(
+        TransactionExecutor(build_app_uow_factory(app.state.session_factory, app.state.settings)),
+        interval_s=60,
+        batch_size=2,
+    )
+
+    assert await purger.purge() == 5
+    result = await db_session.execute(text("SELECT key FROM idempotency_keys"))
+    assert result.scalars().all() == ["live"]
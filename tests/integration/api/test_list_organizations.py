@@ -0,0 +1,51 @@
+import pytest
+from httpx import AsyncClient
+
+from pet.app.errors import AppErrorCode
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_list_walks_pages_newest_first(client: AsyncClient) -> None:
+    names = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+    for name in names:
+        created = await client.post("/orgs/", json={"name": name})
+        assert created.status_code == 201
+
+    seen: list[str] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        params: dict[str, str | int] = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get("/orgs/", params=params)
+        assert response.status_code == 200
+
+        body = response.json()
+        seen.extend(item["name"] for item in body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == list(reversed(names))
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_list_returns_empty_page(client: AsyncClient) -> None:
+    response = await client.get("/orgs/")
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_list_rejects_malformed_cursor(client: AsyncClient) -> None:
+    response = await client.get("/orgs/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == AppErrorCode.VALIDATION
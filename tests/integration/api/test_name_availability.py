@@ -0,0 +1,52 @@
+import pytest
+from httpx import AsyncClient
+
+from pet.app.errors import AppErrorCode
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_availability_reports_free_name(client: AsyncClient) -> None:
+    response = await client.get("/orgs/availability", params={"name": "  Acme "})
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "Acme", "available": True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_availability_is_invalidated_on_create(
+    client: AsyncClient,
+) -> None:
+    before = await client.get("/orgs/availability", params={"name": "Acme"})
+    created = await client.post("/orgs/", json={"name": "Acme"})
+    after = await client.get("/orgs/availability", params={"name": "Acme"})
+    casefolded = await client.get("/orgs/availability", params={"name": "ACME"})
+
+    assert before.json()["available"] is True
+    assert created.status_code == 201
+    assert after.json()["available"] is False
+    assert casefolded.json()["available"] is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_availability_is_invalidated_on_bulk_create(
+    client: AsyncClient,
+) -> None:
+    before = await client.get("/orgs/availability", params={"name": "Globex"})
+    created = await client.post("/orgs/bulk", json={"names": [" Globex "]})
+    after = await client.get("/orgs/availability", params={"name": "globex"})
+
+    assert before.json()["available"] is True
+    assert created.status_code == 200
+    assert after.json()["available"] is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_availability_rejects_invalid_name(client: AsyncClient) -> None:
+    response = await client.get("/orgs/availability", params={"name": "ab"})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == AppErrorCode.VALIDATION
@@ -0,0 +1,69 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pet.app.errors import AppErrorCode
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_search_ranks_prefix_then_similarity(client: AsyncClient) -> None:
+    for name in ["Acme", "Acme Labs", "Acne Studios", "Globex"]:
+        created = await client.post("/orgs/", json={"name": name})
+        assert created.status_code == 201
+
+    response = await client.get("/orgs/search", params={"q": " ACME "})
+
+    assert response.status_code == 200
+    names = [item["name"] for item in response.json()["items"]]
+    assert names[:2] == ["Acme", "Acme Labs"]
+    assert "Globex" not in names
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_search_caps_results(client: AsyncClient) -> None:
+    response = await client.post("/orgs/bulk", json={"names": [f"Initech {i}" for i in range(5)]})
+    assert response.json()["created"] == 5
+
+    response = await client.get("/orgs/search", params={"q": "initech", "limit": 3})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_search_treats_like_wildcards_literally(
+    client: AsyncClient,
+) -> None:
+    created = await client.post("/orgs/", json={"name": "Acme"})
+    assert created.status_code == 201
+
+    response = await client.get("/orgs/search", params={"q": "%%%"})
+
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_api_organizations_search_rejects_short_term(client: AsyncClient) -> None:
+    response = await client.get("/orgs/search", params={"q": " ab "})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == AppErrorCode.VALIDATION
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_organizations_name_canonical_has_trigram_index(db_session: AsyncSession) -> None:
+    result = await db_session.execute(
+        text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE indexname = 'ix_organizations_name_canonical_trgm'"
+        )
+    )
+
+    assert "gin_trgm_ops" in result.scalar_one()
@@ -0,0 +1,69 @@
+import asyncio
+from typing import Any
+
+import pytest
+from asgi_lifespan import LifespanManager
+from pytest_mock import MockerFixture
+from sqlalchemy import text
+
+from pet.app.errors import ServiceShuttingDownError
+from pet.app.transaction_executor import TransactionExecutor
+from pet.config.settings import Settings, ShutdownSettings
+from pet.di.db import build_app_uow_factory
+from pet.main import create_app
+
+
+async def _sleep_in_db(uow: Any, seconds: float) -> int:
+    result = await uow.session.execute(text("SELECT 1 FROM pg_sleep(:s)"), {"s": seconds})
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_shutdown_waits_for_transactions_in_flight(
+    test_settings: Settings,
+    mocker: MockerFixture,
+) -> None:
+    logger = mocker.patch("pet.main.logger")
+    app = create_app(settings=test_settings)
+
+    async with LifespanManager(app):
+        executor = TransactionExecutor(
+            build_app_uow_factory(app.state.session_factory, test_settings),
+            drain=app.state.drain,
+        )
+        in_flight = asyncio.create_task(executor.run(_sleep_in_db, 0.3))
+        await asyncio.sleep(0.05)
+
+    assert await in_flight == 1
+    with pytest.raises(ServiceShuttingDownError):
+        await executor.run(_sleep_in_db, 0)
+
+    drained = next(c for c in logger.info.call_args_list if c.args == ("shutdown_drained",))
+    assert drained.kwargs["drained"] == 1
+    assert drained.kwargs["aborted"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_shutdown_reports_transactions_past_the_deadline_as_aborted(
+    test_settings: Settings,
+    mocker: MockerFixture,
+) -> None:
+    logger = mocker.patch("pet.main.logger")
+    settings = test_settings.model_copy(
+        update={"shutdown": ShutdownSettings(drain_deadline_ms=50.0)}
+    )
+    app = create_app(settings=settings)
+
+    async with LifespanManager(app):
+        executor = TransactionExecutor(
+            build_app_uow_factory(app.state.session_factory, settings),
+            drain=app.state.drain,
+        )
+        in_flight = asyncio.create_task(executor.run(_sleep_in_db, 1.0))
+        await asyncio.sleep(0.05)
+
+    drained = next(c for c in logger.info.call_args_list if c.args == ("shutdown_drained",))
+    assert drained.kwargs["aborted"] == 1
+    await asyncio.gather(in_flight, return_exceptions=True)
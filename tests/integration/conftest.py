@@ -84,6 +84,7 @@ async def clean_db(app: FastAPI) -> None:
             text(
                 """
                 TRUNCATE TABLE
+                    idempotency_keys,
                     memberships,
                     tasks,
                     projects,
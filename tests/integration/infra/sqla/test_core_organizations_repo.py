@@ -0,0 +1,75 @@
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pet.app.errors import AppErrorCode
+from pet.config.settings import OrganizationWriteSettings, Settings
+from pet.domain.models import Organization
+from pet.domain.value_objects import Name, PublicId
+from pet.infra.sqla.db.exc import PersistenceError, PersistenceErrorKind
+from pet.infra.sqla.db.repos import SQLAlchemyCoreOrganizationsRepo
+from pet.main import create_app
+
+
+def _org(name: str) -> Organization:
+    return Organization.create(public_id=PublicId.create(uuid4()), name=Name.create(name))
+
+
+@pytest_asyncio.fixture
+async def core_client(test_settings: Settings) -> AsyncIterator[AsyncClient]:
+    settings = test_settings.model_copy(
+        update={"organization_write": OrganizationWriteSettings(repository="core")}
+    )
+    app = create_app(settings=settings)
+    async with (
+        LifespanManager(app),
+        AsyncClient(
+            transport=ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as http_client,
+    ):
+        yield http_client
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_core_create_returns_server_generated_fields(db_session: AsyncSession) -> None:
+    org = _org("Straße GmbH")
+
+    created = await SQLAlchemyCoreOrganizationsRepo(db_session).create(org)
+    await db_session.commit()
+
+    assert created == org
+    assert created.id is not None
+    assert created.name_canonical == "strasse gmbh"
+    assert created.created_at is not None
+    assert created.updated_at is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_core_create_reports_taken_name_immediately(db_session: AsyncSession) -> None:
+    repo = SQLAlchemyCoreOrganizationsRepo(db_session)
+    await repo.create(_org("Acme"))
+
+    with pytest.raises(PersistenceError) as exc_info:
+        await repo.create(_org("ACME"))
+
+    assert exc_info.value.kind is PersistenceErrorKind.UNIQUE
+    assert exc_info.value.constraint_name == "uq_organizations_name_canonical"
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_create_organization_through_core_repo(core_client: AsyncClient) -> None:
+    created = await core_client.post("/orgs/", json={"name": "Acme"})
+    duplicate = await core_client.post("/orgs/", json={"name": "acme"})
+
+    assert created.status_code == 201
+    assert duplicate.status_code == 409
+    assert duplicate.json()["code"] == AppErrorCode.ORGANIZATION_NAME_TAKEN
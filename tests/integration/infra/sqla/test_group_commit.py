@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pet.app.errors import AppError, AppErrorCode
+from pet.app.transaction_executor import GroupCommitter
+from pet.app.usecases.organizations import CreateOrganizationCmdIn, create_organization_cmd
+from pet.config.settings import OrganizationsRepoKind, OrganizationWriteSettings, Settings
+from pet.di.db import build_app_uow_factory
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.parametrize("repository", ["orm", "core"])
+async def test_group_commit_rolls_back_only_the_duplicate_to_its_savepoint(
+    app: FastAPI,
+    db_session: AsyncSession,
+    test_settings: Settings,
+    repository: OrganizationsRepoKind,
+) -> None:
+    settings = test_settings.model_copy(
+        update={"organization_write": OrganizationWriteSettings(repository=repository)}
+    )
+    committer = GroupCommitter(
+        build_app_uow_factory(app.state.session_factory, settings),
+        window_s=1.0,
+        max_batch_size=3,
+    )
+
+    # Three calls fill the batch, so they share one transaction.
+    results = await asyncio.gather(
+        *(
+            committer.submit(create_organization_cmd, CreateOrganizationCmdIn(name=name))
+            for name in ("Acme", "ACME", "Globex")
+        ),
+        return_exceptions=True,
+    )
+    await committer.close()
+
+    acme, duplicate, globex = results
+    assert isinstance(duplicate, AppError)
+    assert duplicate.code == AppErrorCode.ORGANIZATION_NAME_TAKEN
+    assert not isinstance(acme, BaseException)
+    assert not isinstance(globex, BaseException)
+
+    rows = await db_session.execute(text("SELECT name FROM organizations ORDER BY name"))
+    assert rows.scalars().all() == ["Acme", "Globex"]
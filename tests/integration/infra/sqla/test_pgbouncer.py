@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from testcontainers.core.container import DockerContainer  # type: ignore
+from testcontainers.core.wait_strategies import LogMessageWaitStrategy  # type: ignore
+from testcontainers.postgres import PostgresContainer  # type: ignore
+
+from pet.config.settings import DatabaseSettings, EngineSettings, Settings
+from pet.infra.sqla.db.connection import SessionStateError, create_engine
+from pet.main import create_app
+
+PGBOUNCER_PORT = 6432
+
+
+@pytest.fixture(scope="session")
+def pgbouncer_container(
+    postgres_container: PostgresContainer,
+    migrated_postgres_db: None,
+) -> Iterator[DockerContainer]:
+    postgres_ip = postgres_container.get_docker_client().bridge_ip(
+        postgres_container.get_wrapped_container().id
+    )
+    container = (
+        DockerContainer("edoburu/pgbouncer:latest")
+        .with_env("DB_HOST", postgres_ip)
+        .with_env("DB_PORT", "5432")
+        .with_env("DB_USER", postgres_container.username)
+        .with_env("DB_PASSWORD", postgres_container.password)
+        .with_env("DB_NAME", postgres_container.dbname)
+        .with_env("AUTH_TYPE", "scram-sha-256")
+        .with_env("POOL_MODE", "transaction")
+        # Fewer server connections than clients, so transactions hop between them.
+        .with_env("DEFAULT_POOL_SIZE", "2")
+        .with_env("LISTEN_PORT", str(PGBOUNCER_PORT))
+        .with_exposed_ports(PGBOUNCER_PORT)
+        .waiting_for(LogMessageWaitStrategy("process up"))
+    )
+    with container:
+        yield container
+
+
+@pytest.fixture(scope="session")
+def pgbouncer_settings(
+    postgres_container: PostgresContainer,
+    pgbouncer_container: DockerContainer,
+) -> Settings:
+    return Settings(
+        app_name="pet-uk4wa",
+        db=DatabaseSettings(
+            driver="postgresql+asyncpg",
+            host=pgbouncer_container.get_container_host_ip(),
+            port=int(pgbouncer_container.get_exposed_port(PGBOUNCER_PORT)),
+            user=postgres_container.username,
+            password=SecretStr(postgres_container.password),
+            name=postgres_container.dbname,
+        ),
+        engine=EngineSettings(mode="pgbouncer_transaction", pool_size=8, max_overflow=0),
+    )
+
+
+async def _run_parametrized_selects(engine: AsyncEngine, *, workers: int, rounds: int) -> None:
+    async def worker(offset: int) -> None:
+        for value in range(rounds):
+            async with engine.begin() as conn:
+                result = await conn.execute(
+                    text("SELECT CAST(:value AS integer) + 1"),
+                    {"value": offset + value},
+                )
+                assert result.scalar_one() == offset + value + 1
+
+    await asyncio.gather(*(worker(i * rounds) for i in range(workers)))
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.parametrize("null_pool", [False, True])
+async def test_prepared_statements_survive_server_connection_switches(
+    pgbouncer_settings: Settings,
+    null_pool: bool,
+) -> None:
+    engine = create_engine(
+        url=pgbouncer_settings.db_url,
+        pool_size=8,
+        max_overflow=0,
+        pgbouncer_transaction_mode=True,
+        null_pool=null_pool,
+    )
+    try:
+        await _run_parametrized_selects(engine, workers=8, rounds=20)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_session_level_statements_are_rejected(pgbouncer_settings: Settings) -> None:
+    engine = create_engine(url=pgbouncer_settings.db_url, pgbouncer_transaction_mode=True)
+    try:
+        with pytest.raises(SessionStateError):
+            async with engine.begin() as conn:
+                await conn.execute(text("SET statement_timeout = 1000"))
+
+        async with engine.begin() as conn:
+            await conn.execute(text("SET LOCAL statement_timeout = 1000"))
+            await conn.execute(text("SET TRANSACTION READ ONLY"))
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_app_serves_requests_through_pgbouncer(pgbouncer_settings: Settings) -> None:
+    app = create_app(settings=pgbouncer_settings)
+    async with (
+        LifespanManager(app),
+        AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client,
+    ):
+        created = await asyncio.gather(
+            *(client.post("/orgs/", json={"name": f"pgbouncer-{i}"}) for i in range(16))
+        )
+        assert [response.status_code for response in created] == [201] * 16
+
+        public_id = created[0].json()["public_id"]
+        response = await client.get(f"/orgs/{public_id}")
+        assert response.status_code == 200
+        assert response.json()["name"] == "pgbouncer-0"
+
+        response = await client.get("/readyz")
+        assert response.status_code == 200
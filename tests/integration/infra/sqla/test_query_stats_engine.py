@@ -0,0 +1,52 @@
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pet.config.settings import Settings
+from pet.infra.sqla.db.connection import create_engine
+from pet.infra.sqla.db.query_stats import QueryStats, fingerprint, instrument_queries
+
+
+def _engine(test_settings: Settings) -> AsyncEngine:
+    return create_engine(url=test_settings.db_url, pool_size=1, max_overflow=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_statements_are_timed_per_fingerprint(test_settings: Settings) -> None:
+    engine = _engine(test_settings)
+    stats = QueryStats()
+    instrument_queries(engine, slow_threshold_s=60.0, stats=stats)
+    try:
+        async with engine.connect() as conn:
+            for value in range(3):
+                await conn.execute(text("SELECT :value"), {"value": value})
+    finally:
+        await engine.dispose()
+
+    entry = next(e for e in stats.top(10) if e.fingerprint == fingerprint("SELECT $1"))
+    assert entry.calls == 3
+    assert entry.total_s > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_slow_select_is_explained_without_breaking_the_transaction(
+    test_settings: Settings,
+    mocker: MockerFixture,
+) -> None:
+    logger = mocker.patch("pet.infra.sqla.db.query_stats.logger")
+    engine = _engine(test_settings)
+    instrument_queries(engine, slow_threshold_s=0.0, explain=True, stats=QueryStats())
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT pg_sleep(0.01)"))
+            result = await conn.execute(text("SELECT 1"))
+            assert result.scalar_one() == 1
+    finally:
+        await engine.dispose()
+
+    slow_queries = [c for c in logger.warning.call_args_list if c.args == ("slow_query",)]
+    assert slow_queries
+    assert any("Execution Time" in line for line in slow_queries[0].kwargs["plan"])
@@ -0,0 +1,63 @@
+from collections.abc import AsyncIterator
+
+import asyncpg
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pet.config.settings import Settings
+from pet.tools.load import LOAD_SPECS, load
+
+
+@pytest_asyncio.fixture
+async def pg_conn(test_settings: Settings) -> AsyncIterator[asyncpg.Connection]:
+    dsn = test_settings.db_url.set(drivername="postgresql").render_as_string(hide_password=False)
+    conn = await asyncpg.connect(dsn)
+    try:
+        yield conn
+    finally:
+        await conn.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_load_merges_rows_and_resolves_public_id_references(
+    pg_conn: asyncpg.Connection,
+    db_session: AsyncSession,
+) -> None:
+    org_public_id = "11111111-1111-1111-1111-111111111111"
+
+    orgs = await load(
+        pg_conn,
+        LOAD_SPECS["organizations"],
+        [
+            {"public_id": org_public_id, "name": "Acme"},
+            {"name": "ACME"},
+            {"name": "Globex"},
+        ],
+    )
+    projects = await load(
+        pg_conn,
+        LOAD_SPECS["projects"],
+        [
+            {"name": "Rocket", "org_public_id": org_public_id},
+            {"name": "Orphan", "org_public_id": "22222222-2222-2222-2222-222222222222"},
+        ],
+    )
+
+    assert (orgs.rows_inserted, orgs.rows_skipped) == (2, 1)
+    assert (projects.rows_inserted, projects.rows_skipped) == (1, 1)
+
+    result = await db_session.execute(
+        text(
+            """
+            SELECT p.name
+            FROM projects AS p
+            JOIN organizations AS o ON o.id = p.org_id
+            WHERE o.public_id = CAST(:public_id AS uuid)
+            """
+        ),
+        {"public_id": org_public_id},
+    )
+    assert result.scalars().all() == ["Rocket"]
@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+
+from pet.app.transaction_executor import TransactionExecutor
+from pet.config.settings import Settings
+from pet.di.db import build_uow_factory
+from pet.infra.sqla.db.connection import create_engine, create_session_maker
+from pet.tools.export import export
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_export_writes_every_organization(
+    test_settings: Settings,
+    client: AsyncClient,
+    tmp_path: Path,
+) -> None:
+    created = await client.post("/orgs/bulk", json={"names": ["Acme", "Globex", "Initech"]})
+    assert created.json()["created"] == 3
+
+    engine = create_engine(url=test_settings.db_url, pool_size=1, max_overflow=0)
+    executor = TransactionExecutor(build_uow_factory(create_session_maker(bind=engine)))
+    path = tmp_path / "orgs.ndjson"
+    try:
+        with path.open("wb") as out:
+            stats = await export(executor, out, batch_size=2)
+    finally:
+        await engine.dispose()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["name"] for line in lines] == ["Acme", "Globex", "Initech"]
+    assert stats.rows_written == 3
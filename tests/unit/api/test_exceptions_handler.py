@@ -0,0 +1,133 @@
+import json
+
+import pytest
+from fastapi.responses import ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel, SecretStr, StrictStr
+
+from pet.api.exceptions_handler import PROBLEM_MEDIA_TYPE, problem
+from pet.app.errors import AppErrorCode, ServiceOverloadedError
+from pet.config.settings import DatabaseSettings, Settings
+from pet.main import create_app
+
+
+def test_problem_renders_payload_straight_to_bytes() -> None:
+    response = problem(
+        title="Validation Error",
+        status=422,
+        detail="Name is too short",
+        code="validation_error",
+        errors=[
+            {
+                "loc": ("body", "name"),
+                "input": "ab",
+                "ctx": {"error": ValueError("Name is too short")},
+            }
+        ],
+        headers={"Retry-After": "1"},
+    )
+
+    assert response.status_code == 422
+    assert response.media_type == PROBLEM_MEDIA_TYPE
+    assert response.headers["retry-after"] == "1"
+    assert json.loads(response.body) == {
+        "type": "about:blank",
+        "title": "Validation Error",
+        "status": 422,
+        "detail": "Name is too short",
+        "code": "validation_error",
+        "errors": [{"loc": ["body", "name"], "input": "ab", "ctx": {"error": "Name is too short"}}],
+    }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (123456789012345678901234567890, 123456789012345678901234567890),
+        (b"raw body", "raw body"),
+    ],
+)
+def test_problem_renders_values_orjson_cannot_serialize(value: object, expected: object) -> None:
+    response = problem(
+        title="Validation Error",
+        status=422,
+        errors=[{"loc": ("body", "name"), "input": value, "ctx": {"error": ValueError("bad")}}],
+    )
+
+    assert json.loads(response.body)["errors"] == [
+        {"loc": ["body", "name"], "input": expected, "ctx": {"error": "bad"}}
+    ]
+
+
+def test_app_uses_orjson_default_response_class() -> None:
+    settings = Settings(
+        db=DatabaseSettings(
+            driver="postgresql+asyncpg",
+            host="localhost",
+            name="pet",
+            user="pet",
+            port=5432,
+            password=SecretStr("pet"),
+        )
+    )
+
+    app = create_app(settings)
+
+    assert app.router.default_response_class is ORJSONResponse
+
+
+@pytest.mark.asyncio
+async def test_app_error_with_retry_after_renders_header() -> None:
+    app = create_app(
+        Settings(
+            db=DatabaseSettings(
+                driver="postgresql+asyncpg",
+                host="localhost",
+                name="pet",
+                user="pet",
+                port=5432,
+                password=SecretStr("pet"),
+            )
+        )
+    )
+
+    @app.get("/overloaded")
+    async def overloaded() -> None:
+        raise ServiceOverloadedError(retry_after_s=2)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/overloaded")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+    assert response.json()["code"] == AppErrorCode.SERVICE_UNAVAILABLE
+
+
+@pytest.mark.asyncio
+async def test_validation_error_with_oversized_integer_input_returns_422() -> None:
+    app = create_app(
+        Settings(
+            db=DatabaseSettings(
+                driver="postgresql+asyncpg",
+                host="localhost",
+                name="pet",
+                user="pet",
+                port=5432,
+                password=SecretStr("pet"),
+            )
+        )
+    )
+
+    class NameIn(BaseModel):
+        name: StrictStr
+
+    @app.post("/names")
+    async def create_name(body: NameIn) -> None:
+        return None
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/names", json={"name": 123456789012345678901234567890})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == AppErrorCode.VALIDATION
+    assert response.json()["errors"][0]["input"] == 123456789012345678901234567890
@@ -0,0 +1,34 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from pet.api.http_cache import etag_matches, format_http_date, make_etag
+
+
+def test_make_etag_changes_with_updated_at() -> None:
+    updated_at = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=UTC)
+
+    assert make_etag(updated_at) == make_etag(updated_at.astimezone(timezone(timedelta(hours=3))))
+    assert make_etag(updated_at) != make_etag(updated_at + timedelta(microseconds=1))
+    assert make_etag(updated_at).startswith('"')
+
+
+def test_format_http_date_uses_gmt() -> None:
+    updated_at = datetime(2026, 1, 2, 6, 4, 5, tzinfo=timezone(timedelta(hours=3)))
+
+    assert format_http_date(updated_at) == "Fri, 02 Jan 2026 03:04:05 GMT"
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(if_none_match: str | None, expected: bool) -> None:
+    assert etag_matches(if_none_match, '"abc"') is expected
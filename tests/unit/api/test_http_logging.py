@@ -1,5 +1,9 @@
+from collections.abc import AsyncIterator
+
 import pytest
-from fastapi import FastAPI, Response
+import structlog
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
 from httpx import ASGITransport, AsyncClient
 
 from pet.api.middleware.http_logging import register_http_logging
@@ -61,3 +65,71 @@ async def test_http_logging_logs_4xx_as_warning(mocker) -> None:
 
     assert response.status_code == 409
     info_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_http_logging_records_latency_by_route_template(mocker) -> None:
+    app = FastAPI()
+    register_http_logging(app)
+
+    @app.get("/things/{thing_id}")
+    async def get_thing(thing_id: str) -> Response:
+        return Response(status_code=204)
+
+    mocker.patch("pet.api.middleware.http_logging.logger.info")
+    observe_mock = mocker.patch("pet.api.middleware.http_logging.observe_http_request")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/things/1")
+        await client.get("/missing")
+
+    assert [call.args[:3] for call in observe_mock.call_args_list] == [
+        ("GET", "/things/{thing_id}", 204),
+        ("GET", "unmatched", 404),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_http_logging_propagates_request_id_into_endpoint_context(mocker) -> None:
+    app = FastAPI()
+    register_http_logging(app)
+
+    @app.get("/context")
+    async def context(request: Request) -> dict[str, object]:
+        return {
+            "state": request.state.request_id,
+            "bound": structlog.contextvars.get_contextvars().get("request_id"),
+        }
+
+    mocker.patch("pet.api.middleware.http_logging.logger.info")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/context", headers={"X-Request-ID": "req-1"})
+
+    assert response.headers["X-Request-ID"] == "req-1"
+    assert response.json() == {"state": "req-1", "bound": "req-1"}
+    assert structlog.contextvars.get_contextvars() == {}
+
+
+@pytest.mark.asyncio
+async def test_http_logging_logs_streaming_response_after_last_chunk(mocker) -> None:
+    app = FastAPI()
+    register_http_logging(app)
+    info_mock = mocker.patch("pet.api.middleware.http_logging.logger.info")
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in (b"a", b"b"):
+            info_mock.assert_not_called()
+            yield chunk
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse(chunks())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/stream")
+
+    assert response.content == b"ab"
+    assert response.headers["X-Request-ID"]
+    info_mock.assert_called_once()
+    assert info_mock.call_args.kwargs["status_code"] == 200
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from pet.api.ndjson import ndjson_chunks, prepend
+
+
+class Row(BaseModel):
+    n: int
+
+
+async def _rows(count: int):
+    for n in range(count):
+        yield Row(n=n)
+
+
+async def _collect(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks_coalesces_lines_into_chunks() -> None:
+    chunks = await _collect(ndjson_chunks(_rows(5), chunk_size=16))
+
+    assert chunks == [b'{"n":0}\n{"n":1}\n', b'{"n":2}\n{"n":3}\n', b'{"n":4}\n']
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == [
+        {"n": n} for n in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks_yields_nothing_for_empty_input() -> None:
+    assert await _collect(ndjson_chunks(_rows(0))) == []
+
+
+@pytest.mark.asyncio
+async def test_prepend_skips_empty_first_chunk() -> None:
+    rest = ndjson_chunks(_rows(1))
+
+    assert await _collect(prepend(b"", rest)) == [b'{"n":0}\n']
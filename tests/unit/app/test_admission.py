@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from pet.app.admission import AdmissionController
+from pet.app.errors import ServiceOverloadedError
+
+
+@pytest.mark.asyncio
+async def test_admission_admits_up_to_max_concurrency_without_waiting() -> None:
+    admission = AdmissionController(max_concurrency=2, max_queue=0, max_wait_s=1)
+
+    async with admission.admit(), admission.admit():
+        assert admission.in_flight == 2
+
+    stats = admission.stats()
+    assert stats.in_flight == 0
+    assert stats.admitted_total == 2
+    assert stats.rejected_total == 0
+    assert stats.wait_seconds_max == 0.0
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_immediately_when_queue_is_full() -> None:
+    admission = AdmissionController(max_concurrency=1, max_queue=0, max_wait_s=10, retry_after_s=3)
+
+    async with admission.admit():
+        with pytest.raises(ServiceOverloadedError) as exc_info:
+            async with admission.admit():
+                pass
+
+    assert exc_info.value.extra is not None
+    assert exc_info.value.extra["retry_after_s"] == 3
+    assert admission.stats().rejected_total == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_when_wait_budget_runs_out() -> None:
+    admission = AdmissionController(max_concurrency=1, max_queue=1, max_wait_s=0.01)
+
+    async with admission.admit():
+        with pytest.raises(ServiceOverloadedError):
+            async with admission.admit():
+                pass
+
+        assert admission.queue_depth == 0
+
+    assert admission.stats().rejected_total == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_queues_caller_until_slot_is_released() -> None:
+    admission = AdmissionController(max_concurrency=1, max_queue=1, max_wait_s=1)
+    release = asyncio.Event()
+
+    async def holder() -> None:
+        async with admission.admit():
+            await release.wait()
+
+    async def waiter() -> int:
+        async with admission.admit():
+            return admission.in_flight
+
+    holding = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(waiter())
+    await asyncio.sleep(0.01)
+
+    assert admission.queue_depth == 1
+
+    release.set()
+    await holding
+
+    assert await waiting == 1
+    stats = admission.stats()
+    assert stats.admitted_total == 2
+    assert stats.queue_depth == 0
+    assert stats.wait_seconds_max > 0
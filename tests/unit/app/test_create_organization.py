@@ -1,13 +1,36 @@
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import pytest
 from pytest_mock import MockerFixture
 
+from pet.app.errors import OrganizationNameTakenError, UnprocessableEntity
 from pet.app.usecases.organizations import (
+    CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+    CheckOrganizationNameQueryIn,
     CreateOrganizationCmdIn,
+    CreateOrganizationsBulkCmdIn,
+    GetOrganizationQueryIn,
+    ListOrganizationsQueryIn,
+    SearchOrganizationsQueryIn,
+    check_organization_name_query,
     create_organization_cmd,
+    create_organization_request_hash,
+    create_organizations_bulk_cmd,
+    decode_organization_cursor,
+    encode_organization_cursor,
+    get_organization_query,
+    list_organizations_query,
+    search_organizations_query,
 )
-from pet.domain.models import Organization
+from pet.domain.exc import IdempotencyKeyReusedError, InvalidCursorError, ValidationError
+from pet.domain.models import (
+    IdempotencyRecord,
+    Organization,
+    OrganizationCursor,
+    OrganizationPage,
+)
+from pet.domain.value_objects import Name, PublicId
 
 
 @pytest.mark.asyncio
@@ -17,6 +40,7 @@ async def test_create_organization_cmd_creates_domain_org_and_returns_public_id(
     uuid = UUID("11111111-1111-1111-1111-111111111111")
     cmd = CreateOrganizationCmdIn(name="Alice")
     uow = mocker.Mock()
+    uow.orgs.create = mocker.AsyncMock()
     bind_contextvars = mocker.patch(
         "pet.app.usecases.organizations.structlog.contextvars.bind_contextvars"
     )
@@ -28,7 +52,7 @@ async def test_create_organization_cmd_creates_domain_org_and_returns_public_id(
         uuid_gen=lambda: uuid,
     )
 
-    uow.orgs.create.assert_called_once()
+    uow.orgs.create.assert_awaited_once()
     (args,), _ = uow.orgs.create.call_args
 
     assert isinstance(args, Organization)
@@ -38,3 +62,268 @@ async def test_create_organization_cmd_creates_domain_org_and_returns_public_id(
     assert bind_contextvars.call_count == 2
     debug_log.assert_any_call("organization_create_started")
     debug_log.assert_any_call("organization_create_staged")
+
+
+@pytest.mark.asyncio
+async def test_create_organizations_bulk_cmd_reports_per_item_results(
+    mocker: MockerFixture,
+):
+    uuids = iter(
+        [
+            UUID("11111111-1111-1111-1111-111111111111"),
+            UUID("22222222-2222-2222-2222-222222222222"),
+            UUID("33333333-3333-3333-3333-333333333333"),
+        ]
+    )
+    cmd = CreateOrganizationsBulkCmdIn(names=["Acme", "ab", "acme"])
+    uow = mocker.Mock()
+    uow.orgs.create_many = mocker.AsyncMock(
+        return_value={PublicId.create(UUID("11111111-1111-1111-1111-111111111111"))}
+    )
+    mocker.patch("pet.app.usecases.organizations.structlog.contextvars.bind_contextvars")
+
+    results = await create_organizations_bulk_cmd(
+        uow=uow,
+        cmd=cmd,
+        uuid_gen=lambda: next(uuids),
+    )
+
+    (staged,), _ = uow.orgs.create_many.call_args
+    assert [org.name.value for org in staged] == ["Acme", "acme"]
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].public_id is not None
+    assert results[0].public_id.val == UUID("11111111-1111-1111-1111-111111111111")
+    assert results[0].error is None
+    assert isinstance(results[1].error, UnprocessableEntity)
+    assert results[1].error.detail == "Name is too short"
+    assert isinstance(results[2].error, OrganizationNameTakenError)
+    assert results[2].public_id is None
+
+
+@pytest.mark.asyncio
+async def test_create_organization_cmd_replays_stored_idempotent_result(
+    mocker: MockerFixture,
+):
+    stored_public_id = UUID("22222222-2222-2222-2222-222222222222")
+    cmd = CreateOrganizationCmdIn(name="Alice", idempotency_key="retry-1")
+    uow = mocker.Mock()
+    uow.idempotency.get = mocker.AsyncMock(
+        return_value=IdempotencyRecord(
+            scope=CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+            key="retry-1",
+            request_hash=create_organization_request_hash(cmd),
+            public_id=PublicId.create(stored_public_id),
+        )
+    )
+    uow.idempotency.save = mocker.AsyncMock()
+
+    result = await create_organization_cmd(uow=uow, cmd=cmd)
+
+    assert result.val == stored_public_id
+    uow.idempotency.get.assert_awaited_once_with(CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE, "retry-1")
+    uow.orgs.create.assert_not_called()
+    uow.idempotency.save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_organization_cmd_rejects_idempotency_key_reused_for_other_payload(
+    mocker: MockerFixture,
+):
+    uow = mocker.Mock()
+    uow.idempotency.get = mocker.AsyncMock(
+        return_value=IdempotencyRecord(
+            scope=CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+            key="retry-1",
+            request_hash=create_organization_request_hash(CreateOrganizationCmdIn(name="Bob")),
+            public_id=PublicId.create(UUID("22222222-2222-2222-2222-222222222222")),
+        )
+    )
+
+    with pytest.raises(IdempotencyKeyReusedError):
+        await create_organization_cmd(
+            uow=uow,
+            cmd=CreateOrganizationCmdIn(name="Alice", idempotency_key="retry-1"),
+        )
+
+    uow.orgs.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_organization_cmd_saves_idempotency_record(
+    mocker: MockerFixture,
+):
+    uuid = UUID("11111111-1111-1111-1111-111111111111")
+    cmd = CreateOrganizationCmdIn(name="Alice", idempotency_key="retry-1")
+    uow = mocker.Mock()
+    uow.orgs.create = mocker.AsyncMock()
+    uow.idempotency.get = mocker.AsyncMock(return_value=None)
+    uow.idempotency.save = mocker.AsyncMock(return_value=None)
+
+    result = await create_organization_cmd(
+        uow=uow,
+        cmd=cmd,
+        uuid_gen=lambda: uuid,
+        idempotency_ttl=timedelta(minutes=5),
+    )
+
+    assert result.val == uuid
+    uow.orgs.create.assert_awaited_once()
+    (record,), kwargs = uow.idempotency.save.call_args
+    assert record.key == "retry-1"
+    assert record.public_id.value == uuid
+    assert record.request_hash == create_organization_request_hash(cmd)
+    assert kwargs == {"ttl": timedelta(minutes=5)}
+
+
+@pytest.mark.asyncio
+async def test_create_organization_cmd_replays_record_saved_by_concurrent_request(
+    mocker: MockerFixture,
+):
+    stored_public_id = UUID("22222222-2222-2222-2222-222222222222")
+    cmd = CreateOrganizationCmdIn(name="Alice", idempotency_key="retry-1")
+    uow = mocker.Mock()
+    uow.orgs.create = mocker.AsyncMock()
+    uow.idempotency.get = mocker.AsyncMock(return_value=None)
+    uow.idempotency.save = mocker.AsyncMock(
+        return_value=IdempotencyRecord(
+            scope=CREATE_ORGANIZATION_IDEMPOTENCY_SCOPE,
+            key="retry-1",
+            request_hash=create_organization_request_hash(cmd),
+            public_id=PublicId.create(stored_public_id),
+        )
+    )
+
+    result = await create_organization_cmd(uow=uow, cmd=cmd)
+
+    assert result.val == stored_public_id
+    uow.orgs.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_check_organization_name_query_looks_up_canonical_name(
+    mocker: MockerFixture,
+):
+    uow = mocker.Mock()
+    uow.orgs.exists_by_canonical_name = mocker.AsyncMock(return_value=True)
+
+    result = await check_organization_name_query(
+        uow=uow,
+        query=CheckOrganizationNameQueryIn(name="  ACME  "),
+    )
+
+    uow.orgs.exists_by_canonical_name.assert_awaited_once_with("acme")
+    assert result.name == "ACME"
+    assert result.name_canonical == "acme"
+    assert result.available is False
+
+
+@pytest.mark.asyncio
+async def test_get_organization_query_returns_view_of_stored_org(mocker: MockerFixture):
+    public_id = UUID("11111111-1111-1111-1111-111111111111")
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    updated_at = datetime(2026, 1, 2, tzinfo=UTC)
+    uow = mocker.Mock()
+    uow.orgs.get_by_public_id = mocker.AsyncMock(
+        return_value=Organization(
+            public_id=PublicId.create(public_id),
+            name=Name.create("Acme"),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+    )
+
+    result = await get_organization_query(uow=uow, query=GetOrganizationQueryIn(public_id))
+
+    uow.orgs.get_by_public_id.assert_awaited_once_with(PublicId.create(public_id))
+    assert result is not None
+    assert result.public_id == public_id
+    assert result.name == "Acme"
+    assert result.created_at == created_at
+    assert result.updated_at == updated_at
+
+
+@pytest.mark.asyncio
+async def test_get_organization_query_returns_none_for_unknown_org(mocker: MockerFixture):
+    uow = mocker.Mock()
+    uow.orgs.get_by_public_id = mocker.AsyncMock(return_value=None)
+
+    result = await get_organization_query(
+        uow=uow,
+        query=GetOrganizationQueryIn(UUID("11111111-1111-1111-1111-111111111111")),
+    )
+
+    assert result is None
+
+
+def test_organization_cursor_round_trips_through_opaque_token():
+    cursor = OrganizationCursor(created_at=datetime(2026, 5, 1, 1, 2, 3, 456789, tzinfo=UTC), id=42)
+
+    token = encode_organization_cursor(cursor)
+
+    assert "=" not in token
+    assert decode_organization_cursor(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["!!", "abc", "OTk5OTk5OTk5OTk5OTk5OTk5OTk5OjE"])
+def test_decode_organization_cursor_rejects_malformed_tokens(token: str):
+    with pytest.raises(InvalidCursorError):
+        decode_organization_cursor(token)
+
+
+@pytest.mark.asyncio
+async def test_list_organizations_query_seeks_after_cursor(mocker: MockerFixture):
+    after = OrganizationCursor(created_at=datetime(2026, 1, 3, tzinfo=UTC), id=7)
+    next_cursor = OrganizationCursor(created_at=datetime(2026, 1, 2, tzinfo=UTC), id=5)
+    org = Organization(
+        public_id=PublicId.create(UUID("11111111-1111-1111-1111-111111111111")),
+        name=Name.create("Acme"),
+        created_at=next_cursor.created_at,
+        updated_at=next_cursor.created_at,
+    )
+    uow = mocker.Mock()
+    uow.orgs.list_page = mocker.AsyncMock(
+        return_value=OrganizationPage(items=(org,), next_cursor=next_cursor)
+    )
+
+    result = await list_organizations_query(
+        uow=uow,
+        query=ListOrganizationsQueryIn(limit=1, cursor=encode_organization_cursor(after)),
+    )
+
+    uow.orgs.list_page.assert_awaited_once_with(limit=1, after=after)
+    assert [item.name for item in result.items] == ["Acme"]
+    assert result.next_cursor is not None
+    assert decode_organization_cursor(result.next_cursor) == next_cursor
+
+
+@pytest.mark.asyncio
+async def test_search_organizations_query_searches_canonical_term(mocker: MockerFixture):
+    public_id = UUID("11111111-1111-1111-1111-111111111111")
+    uow = mocker.Mock()
+    uow.orgs.search_by_canonical_name = mocker.AsyncMock(
+        return_value=[
+            Organization(public_id=PublicId.create(public_id), name=Name.create("Straße"))
+        ]
+    )
+
+    result = await search_organizations_query(
+        uow=uow,
+        query=SearchOrganizationsQueryIn(q="  STRASSE ", limit=5),
+    )
+
+    uow.orgs.search_by_canonical_name.assert_awaited_once_with("strasse", limit=5)
+    assert [(match.public_id, match.name) for match in result] == [(public_id, "Straße")]
+
+
+@pytest.mark.asyncio
+async def test_search_organizations_query_rejects_short_term(mocker: MockerFixture):
+    uow = mocker.Mock()
+    uow.orgs.search_by_canonical_name = mocker.AsyncMock()
+
+    with pytest.raises(ValidationError, match="too short"):
+        await search_organizations_query(
+            uow=uow, query=SearchOrganizationsQueryIn(q=" ab ", limit=5)
+        )
+
+    uow.orgs.search_by_canonical_name.assert_not_awaited()
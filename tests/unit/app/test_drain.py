@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from pet.app.drain import DrainController
+from pet.app.errors import ServiceShuttingDownError
+
+
+@pytest.mark.asyncio
+async def test_drain_returns_at_once_when_nothing_is_in_flight() -> None:
+    drain = DrainController()
+
+    result = await drain.drain(deadline_s=10)
+
+    assert (result.drained, result.aborted) == (0, 0)
+    assert drain.draining
+
+
+@pytest.mark.asyncio
+async def test_drain_rejects_new_units_of_work() -> None:
+    drain = DrainController(retry_after_s=3)
+    await drain.drain(deadline_s=0)
+
+    with pytest.raises(ServiceShuttingDownError) as exc_info:
+        async with drain.track():
+            pass
+
+    assert exc_info.value.extra is not None
+    assert exc_info.value.extra["retry_after_s"] == 3
+    assert drain.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_begin_marks_draining_but_still_accepts_units_of_work() -> None:
+    drain = DrainController()
+    drain.begin()
+
+    async with drain.track():
+        assert drain.in_flight == 1
+
+    assert drain.draining
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_units_of_work_in_flight() -> None:
+    drain = DrainController()
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def unit_of_work() -> None:
+        async with drain.track():
+            started.set()
+            await release.wait()
+
+    task = asyncio.create_task(unit_of_work())
+    await started.wait()
+
+    draining = asyncio.create_task(drain.drain(deadline_s=10))
+    await asyncio.sleep(0)
+    assert not draining.done()
+
+    release.set()
+    result = await draining
+    await task
+
+    assert (result.drained, result.aborted) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_drain_reports_units_of_work_still_running_at_deadline_as_aborted() -> None:
+    drain = DrainController()
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def unit_of_work() -> None:
+        async with drain.track():
+            started.set()
+            await release.wait()
+
+    tasks = [asyncio.create_task(unit_of_work()) for _ in range(2)]
+    await started.wait()
+
+    result = await drain.drain(deadline_s=0.01)
+
+    assert (result.drained, result.aborted) == (0, 2)
+    release.set()
+    await asyncio.gather(*tasks)
+    assert drain.in_flight == 0
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pet.app.idempotency import IdempotencyKeyPurger
+from pet.app.usecases.idempotency import purge_expired_idempotency_keys_cmd
+
+
+@pytest.mark.asyncio
+async def test_purger_runs_batches_until_one_comes_back_short(mocker: MockerFixture) -> None:
+    executor = mocker.Mock()
+    executor.run = mocker.AsyncMock(side_effect=[2, 2, 1])
+    purger = IdempotencyKeyPurger(executor, interval_s=60, batch_size=2)
+
+    assert await purger.purge() == 5
+    assert executor.run.await_count == 3
+    handler, cmd = executor.run.await_args.args
+    assert handler is purge_expired_idempotency_keys_cmd
+    assert cmd.batch_size == 2
+
+
+@pytest.mark.asyncio
+async def test_purger_keeps_running_after_a_failed_purge(mocker: MockerFixture) -> None:
+    logger = mocker.patch("pet.app.idempotency.logger")
+    purged_again = asyncio.Event()
+
+    async def run(*args: object) -> int:
+        if not logger.exception.called:
+            raise RuntimeError("db down")
+        purged_again.set()
+        return 0
+
+    executor = mocker.Mock()
+    executor.run = run
+    purger = IdempotencyKeyPurger(executor, interval_s=0.001, batch_size=10)
+
+    purger.start()
+    async with asyncio.timeout(1):
+        await purged_again.wait()
+    await purger.close()
+
+    logger.exception.assert_called_once_with("idempotency_keys_purge_failed")
@@ -0,0 +1,248 @@
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import orjson
+import pytest
+import structlog
+from pytest_mock import MockerFixture
+
+from pet.config.logging import (
+    LogSampler,
+    QueueLogHandler,
+    configure_logging,
+    flush_logging,
+    get_logger,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        super().__init__()
+        self.gate = gate
+        self.messages: list[str] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait(1)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+
+@pytest.fixture
+def reset_logging() -> Iterator[None]:
+    yield
+    configure_logging()
+
+
+def test_queue_handler_writes_records_on_background_thread() -> None:
+    target = RecordingHandler()
+    handler = QueueLogHandler(target)
+
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+    handler.flush()
+
+    assert target.messages == ["first", "second"]
+    assert target.threads == {"log-writer"}
+    handler.close()
+
+
+def test_queue_handler_drops_and_counts_records_when_full() -> None:
+    gate = threading.Event()
+    target = RecordingHandler(gate)
+    handler = QueueLogHandler(target, max_size=1, overflow="drop")
+
+    for i in range(10):
+        handler.handle(_record(f"msg-{i}"))
+    gate.set()
+    handler.close()
+
+    assert handler.dropped > 0
+    assert len(target.messages) + handler.dropped == 10
+
+
+def test_queue_handler_blocks_instead_of_dropping() -> None:
+    target = RecordingHandler()
+    handler = QueueLogHandler(target, max_size=1, overflow="block")
+
+    for i in range(50):
+        handler.handle(_record(f"msg-{i}"))
+    handler.close()
+
+    assert handler.dropped == 0
+    assert target.messages == [f"msg-{i}" for i in range(50)]
+
+
+def test_queue_handler_writes_synchronously_after_close() -> None:
+    target = RecordingHandler()
+    handler = QueueLogHandler(target)
+    handler.close()
+
+    handler.handle(_record("late"))
+
+    assert target.messages == ["late"]
+    assert target.threads == {threading.current_thread().name}
+
+
+def test_queued_logging_keeps_context_and_tracebacks(
+    capsys: pytest.CaptureFixture[str],
+    reset_logging: None,
+) -> None:
+    configure_logging(queue_enabled=True)
+    logger = get_logger("test_queued_logging")
+
+    structlog.contextvars.bind_contextvars(request_id="req-1")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("operation_failed")
+    finally:
+        # Cleared before the writer thread renders the record.
+        structlog.contextvars.clear_contextvars()
+    flush_logging()
+
+    line = orjson.loads(capsys.readouterr().out.splitlines()[-1])
+    assert line["event"] == "operation_failed"
+    assert line["request_id"] == "req-1"
+    assert line["exception"][0]["exc_type"] == "RuntimeError"
+
+
+def _sampler(**kwargs: Any) -> LogSampler:
+    defaults: dict[str, Any] = {
+        "sample_rates": {"http_request_finished": 0.01},
+        "slow_ms": 500.0,
+        "rand": lambda: 0.5,
+    }
+    return LogSampler(**{**defaults, **kwargs})
+
+
+def _process(sampler: LogSampler, method_name: str, **event_dict: Any) -> dict[str, Any] | None:
+    try:
+        return sampler(None, method_name, event_dict)
+    except structlog.DropEvent:
+        return None
+
+
+@pytest.mark.parametrize(
+    ("method_name", "event_dict"),
+    [
+        ("info", {"status_code": 500, "duration_ms": 1.0}),
+        ("info", {"status_code": 404, "duration_ms": 1.0}),
+        ("info", {"status_code": 200, "duration_ms": 750.0}),
+        ("warning", {"status_code": 200, "duration_ms": 1.0}),
+    ],
+)
+def test_sampler_always_keeps_errors_and_slow_events(
+    method_name: str, event_dict: dict[str, Any]
+) -> None:
+    kept = _process(_sampler(), method_name, event="http_request_finished", **event_dict)
+
+    assert kept is not None
+    assert "sample_rate" not in kept
+
+
+def test_sampler_samples_fast_successful_events() -> None:
+    event = {"event": "http_request_finished", "status_code": 200, "duration_ms": 1.0}
+
+    assert _process(_sampler(rand=lambda: 0.5), "info", **event) is None
+    kept = _process(_sampler(rand=lambda: 0.001), "info", **event)
+    assert kept is not None
+    assert kept["sample_rate"] == 0.01
+
+
+def test_sampler_passes_unconfigured_events() -> None:
+    assert _process(_sampler(), "info", event="startup_succeeded") is not None
+
+
+def test_sampler_rate_limits_repeated_warnings_and_reports_suppressed() -> None:
+    now = [0.0]
+    sampler = _sampler(
+        rate_limited={"transaction_db_error"}, burst=2, interval_s=10.0, clock=lambda: now[0]
+    )
+
+    passed = [_process(sampler, "warning", event="transaction_db_error") for _ in range(5)]
+    now[0] = 10.0
+    next_window = _process(sampler, "warning", event="transaction_db_error")
+
+    assert [entry is not None for entry in passed] == [True, True, False, False, False]
+    assert next_window is not None
+    assert next_window["suppressed"] == 3
+    assert _process(sampler, "error", event="transaction_db_error") is not None
+
+
+def test_sampler_reports_suppressed_events_after_a_burst_goes_silent(
+    mocker: MockerFixture,
+) -> None:
+    now = [0.0]
+    sampler = _sampler(
+        rate_limited={"transaction_db_error"}, burst=2, interval_s=10.0, clock=lambda: now[0]
+    )
+    logger = mocker.patch("pet.config.logging.get_logger").return_value
+
+    for _ in range(5):
+        _process(sampler, "warning", event="transaction_db_error")
+    sampler.report_suppressed()
+    logger.warning.assert_not_called()
+
+    now[0] = 10.0
+    sampler.report_suppressed()
+    sampler.report_suppressed()
+
+    logger.warning.assert_called_once_with(
+        "log_events_suppressed",
+        suppressed_event="transaction_db_error",
+        suppressed_level="warning",
+        suppressed=3,
+        interval_s=10.0,
+    )
+
+
+def test_fast_profile_filters_below_level_and_renders_json(
+    capsys: pytest.CaptureFixture[str],
+    reset_logging: None,
+) -> None:
+    configure_logging(level="INFO", profile="fast")
+    logger = get_logger("test_fast_profile")
+    structlog.contextvars.bind_contextvars(request_id="req-1")
+
+    try:
+        logger.debug("uow_entered")
+        logger.info("transaction_committed", duration_ms=1.5)
+    finally:
+        structlog.contextvars.clear_contextvars()
+
+    lines = [orjson.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 1
+    assert lines[0] | {"timestamp": None} == {
+        "event": "transaction_committed",
+        "duration_ms": 1.5,
+        "request_id": "req-1",
+        "logger": "test_fast_profile",
+        "level": "info",
+        "timestamp": None,
+    }
+
+
+def test_fast_profile_writes_through_log_queue(
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+    reset_logging: None,
+) -> None:
+    emit_line = mocker.spy(QueueLogHandler, "emit_line")
+    configure_logging(level="INFO", profile="fast", queue_enabled=True)
+    logger = get_logger("test_fast_profile")
+
+    logger.info("transaction_committed", duration_ms=1.5)
+    flush_logging()
+
+    assert emit_line.call_count == 1
+
+    lines = [orjson.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["event"] for line in lines] == ["transaction_committed"]
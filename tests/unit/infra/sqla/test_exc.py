@@ -121,6 +121,35 @@ def test_determine_exc_maps_connection_invalidated_dbapi_error() -> None:
     assert result.cause is error
 
 
+@pytest.mark.parametrize(
+    ("error_cls", "sqlstate", "expected_title"),
+    [
+        (DBAPIError, "40001", "db_serialization_failure"),
+        (DBAPIError, "40P01", "db_deadlock"),
+        (OperationalError, "40001", "db_serialization_failure"),
+    ],
+)
+def test_determine_exc_maps_transaction_rollback_sqlstates_to_transient(
+    mocker: MockerFixture,
+    error_cls: type[DBAPIError],
+    sqlstate: str,
+    expected_title: str,
+) -> None:
+    error = error_cls(
+        statement="statement",
+        params={"name": "acme"},
+        orig=mocker.Mock(sqlstate=sqlstate),
+    )
+
+    result = determine_exc(error)
+
+    assert result.kind == PersistenceErrorKind.TRANSIENT
+    assert result.title == expected_title
+    assert result.sqlstate == sqlstate
+    assert result.retryable is True
+    assert result.cause is error
+
+
 def test_determine_exc_maps_unknown_sqla_error(mocker: MockerFixture):
     error = SQLAlchemyError("unknown")
 
@@ -215,6 +244,18 @@ def test_translate_db_error_returns_conflict_for_unique(mocker: MockerFixture):
     assert result.code == "organization_name_taken"
 
 
+def test_translate_db_error_returns_idempotency_conflict_for_live_key() -> None:
+    error = PersistenceError(
+        kind=PersistenceErrorKind.UNIQUE,
+        constraint_name="pk_idempotency_keys",
+    )
+
+    result = translate_db_error(error)
+
+    assert isinstance(result, Conflict)
+    assert result.code == "idempotency_key_in_use"
+
+
 def test_translate_db_error_returns_internall_for_non_unique(mocker: MockerFixture):
     error = PersistenceError(
         kind=PersistenceErrorKind.OPERATIONAL,
@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.util import greenlet_spawn
+
+from pet.infra.sqla.db.pool import InstrumentedAsyncQueuePool, instrument_pool, track_pool_wait
+
+
+def _sample(name: str, labels: dict[str, str] | None = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def _pool(pool_size: int = 1, max_overflow: int = 1) -> InstrumentedAsyncQueuePool:
+    pool = InstrumentedAsyncQueuePool(
+        creator=MagicMock, pool_size=pool_size, max_overflow=max_overflow
+    )
+    instrument_pool(pool, pool_size=pool_size)
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_pool_tracks_checked_out_and_overflow_in_use() -> None:
+    pool = _pool(pool_size=1, max_overflow=1)
+
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+
+    assert _sample("db_pool_checked_out") == 2
+    assert _sample("db_pool_overflow_in_use") == 1
+
+    second.close()
+    first.close()
+
+    assert _sample("db_pool_checked_out") == 0
+    assert _sample("db_pool_overflow_in_use") == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_is_added_to_current_unit_of_work() -> None:
+    pool = _pool()
+    checkouts_before = _sample("db_pool_checkout_wait_seconds_count")
+
+    with track_pool_wait() as pool_wait:
+        connection = await greenlet_spawn(pool.connect)
+        connection.close()
+
+    assert pool_wait.seconds > 0
+    assert _sample("db_pool_checkout_wait_seconds_count") == checkouts_before + 1
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_opened_and_invalidated_connections() -> None:
+    pool = _pool()
+    opened_before = _sample("db_pool_connections_opened_total")
+    hard_before = _sample("db_pool_invalidations_total", {"kind": "hard"})
+    soft_before = _sample("db_pool_invalidations_total", {"kind": "soft"})
+
+    connection = await greenlet_spawn(pool.connect)
+    connection.invalidate(soft=True)
+    connection.invalidate()
+    connection.close()
+
+    assert _sample("db_pool_connections_opened_total") == opened_before + 1
+    assert _sample("db_pool_invalidations_total", {"kind": "soft"}) == soft_before + 1
+    assert _sample("db_pool_invalidations_total", {"kind": "hard"}) == hard_before + 1
@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+
+import pytest
+from prometheus_client import REGISTRY
+
+from pet.infra.metrics import MULTIPROC_DIR_ENV, render_latest
+from pet.infra.sqla.db.query_stats import QUERY_STATS, QueryStats, fingerprint, fingerprint_id
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (
+            "SELECT o.id FROM organizations AS o WHERE o.public_id = $1::UUID",
+            "SELECT o.id FROM organizations AS o WHERE o.public_id = ?",
+        ),
+        (
+            "SELECT id FROM t WHERE name = 'it''s' AND n > 10 -- trailing\n  LIMIT 5",
+            "SELECT id FROM t WHERE name = ? AND n > ? LIMIT ?",
+        ),
+        (
+            "SELECT id FROM t WHERE id IN ($1, $2, $3)",
+            "SELECT id FROM t WHERE id IN (?)",
+        ),
+        (
+            "INSERT INTO t (a) VALUES (%(a_m0)s), (%(a_m1)s), (%(a_m2)s)",
+            "INSERT INTO t (a) VALUES (?)",
+        ),
+        (
+            "SELECT t1.c2 /* hint */ FROM t1 WHERE t1.c = :name",
+            "SELECT t1.c2 FROM t1 WHERE t1.c = ?",
+        ),
+    ],
+)
+def test_fingerprint_normalizes_values(statement: str, expected: str) -> None:
+    assert fingerprint(statement) == expected
+
+
+def test_fingerprint_is_shared_by_calls_differing_only_in_values() -> None:
+    first = fingerprint("SELECT * FROM t WHERE id IN (1, 2) AND name = 'a'")
+    second = fingerprint("SELECT * FROM t WHERE id IN (3, 4, 5, 6) AND name = 'bcd'")
+
+    assert first == second
+    assert fingerprint_id(first) == fingerprint_id(second)
+
+
+def test_query_stats_aggregates_and_ranks_by_total_time() -> None:
+    stats = QueryStats()
+
+    stats.record("a", 0.1)
+    stats.record("b", 0.05)
+    stats.record("b", 0.2)
+    stats.record("c", 0.01)
+
+    top = stats.top(2)
+
+    assert [entry.fingerprint for entry in top] == ["b", "a"]
+    assert top[0].calls == 2
+    assert top[0].total_s == pytest.approx(0.25)
+    assert top[0].max_s == pytest.approx(0.2)
+
+
+def test_query_stats_evicts_least_total_time_at_capacity() -> None:
+    stats = QueryStats(max_fingerprints=2)
+
+    stats.record("slow", 1.0)
+    stats.record("fast", 0.001)
+    stats.record("new", 0.01)
+
+    assert len(stats) == 2
+    assert {entry.fingerprint for entry in stats.top(2)} == {"slow", "new"}
+
+
+def test_top_fingerprints_are_exported() -> None:
+    QUERY_STATS.record("SELECT ? FROM test_top_fingerprints_are_exported", 0.5)
+    labels = {"fingerprint_id": fingerprint_id("SELECT ? FROM test_top_fingerprints_are_exported")}
+
+    try:
+        assert REGISTRY.get_sample_value("db_query_fingerprint_seconds_total", labels) == 0.5
+        assert REGISTRY.get_sample_value("db_query_fingerprint_calls_total", labels) == 1
+    finally:
+        QUERY_STATS.clear()
+
+
+def test_top_fingerprints_are_exported_by_pid_in_multiprocess_mode(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+    statement = "SELECT ? FROM test_top_fingerprints_are_exported_by_pid"
+    QUERY_STATS.record(statement, 0.5)
+
+    try:
+        body = render_latest().decode()
+    finally:
+        QUERY_STATS.clear()
+
+    labels = f'fingerprint_id="{fingerprint_id(statement)}",pid="{os.getpid()}"'
+    assert f"db_query_fingerprint_seconds_total{{{labels}}} 0.5" in body
+    assert f"db_query_fingerprint_calls_total{{{labels}}} 1.0" in body
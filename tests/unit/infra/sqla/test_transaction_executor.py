@@ -1,10 +1,21 @@
+import asyncio
 from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 from pytest_mock import MockerFixture
 
-from pet.app.transaction_executor import TransactionExecutor
+from pet.app.admission import AdmissionController
+from pet.app.drain import DrainController
+from pet.app.errors import (
+    Conflict,
+    ServiceOverloadedError,
+    ServiceShuttingDownError,
+    ServiceUnavailable,
+    UnprocessableEntity,
+)
+from pet.app.transaction_executor import GroupCommitter, RetryPolicy, TransactionExecutor
 from pet.domain.exc import ValidationError
+from pet.infra.sqla.db.exc import PersistenceError, PersistenceErrorKind
 
 
 @pytest.mark.asyncio
@@ -30,6 +41,7 @@ async def test_transaction_executor_passed(
     info_log.assert_called_once()
     assert info_log.call_args.args == ("transaction_committed",)
     assert info_log.call_args.kwargs["use_case_handler"] == handler.__name__
+    assert info_log.call_args.kwargs["pool_wait_ms"] == 0.0
 
 
 @pytest.mark.asyncio
@@ -140,3 +152,350 @@ async def test_transaction_executor_failed_raise_any_exception(
     uow_mock.__aexit__.assert_awaited_once_with(type(exception), exception, ANY)
     exception_log.assert_called_once()
     assert exception_log.call_args.args == ("transaction_failed",)
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_stream_yields_from_read_only_transaction(
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+    executor: TransactionExecutor,
+) -> None:
+    async def handler(uow: object, limit: int):
+        for item in range(limit):
+            yield item
+
+    info_log = mocker.patch("pet.app.transaction_executor.logger.info")
+
+    items = [item async for item in executor.stream(handler, 3)]
+
+    assert items == [0, 1, 2]
+    uow_factory_mock.assert_called_once_with()
+    uow_mock.set_read_only.assert_awaited_once_with()
+    uow_mock.commit.assert_awaited_once()
+    uow_mock.__aexit__.assert_awaited_once_with(None, None, None)
+    assert info_log.call_args.args == ("transaction_streamed",)
+    assert info_log.call_args.kwargs["items_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_stream_translates_db_error_mid_stream(
+    uow_mock: AsyncMock,
+    mocker: MockerFixture,
+    executor: TransactionExecutor,
+) -> None:
+    class FakeDBError(Exception):
+        pass
+
+    class TranslatedError(Exception):
+        pass
+
+    mocker.patch("pet.app.transaction_executor.PersistenceError", FakeDBError)
+    translated_exc = TranslatedError("translated_exc")
+    mocker.patch(
+        "pet.app.transaction_executor.translate_db_error",
+        return_value=translated_exc,
+        autospec=True,
+    )
+    mocker.patch("pet.app.transaction_executor.logger.warning")
+
+    async def handler(uow: object):
+        yield 1
+        raise FakeDBError("db_exc")
+
+    items: list[int] = []
+    with pytest.raises(TranslatedError):
+        async for item in executor.stream(handler):
+            items.append(item)
+
+    assert items == [1]
+    uow_mock.commit.assert_not_awaited()
+    uow_mock.__aexit__.assert_awaited_once_with(TranslatedError, translated_exc, ANY)
+
+
+@pytest.mark.asyncio
+async def test_group_committer_shares_one_transaction_between_concurrent_calls(
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.info")
+    committer = GroupCommitter(uow_factory_mock, window_s=0.01, max_batch_size=100)
+
+    async def handler(uow: object, value: int) -> int:
+        return value * 10
+
+    results = await asyncio.gather(*(committer.submit(handler, n) for n in range(3)))
+
+    assert results == [0, 10, 20]
+    uow_factory_mock.assert_called_once_with()
+    assert uow_mock.savepoint.call_count == 3
+    uow_mock.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_group_committer_isolates_failing_call(
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.info")
+    mocker.patch("pet.app.transaction_executor.logger.warning")
+    committer = GroupCommitter(uow_factory_mock, window_s=0.01)
+
+    async def handler(uow: object, name: str) -> str:
+        if name == "ab":
+            raise ValidationError("Name is too short", cause="name")
+        return name
+
+    results = await asyncio.gather(
+        committer.submit(handler, "Acme"),
+        committer.submit(handler, "ab"),
+        committer.submit(handler, "Globex"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "Acme"
+    assert isinstance(results[1], UnprocessableEntity)
+    assert results[1].detail == "Name is too short"
+    assert results[2] == "Globex"
+    uow_factory_mock.assert_called_once_with()
+    uow_mock.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_group_committer_flushes_full_batch_without_waiting_for_window(
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.info")
+    committer = GroupCommitter(uow_factory_mock, window_s=60, max_batch_size=2)
+
+    async def handler(uow: object, value: int) -> int:
+        return value
+
+    results = await asyncio.wait_for(
+        asyncio.gather(committer.submit(handler, 1), committer.submit(handler, 2)),
+        timeout=1,
+    )
+
+    assert results == [1, 2]
+    uow_mock.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_group_committer_fails_every_successful_call_when_commit_fails(
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.info")
+    mocker.patch("pet.app.transaction_executor.logger.warning")
+    uow_mock.commit.side_effect = PersistenceError(
+        kind=PersistenceErrorKind.OPERATIONAL,
+        title="db_operational",
+        retryable=True,
+    )
+    committer = GroupCommitter(uow_factory_mock, window_s=0.01)
+
+    async def handler(uow: object, value: int) -> int:
+        return value
+
+    results = await asyncio.gather(
+        committer.submit(handler, 1),
+        committer.submit(handler, 2),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ServiceUnavailable) for result in results)
+    assert results[0] is not results[1]
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_run_grouped_without_committer_runs_alone(
+    uow_mock: AsyncMock,
+    mocker: MockerFixture,
+    executor: TransactionExecutor,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.info")
+    handler = mocker.AsyncMock(return_value="ok")
+
+    result = await executor.run_grouped(handler, 1)
+
+    assert result == "ok"
+    handler.assert_awaited_once_with(uow_mock, 1)
+    uow_mock.savepoint.assert_not_called()
+    uow_mock.commit.assert_awaited_once()
+
+
+def _serialization_failure() -> PersistenceError:
+    return PersistenceError(
+        kind=PersistenceErrorKind.TRANSIENT,
+        title="db_serialization_failure",
+        sqlstate="40001",
+        retryable=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_retries_transient_error_in_fresh_uow(
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    info_log = mocker.patch("pet.app.transaction_executor.logger.info")
+    warning_log = mocker.patch("pet.app.transaction_executor.logger.warning")
+    executor = TransactionExecutor(
+        uow_factory=uow_factory_mock,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay_s=0),
+    )
+    handler = mocker.AsyncMock(side_effect=[_serialization_failure(), "ok"])
+
+    result = await executor.run(handler, 1)
+
+    assert result == "ok"
+    assert uow_factory_mock.call_count == 2
+    assert handler.await_count == 2
+    uow_mock.commit.assert_awaited_once()
+    assert warning_log.call_args.args == ("transaction_retrying",)
+    assert warning_log.call_args.kwargs["attempt"] == 1
+    assert warning_log.call_args.kwargs["sqlstate"] == "40001"
+    assert info_log.call_args.kwargs["attempt"] == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_gives_up_after_max_attempts(
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    warning_log = mocker.patch("pet.app.transaction_executor.logger.warning")
+    executor = TransactionExecutor(
+        uow_factory=uow_factory_mock,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay_s=0),
+    )
+    handler = mocker.AsyncMock(side_effect=_serialization_failure())
+
+    with pytest.raises(ServiceUnavailable):
+        await executor.run(handler, 1)
+
+    assert handler.await_count == 3
+    assert warning_log.call_args.args == ("transaction_db_error",)
+    assert warning_log.call_args.kwargs["attempt"] == 3
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_does_not_retry_non_retryable_error(
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.warning")
+    executor = TransactionExecutor(
+        uow_factory=uow_factory_mock,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay_s=0),
+    )
+    handler = mocker.AsyncMock(
+        side_effect=PersistenceError(
+            kind=PersistenceErrorKind.UNIQUE,
+            title="db_integrity",
+            constraint_name="uq_organizations_name_canonical",
+        )
+    )
+
+    with pytest.raises(Conflict):
+        await executor.run(handler, 1)
+
+    handler.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "expected_attempts"),
+    [
+        (_serialization_failure(), 2),
+        (
+            PersistenceError(
+                kind=PersistenceErrorKind.OPERATIONAL,
+                title="db_unavailable",
+                retryable=True,
+            ),
+            1,
+        ),
+    ],
+)
+async def test_transaction_executor_retries_failed_commit_only_after_server_rollback(
+    error: PersistenceError,
+    expected_attempts: int,
+    uow_mock: AsyncMock,
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.transaction_executor.logger.info")
+    mocker.patch("pet.app.transaction_executor.logger.warning")
+    uow_mock.commit.side_effect = error
+    executor = TransactionExecutor(
+        uow_factory=uow_factory_mock,
+        retry_policy=RetryPolicy(max_attempts=2, base_delay_s=0),
+    )
+
+    with pytest.raises(ServiceUnavailable):
+        await executor.run(mocker.AsyncMock(return_value="ok"), 1)
+
+    assert uow_mock.commit.await_count == expected_attempts
+
+
+def test_retry_policy_backs_off_exponentially_up_to_max_delay(mocker: MockerFixture) -> None:
+    mocker.patch("pet.app.transaction_executor.random.uniform", side_effect=lambda _, high: high)
+    policy = RetryPolicy(max_attempts=10, base_delay_s=0.01, max_delay_s=0.05, deadline_s=10)
+
+    delays = [
+        policy.delay_s(_serialization_failure(), attempt=attempt, elapsed_s=0)
+        for attempt in range(1, 5)
+    ]
+
+    assert delays == [0.01, 0.02, 0.04, 0.05]
+
+
+def test_retry_policy_stops_at_deadline(mocker: MockerFixture) -> None:
+    mocker.patch("pet.app.transaction_executor.random.uniform", side_effect=lambda _, high: high)
+    policy = RetryPolicy(max_attempts=10, base_delay_s=0.1, deadline_s=1.0)
+
+    assert policy.delay_s(_serialization_failure(), attempt=1, elapsed_s=0.5) == 0.1
+    assert policy.delay_s(_serialization_failure(), attempt=1, elapsed_s=0.95) is None
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_rejects_without_opening_uow_when_overloaded(
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("pet.app.admission.logger.warning")
+    admission = AdmissionController(max_concurrency=1, max_queue=0, max_wait_s=1)
+    executor = TransactionExecutor(uow_factory=uow_factory_mock, admission=admission)
+    handler = mocker.AsyncMock(return_value="ok")
+
+    async with admission.admit():
+        with pytest.raises(ServiceOverloadedError):
+            await executor.run(handler, 1)
+
+    uow_factory_mock.assert_not_called()
+    handler.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_transaction_executor_rejects_without_opening_uow_when_draining(
+    uow_factory_mock: Mock,
+    mocker: MockerFixture,
+) -> None:
+    drain = DrainController()
+    executor = TransactionExecutor(uow_factory=uow_factory_mock, drain=drain)
+    handler = mocker.AsyncMock(return_value="ok")
+
+    assert await executor.run(handler, 1) == "ok"
+    await drain.drain(deadline_s=0)
+
+    with pytest.raises(ServiceShuttingDownError):
+        await executor.run(handler, 1)
+
+    uow_factory_mock.assert_called_once()
+    handler.assert_awaited_once()
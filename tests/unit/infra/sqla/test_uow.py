@@ -18,7 +18,7 @@ async def test_uow_aenter_failed(mocker: MockerFixture):
     session_factory_mock = mocker.Mock(return_value=session_mock)
     expected_err = OrgsRepoFactoryException(message="orgs_repos_factory_exception")
     orgs_repo_factory_mock = mocker.Mock(side_effect=expected_err)
-    uow = SQLAlchemyUnitOfWork(session_factory_mock, orgs_repo_factory_mock)
+    uow = SQLAlchemyUnitOfWork(session_factory_mock, orgs_repo_factory_mock, mocker.Mock())
 
     with pytest.raises(OrgsRepoFactoryException) as e:
         async with uow:
@@ -37,7 +37,7 @@ async def test_uow_get_session(mocker: MockerFixture):
     session_mock = mocker.AsyncMock()
     session_factory_mock = mocker.Mock(return_value=session_mock)
     orgs_repo_factory_mock = mocker.Mock()
-    uow = SQLAlchemyUnitOfWork(session_factory_mock, orgs_repo_factory_mock)
+    uow = SQLAlchemyUnitOfWork(session_factory_mock, orgs_repo_factory_mock, mocker.Mock())
 
     expected_err = UoWNotInitializedError(field="session")
 
@@ -57,7 +57,7 @@ async def test_uow_get_orgs(mocker: MockerFixture):
     session_mock = mocker.AsyncMock()
     session_factory_mock = mocker.Mock(return_value=session_mock)
     orgs_repo_factory_mock = mocker.Mock()
-    uow = SQLAlchemyUnitOfWork(session_factory_mock, orgs_repo_factory_mock)
+    uow = SQLAlchemyUnitOfWork(session_factory_mock, orgs_repo_factory_mock, mocker.Mock())
 
     expected_err = UoWNotInitializedError(field="orgs")
 
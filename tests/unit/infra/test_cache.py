@@ -0,0 +1,66 @@
+import pytest
+
+from pet.infra.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+
+    cache.set("a", 1)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used_entry() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60, clock=FakeClock())
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_invalidate_removes_entry() -> None:
+    cache: TTLCache[str, bool] = TTLCache(max_size=2, ttl_seconds=60, clock=FakeClock())
+
+    cache.set("a", False)
+    assert cache.get("a") is False
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_drops_value_read_before_an_invalidation() -> None:
+    cache: TTLCache[str, bool] = TTLCache(max_size=2, ttl_seconds=60, clock=FakeClock())
+
+    generation = cache.generation
+    cache.invalidate("a")
+    cache.set("a", True, generation=generation)
+    assert cache.get("a") is None
+
+    cache.set("a", False, generation=cache.generation)
+    assert cache.get("a") is False
+
+
+def test_ttl_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError, match="max_size"):
+        TTLCache(max_size=0, ttl_seconds=1)
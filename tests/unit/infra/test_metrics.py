@@ -0,0 +1,45 @@
+from prometheus_client import REGISTRY
+from sqlalchemy.exc import OperationalError
+
+from pet.infra.metrics import observe_http_request, observe_use_case, render_latest
+from pet.infra.sqla.db.exc import determine_exc
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_observe_http_request_folds_unknown_methods() -> None:
+    labels = {"method": "other", "route": "/metrics-test", "status": "405"}
+    before = _sample("http_request_duration_seconds_count", labels)
+
+    observe_http_request("BREW", "/metrics-test", 405, 0.01)
+
+    assert _sample("http_request_duration_seconds_count", labels) == before + 1
+
+
+def test_observe_use_case_records_duration_by_handler_and_outcome() -> None:
+    labels = {"use_case_handler": "metrics_test_handler", "outcome": "committed"}
+    before = _sample("use_case_duration_seconds_sum", labels)
+
+    observe_use_case("metrics_test_handler", "committed", 0.25)
+
+    assert _sample("use_case_duration_seconds_sum", labels) == before + 0.25
+
+
+def test_determine_exc_counts_persistence_error_kind() -> None:
+    labels = {"kind": "operational"}
+    before = _sample("persistence_errors_total", labels)
+
+    determine_exc(OperationalError(statement="statement", params={}, orig=Exception()))
+
+    assert _sample("persistence_errors_total", labels) == before + 1
+
+
+def test_render_latest_uses_prometheus_text_format() -> None:
+    observe_use_case("metrics_test_handler", "failed", 0.1)
+
+    body = render_latest().decode()
+
+    assert "# TYPE use_case_duration_seconds histogram" in body
+    assert 'use_case_handler="metrics_test_handler"' in body
@@ -0,0 +1,138 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+import uvicorn
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from pet.api.health import health
+from pet.app.drain import DrainController, DrainResult
+from pet.config.settings import Settings
+from pet.serve import DrainingServer, WorkerPoolSize, worker_environ, worker_pool_size
+
+
+class ReadyMonitor:
+    def is_ready(self) -> bool:
+        return True
+
+
+class ObservedDrain(DrainController):
+    def __init__(self) -> None:
+        super().__init__()
+        self.began = asyncio.Event()
+
+    def begin(self) -> None:
+        super().begin()
+        self.began.set()
+
+
+def _app(
+    entered: asyncio.Event,
+    release: asyncio.Event,
+    drained: list[DrainResult],
+) -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        drained.append(await app.state.drain.drain(deadline_s=0))
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(health)
+    app.state.health_monitor = ReadyMonitor()
+    app.state.drain = ObservedDrain()
+
+    @app.get("/slow")
+    async def slow() -> dict[str, bool]:
+        async with app.state.drain.track():
+            entered.set()
+            await release.wait()
+        return {"ok": True}
+
+    return app
+
+
+@pytest.mark.parametrize(
+    ("workers", "connection_budget", "expected"),
+    [
+        # The budget covers the configured pool: nothing changes.
+        (2, 60, WorkerPoolSize(pool_size=10, max_overflow=20)),
+        # The pool is filled first, overflow gets the rest of the share.
+        (4, 60, WorkerPoolSize(pool_size=10, max_overflow=5)),
+        # Shares smaller than pool_size leave no overflow.
+        (8, 60, WorkerPoolSize(pool_size=7, max_overflow=0)),
+        (60, 60, WorkerPoolSize(pool_size=1, max_overflow=0)),
+    ],
+)
+def test_worker_pool_size_splits_budget(
+    workers: int, connection_budget: int, expected: WorkerPoolSize
+) -> None:
+    sizes = worker_pool_size(
+        workers=workers,
+        connection_budget=connection_budget,
+        pool_size=10,
+        max_overflow=20,
+    )
+
+    assert sizes == expected
+    assert workers * sizes.max_connections <= connection_budget
+
+
+def test_worker_pool_size_rejects_budget_below_one_connection_per_worker() -> None:
+    with pytest.raises(ValueError, match="cannot give each of 4 workers"):
+        worker_pool_size(workers=4, connection_budget=3, pool_size=10, max_overflow=20)
+
+
+def test_worker_environ_overrides_engine_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name, value in worker_environ(WorkerPoolSize(pool_size=3, max_overflow=2)).items():
+        monkeypatch.setenv(name, value)
+    settings = Settings(
+        db={
+            "driver": "postgresql+asyncpg",
+            "host": "localhost",
+            "name": "test",
+            "user": "test",
+            "port": 5432,
+            "password": "test",
+        }
+    )
+
+    assert (settings.engine.pool_size, settings.engine.max_overflow) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_draining_server_fails_readiness_before_it_stops_serving() -> None:
+    entered, release = asyncio.Event(), asyncio.Event()
+    drained: list[DrainResult] = []
+    app = _app(entered, release, drained)
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=0,
+        log_config=None,
+        timeout_graceful_shutdown=5,
+    )
+    # Bound up front, so requests wait in the backlog until the server accepts them.
+    sock = config.bind_socket()
+    sock.listen()
+    port = sock.getsockname()[1]
+    server = DrainingServer(config, readiness_delay_s=0.3)
+    serving = asyncio.create_task(server.serve(sockets=[sock]))
+
+    async with asyncio.timeout(5), AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        assert (await client.get("/readyz")).status_code == 200
+        slow = asyncio.create_task(client.get("/slow"))
+        await entered.wait()
+
+        server.should_exit = True
+        await app.state.drain.began.wait()
+        # Still listening during the readiness delay, but no longer ready.
+        assert (await client.get("/readyz")).status_code == 503
+
+        release.set()
+        assert (await slow).status_code == 200
+        await serving
+
+    # The request finished before the lifespan shutdown drained the app.
+    assert [(r.drained, r.aborted) for r in drained] == [(0, 0)]
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import orjson
+from pydantic import SecretStr
+
+from pet.config.settings import DatabaseSettings, Settings
+from pet.main import create_app
+
+# Cold import of pet.main takes ~1.2 s locally, almost all of it FastAPI,
+# SQLAlchemy and pydantic; the budget leaves room for slower CI machines.
+IMPORT_BUDGET_S = 3.0
+# Only needed by tools, migrations or tests, never by the app process.
+OFF_PATH_MODULES = ("alembic", "asyncpg", "httpx", "pet.tools", "testcontainers")
+
+_MEASURE_IMPORT = f"""
+import sys, time
+started_at = time.perf_counter()
+import pet.main
+elapsed_s = time.perf_counter() - started_at
+print(
+    __import__("json").dumps(
+        {{
+            "elapsed_s": elapsed_s,
+            "loaded": [m for m in {OFF_PATH_MODULES!r} if m in sys.modules],
+        }}
+    )
+)
+"""
+
+
+def test_import_of_app_factory_stays_within_budget() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE_IMPORT],
+        capture_output=True,
+        check=True,
+        timeout=60,
+    )
+    measured = orjson.loads(result.stdout)
+
+    assert measured["loaded"] == []
+    assert measured["elapsed_s"] < IMPORT_BUDGET_S
+
+
+def test_create_app_records_startup_phases() -> None:
+    settings = Settings(
+        db=DatabaseSettings(
+            driver="postgresql+asyncpg",
+            host="localhost",
+            name="test",
+            user="test",
+            port=5432,
+            password=SecretStr("test"),
+        ),
+    )
+
+    app = create_app(settings)
+
+    timer = app.state.startup_timer
+    assert list(timer.phases_ms) == [
+        "imports",
+        "get_settings",
+        "configure_logging",
+        "app_state",
+        "routers",
+    ]
+    assert all(duration >= 0 for duration in timer.phases_ms.values())
+    assert timer.total_ms() >= timer.phases_ms["imports"]
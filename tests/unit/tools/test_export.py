@@ -0,0 +1,43 @@
+import io
+import json
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pet.app.usecases.organizations import OrganizationView, export_organizations_query
+from pet.tools.export import export
+
+
+@pytest.mark.asyncio
+async def test_export_writes_one_json_line_per_organization(mocker: MockerFixture) -> None:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    orgs = [
+        OrganizationView(
+            public_id=UUID(int=n),
+            name=f"Org {n}",
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        for n in range(1, 4)
+    ]
+
+    async def stream(handler: object, query: object):
+        for org in orgs:
+            yield org
+
+    executor = mocker.Mock()
+    executor.stream = mocker.Mock(side_effect=stream)
+    out = io.BytesIO()
+
+    stats = await export(executor, out, batch_size=2)
+
+    (handler, query), _ = executor.stream.call_args
+    assert handler is export_organizations_query
+    assert query.batch_size == 2
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["name"] for line in lines] == ["Org 1", "Org 2", "Org 3"]
+    assert lines[0]["public_id"] == str(UUID(int=1))
+    assert stats.rows_written == 3
+    assert stats.bytes_written == len(out.getvalue())
@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pet.tools.load import (
+    LOAD_SPECS,
+    RowRejectedError,
+    detect_format,
+    load,
+    read_rows,
+)
+
+
+def test_organizations_spec_normalizes_name_and_defaults_public_id() -> None:
+    row = LOAD_SPECS["organizations"].parse_row({"name": "  Acme  ", "public_id": ""})
+
+    assert row == (None, "Acme")
+
+
+@pytest.mark.parametrize(
+    ("raw", "reason"),
+    [
+        ({"name": "ab"}, "Name is too short"),
+        ({"public_id": "not-a-uuid", "name": "Acme"}, "invalid uuid"),
+        ({}, "missing required column 'name'"),
+    ],
+)
+def test_organizations_spec_rejects_invalid_rows(raw: dict[str, Any], reason: str) -> None:
+    with pytest.raises(RowRejectedError, match=reason):
+        LOAD_SPECS["organizations"].parse_row(raw)
+
+
+def test_tasks_spec_parses_foreign_public_ids_and_status() -> None:
+    project_id = "11111111-1111-1111-1111-111111111111"
+
+    row = LOAD_SPECS["tasks"].parse_row(
+        {"name": "Ship it", "project_public_id": project_id, "status": "doing"}
+    )
+
+    assert row == (None, "Ship it", UUID(project_id), None, "doing")
+
+
+def test_tasks_spec_rejects_unknown_status() -> None:
+    with pytest.raises(RowRejectedError, match="invalid task status"):
+        LOAD_SPECS["tasks"].parse_row(
+            {
+                "name": "Ship it",
+                "project_public_id": "11111111-1111-1111-1111-111111111111",
+                "status": "blocked",
+            }
+        )
+
+
+def test_staging_sql_uses_spec_columns() -> None:
+    spec = LOAD_SPECS["projects"]
+
+    assert spec.create_staging_sql() == (
+        "CREATE TEMP TABLE _load_projects "
+        "(public_id uuid, name text, org_public_id uuid) ON COMMIT DROP"
+    )
+    assert "FROM _load_projects AS s" in spec.render_merge_sql()
+
+
+def test_read_rows_supports_csv_and_ndjson(tmp_path: Path) -> None:
+    csv_path = tmp_path / "orgs.csv"
+    csv_path.write_text("name,public_id\nAcme,\n", encoding="utf-8")
+    ndjson_path = tmp_path / "orgs.ndjson"
+    ndjson_path.write_text('{"name": "Acme"}\n\n{"name": "Globex"}\n', encoding="utf-8")
+
+    assert list(read_rows(csv_path, detect_format(csv_path))) == [{"name": "Acme", "public_id": ""}]
+    assert list(read_rows(ndjson_path, detect_format(ndjson_path))) == [
+        {"name": "Acme"},
+        {"name": "Globex"},
+    ]
+
+
+def test_detect_format_rejects_unknown_suffix() -> None:
+    with pytest.raises(ValueError, match="--format"):
+        detect_format(Path("orgs.xlsx"))
+
+
+@pytest.mark.asyncio
+async def test_load_copies_valid_rows_and_merges(mocker: MockerFixture) -> None:
+    copied: list[tuple[object, ...]] = []
+
+    async def copy_records_to_table(table: str, *, records: Any, columns: list[str]) -> str:
+        copied.extend(records)
+        return f"COPY {len(copied)}"
+
+    conn = mocker.AsyncMock()
+    conn.transaction = mocker.MagicMock()
+    conn.copy_records_to_table.side_effect = copy_records_to_table
+    conn.execute.side_effect = ["CREATE TABLE", "INSERT 0 1"]
+
+    stats = await load(
+        conn,
+        LOAD_SPECS["organizations"],
+        [{"name": "Acme"}, {"name": "ab"}, {"name": "acme"}],
+    )
+
+    assert copied == [(None, "Acme"), (None, "acme")]
+    assert conn.copy_records_to_table.call_args.args == ("_load_organizations",)
+    assert conn.copy_records_to_table.call_args.kwargs["columns"] == ["public_id", "name"]
+    assert stats.rows_read == 3
+    assert stats.rows_rejected == 1
+    assert stats.rows_inserted == 1
+    assert stats.rows_skipped == 1
+    assert stats.rows_per_second > 0